@@ -0,0 +1,8 @@
+# benchmarks/__init__.py
+
+"""
+Benchmarks
+
+Small scripts that measure the performance of game components.
+Run them from the root directory as modules, e.g.: python -m benchmarks.headless_engine_benchmark
+"""
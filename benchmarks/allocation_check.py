@@ -0,0 +1,166 @@
+# benchmarks/allocation_check.py
+
+"""
+Allocation Check
+
+Checks that drawing the main screen does not create dictionaries, lists, tuples or sets every frame in steady state
+(HUD texts unchanged, player and apple moving), with and without dirty rect rendering.
+
+Every frame of 'GameScreen.update_frame' and 'GameScreen.present' is traced opcode by opcode. Containers created
+by Python code (Container literals, argument unpacking and calls to container constructors like 'list') are counted
+and reported by source line. Also reported per frame, measured with 'tracemalloc':
+- Memory growth (Must stay below MAX_MEMORY_GROWTH over all checked frames: Nothing is kept between frames)
+- Memory allocated and freed within the frame (e.g. the rectangle returned by 'Surface.blit')
+
+Also checks that the player is drawn in the last checked frame (A frame that skips sprites allocates nothing either).
+
+Exits with code 1 if a container is created, memory grows or the player is not drawn.
+
+Usage: python -m benchmarks.allocation_check
+"""
+
+import dis
+import sys
+import tracemalloc
+from collections import Counter
+import pygame
+from game_components.core import Game
+from game_components.ui import DirtyRectRenderer
+
+WARMUP_FRAMES = 120 # Frames drawn before checking (Fills caches)
+CHECKED_FRAMES = 200 # Frames checked
+MAX_MEMORY_GROWTH = 1024 # Allowed memory growth over all checked frames (in bytes) [Reused lists change capacity with the number of dirty rectangles]
+
+# Opcodes that create a container
+CONTAINER_OPCODES = {dis.opmap[name] for name in ("BUILD_TUPLE", "BUILD_LIST", "BUILD_SET", "BUILD_MAP", "BUILD_CONST_KEY_MAP", "CALL_FUNCTION_EX") if name in dis.opmap}
+# Built-in functions that create a container
+CONTAINER_FUNCTIONS = {list, tuple, dict, set, frozenset, sorted}
+
+
+class ContainerCounter():
+    """Counts containers created by Python code while active (See 'start' and 'stop')"""
+
+    def __init__(self):
+        self.locations = Counter() # Containers created: "file:line (operation)" -> count
+
+    def trace_calls(self, frame, event, arg):
+        frame.f_trace_opcodes = True # Trace every opcode of every Python function called
+        return self.trace_opcodes
+
+    def trace_opcodes(self, frame, event, arg):
+        if event == "opcode":
+            opcode = frame.f_code.co_code[frame.f_lasti]
+            if opcode in CONTAINER_OPCODES:
+                self.locations[f"{frame.f_code.co_filename}:{frame.f_lineno} ({dis.opname[opcode]})"] += 1
+        return self.trace_opcodes
+
+    def profile_calls(self, frame, event, arg):
+        if event == "c_call" and arg in CONTAINER_FUNCTIONS:
+            self.locations[f"{frame.f_code.co_filename}:{frame.f_lineno} ({arg.__name__}())"] += 1
+
+    def start(self):
+        sys.settrace(self.trace_calls)
+        sys.setprofile(self.profile_calls)
+
+    def stop(self):
+        sys.settrace(None)
+        sys.setprofile(None)
+
+
+def is_player_drawn(game):
+    """Check that the opaque pixels of the player image are on the screen at the player position
+
+    Returns:
+        True if the player is drawn (bool)
+    """
+    image = game.player.image
+    screen = game.game_screen.screen
+    left, top = game.player.rect.topleft
+    screen_rect = screen.get_rect()
+    opaque_pixels = 0
+    for y in range(0, image.get_height(), 2):
+        for x in range(0, image.get_width(), 2):
+            color = image.get_at((x, y))
+            if color.a < 255 or not screen_rect.collidepoint(left + x, top + y):
+                continue # Blended or off screen
+            if screen.get_at((left + x, top + y))[:3] != color[:3]:
+                return False
+            opaque_pixels += 1
+    return opaque_pixels > 0
+
+
+def check_frames(game, name):
+    """Draw and check main screen frames
+
+    Returns:
+        True if no containers were created, memory did not grow and the player is drawn (bool)
+    """
+    game_screen = game.game_screen
+    offsets = ((7, 0), (0, 5), (-7, 0), (0, -5)) # Player movement per frame
+
+    def draw_frame(frame_num):
+        # Move player and apple (Not checked: Game logic)
+        game.player.rect.move_ip(offsets[frame_num % 4])
+        if frame_num % 30 == 0:
+            game.apple.rect.move_ip(offsets[frame_num // 30 % 4])
+
+    for frame_num in range(WARMUP_FRAMES):
+        draw_frame(frame_num)
+        game_screen.update_frame()
+        game_screen.present()
+
+    # Memory (Measured without opcode tracing: Tracing allocates memory itself)
+    tracemalloc.start()
+    memory_growth = 0
+    transient_memory = 0
+    for frame_num in range(WARMUP_FRAMES, WARMUP_FRAMES + CHECKED_FRAMES):
+        draw_frame(frame_num)
+
+        tracemalloc.reset_peak()
+        start_memory = tracemalloc.get_traced_memory()[0]
+        game_screen.update_frame()
+        game_screen.present()
+        current_memory, peak_memory = tracemalloc.get_traced_memory()
+
+        memory_growth += current_memory - start_memory
+        transient_memory += peak_memory - start_memory
+    tracemalloc.stop()
+
+    # Containers (Same frames again)
+    counter = ContainerCounter()
+    for frame_num in range(WARMUP_FRAMES, WARMUP_FRAMES + CHECKED_FRAMES):
+        draw_frame(frame_num)
+
+        counter.start()
+        game_screen.update_frame()
+        game_screen.present()
+        counter.stop()
+
+    containers = sum(counter.locations.values())
+    player_drawn = is_player_drawn(game)
+    print(f"{name}: {containers / CHECKED_FRAMES:.2f} containers per frame | memory growth {memory_growth / CHECKED_FRAMES:.1f} bytes per frame | "
+          f"allocated and freed within frame {transient_memory / CHECKED_FRAMES:.0f} bytes | player {'drawn' if player_drawn else 'NOT drawn'}")
+    for location, count in counter.locations.most_common():
+        print(f"    {count / CHECKED_FRAMES:6.2f} per frame: {location}")
+    return containers == 0 and memory_growth <= MAX_MEMORY_GROWTH and player_drawn
+
+
+def main():
+    game = Game()
+    game.game_screen.screen_manager("main_screen")
+
+    # Default rendering (Whole window flipped every frame)
+    game.game_screen.dirty_renderer = None
+    passed = check_frames(game, "Main screen")
+
+    # Dirty rect rendering
+    game.game_screen.dirty_renderer = DirtyRectRenderer(game.game_screen.screen)
+    passed = check_frames(game, "Main screen (Dirty rect rendering)") and passed
+
+    pygame.quit()
+    print("Passed" if passed else "Failed: Containers created, memory grew or player not drawn in steady state")
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
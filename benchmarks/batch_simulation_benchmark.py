@@ -0,0 +1,38 @@
+# benchmarks/batch_simulation_benchmark.py
+
+"""
+Batch Simulation Benchmark
+
+Simulates one bot-driven session per game for a number of games in parallel (NumPy batch simulation),
+for a few gold apple spawn chances, and prints run time and score statistics for each.
+
+Sessions are stopped after 'BatchSimulation.MAX_SESSION_TIME' simulated seconds (With high spawn chances, most bots
+collect enough time bonuses to never run out of time). Stopped sessions are counted as unfinished, and included in
+the score statistics with their score when stopped, so the averages are not biased towards short sessions.
+
+Usage: python -m benchmarks.batch_simulation_benchmark [number of games]
+"""
+
+import sys
+import time
+import numpy as np
+from game_components.core.batch_simulation import BatchSimulation
+
+
+def main():
+    num_games = int(sys.argv[1]) if len(sys.argv) > 1 else 1000 # Games per spawn chance (Default: 1000)
+
+    for spawn_chance in (20, 40, 60, 80, 100):
+        start_time = time.perf_counter()
+        simulation = BatchSimulation(num_games=num_games, seed=spawn_chance, gold_apple_spawn_chance=spawn_chance)
+        scores = simulation.run_sessions()
+        run_time = time.perf_counter() - start_time
+
+        unfinished = int((~simulation.sessions_finished).sum())
+        print(f"Spawn chance {spawn_chance:>3}%: {len(scores)} sessions in {run_time:.2f} s ({simulation.ticks_run} ticks) | "
+              f"{unfinished} still running at {BatchSimulation.MAX_SESSION_TIME} s | "
+              f"Score: avg {scores.mean():.1f}, median {np.median(scores):.0f}, min {scores.min()}, max {scores.max()}")
+
+
+if __name__ == "__main__":
+    main()
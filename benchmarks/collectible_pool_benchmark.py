@@ -0,0 +1,74 @@
+# benchmarks/collectible_pool_benchmark.py
+
+"""
+Collectible Pool Benchmark
+
+Spawns and despawns many apples per simulated second (Multi-apple mode), once by creating a new apple
+on every spawn and once with the collectible pool, and prints the time per spawn/despawn and the memory
+growth measured with 'tracemalloc'.
+
+Usage: python -m benchmarks.collectible_pool_benchmark
+"""
+
+import random
+import time
+import tracemalloc
+import pygame
+from game_components.collectibles import Apple, CollectiblePool, CollectibleType
+
+SPAWNS_PER_SECOND = 500 # Apples spawned (and despawned) per simulated second
+SECONDS = 20 # Simulated seconds
+ACTIVE_APPLES = 300 # Apples on screen at the same time
+
+
+def churn(spawn, despawn):
+    """Keep ACTIVE_APPLES apples spawned, and replace SPAWNS_PER_SECOND of them every simulated second
+
+    Returns:
+        Time per spawn/despawn (in seconds), and memory growth (in bytes) (tuple)
+    """
+    rng = random.Random(1)
+    apple_group = pygame.sprite.Group()
+    active_apples = [spawn(apple_group) for apple_num in range(ACTIVE_APPLES)]
+
+    tracemalloc.start()
+    start_memory = tracemalloc.get_traced_memory()[0]
+    start_time = time.perf_counter()
+    for spawn_num in range(SPAWNS_PER_SECOND * SECONDS):
+        index = rng.randrange(ACTIVE_APPLES)
+        despawn(active_apples[index])
+        active_apples[index] = spawn(apple_group)
+    run_time = time.perf_counter() - start_time
+    memory_growth = tracemalloc.get_traced_memory()[0] - start_memory
+    tracemalloc.stop()
+    return run_time / (SPAWNS_PER_SECOND * SECONDS), memory_growth
+
+
+def main():
+    pygame.init()
+
+    # New apple on every spawn
+    def spawn_new(apple_group):
+        apple = Apple()
+        apple.rect.center = (random.randrange(800), random.randrange(600))
+        apple_group.add(apple)
+        return apple
+    spawn_time, memory_growth = churn(spawn_new, lambda apple: apple.kill())
+    print(f"New apple per spawn: {spawn_time * 1e6:6.2f} us per spawn/despawn | memory growth {memory_growth / 1024:8.1f} KiB")
+
+    # Apples reused from pool
+    pool = CollectiblePool()
+    pool.prefill(Apple, ACTIVE_APPLES)
+    def spawn_pooled(apple_group):
+        apple = pool.acquire(Apple)
+        apple.rect.center = (random.randrange(800), random.randrange(600))
+        apple_group.add(apple)
+        return apple
+    spawn_time, memory_growth = churn(spawn_pooled, pool.release)
+    print(f"Collectible pool:    {spawn_time * 1e6:6.2f} us per spawn/despawn | memory growth {memory_growth / 1024:8.1f} KiB | {pool.get_stats()}")
+
+    print(f"Prototypes: {list(CollectibleType.prototypes)} (Images, masks and sounds shared by all apples of a type)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# benchmarks/collision_mask_benchmark.py
+
+"""
+Collision Mask Benchmark
+
+Places an apple at random positions around the player, and prints the cost per collision test for:
+- Rectangle overlap only (Default collision)
+- Precise collision: Rectangle overlap first, then overlap of cached masks (PRECISE_COLLISION)
+- Precise collision with masks rebuilt on every test (What 'pygame.sprite.collide_mask' does for sprites without masks)
+
+Also prints how many rectangle hits are not real hits (Transparent image corners).
+
+Usage: python -m benchmarks.collision_mask_benchmark
+"""
+
+import random
+import time
+import pygame
+from game_components.character import Player
+from game_components.collectibles import Apple
+
+TESTS = 200000 # Collision tests per method
+
+
+def time_tests(collide, player, apple, positions):
+    """Run collision test for every apple position
+
+    Returns:
+        Time per test (in seconds) and number of hits (tuple)
+    """
+    hits = 0
+    start_time = time.perf_counter()
+    for position in positions:
+        apple.rect.topleft = position
+        if collide(player, apple):
+            hits += 1
+    return (time.perf_counter() - start_time) / len(positions), hits
+
+
+def main():
+    pygame.init()
+    rng = random.Random(1)
+    player = Player()
+    apple = Apple()
+
+    # Apple positions around player (Almost all of them overlap the player rectangle)
+    area = player.rect.inflate(apple.rect.width * 2, apple.rect.height * 2)
+    positions = [(rng.randrange(area.left, area.right - apple.rect.width), rng.randrange(area.top, area.bottom - apple.rect.height)) for test_num in range(TESTS)]
+
+    def collide_rect(player, apple):
+        return player.rect.colliderect(apple.rect)
+
+    def collide_cached_mask(player, apple):
+        return player.rect.colliderect(apple.rect) and player.mask.overlap(apple.mask, (apple.rect.x - player.rect.x, apple.rect.y - player.rect.y)) is not None
+
+    def collide_rebuilt_mask(player, apple):
+        player_mask = pygame.mask.from_surface(player.image)
+        apple_mask = pygame.mask.from_surface(apple.image)
+        return player.rect.colliderect(apple.rect) and player_mask.overlap(apple_mask, (apple.rect.x - player.rect.x, apple.rect.y - player.rect.y)) is not None
+
+    rect_time, rect_hits = time_tests(collide_rect, player, apple, positions)
+    cached_time, mask_hits = time_tests(collide_cached_mask, player, apple, positions)
+    rebuilt_time, rebuilt_hits = time_tests(collide_rebuilt_mask, player, apple, positions[:TESTS // 20])
+
+    print(f"Collision tests: {TESTS} (Apple positions around player)")
+    print(f"Rectangle only:                {rect_time * 1e6:6.3f} us per test")
+    print(f"Rectangle + cached masks:      {cached_time * 1e6:6.3f} us per test")
+    print(f"Rectangle + masks rebuilt:     {rebuilt_time * 1e6:6.3f} us per test")
+    print(f"Rectangle hits: {rect_hits} | Mask hits: {mask_hits} | Rectangle hits without pixel overlap: {(rect_hits - mask_hits) / rect_hits * 100:.1f} %")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+# benchmarks/headless_engine_benchmark.py
+
+"""
+Headless Engine Benchmark
+
+Runs the game rules headless (No window, no audio, no sleeping) with the engine bot,
+and prints how many simulation ticks per second one CPU core can run.
+
+Usage: python -m benchmarks.headless_engine_benchmark [simulated minutes]
+"""
+
+import sys
+from config import SIMULATION_TICK_RATE
+from game_components.core import run_headless
+
+
+def main():
+    minutes = float(sys.argv[1]) if len(sys.argv) > 1 else 10 # Simulated minutes (Default: 10)
+    ticks = int(SIMULATION_TICK_RATE * 60 * minutes)
+
+    result = run_headless(ticks=ticks)
+
+    print(f"Ticks:            {result['ticks']} ({minutes} simulated minutes at {SIMULATION_TICK_RATE} Hz)")
+    print(f"Run time:         {result['run_time']:.2f} s")
+    print(f"Ticks per second: {result['ticks_per_second']:.0f}")
+    print(f"Games played:     {result['games']}")
+    if result["games"] > 0:
+        print(f"Average score:    {sum(result['scores']) / result['games']:.1f}")
+
+
+if __name__ == "__main__":
+    main()
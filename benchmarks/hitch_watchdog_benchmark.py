@@ -0,0 +1,105 @@
+# benchmarks/hitch_watchdog_benchmark.py
+
+"""
+Hitch Watchdog Benchmark
+
+Prints the cost of checking a frame within budget (Paid every frame while the hitch watchdog is enabled), and the
+time to write a hitch record with a full frame history. Then forces hitches with a garbage collection in the
+middle of a frame, and checks that the hitch log records the slowest phase, the collection, the context and the
+history, that a run of consecutive hitches is written as one incident, and that the hitch log is rotated.
+Exits with code 1 if a check within budget costs more than MAX_CHECK_TIME, or a record, the incident or the
+rotation is wrong.
+
+Usage: python -m benchmarks.hitch_watchdog_benchmark
+"""
+
+import contextlib
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+from game_components.core import FrameTimer
+from game_components.diagnostics import HitchWatchdog
+
+CHECKS = 200000 # Checks per measurement
+HITCHES = 50 # Forced hitches (Enough to rotate the hitch log when every hitch is its own incident)
+MAX_CHECK_TIME = 2e-6 # Maximum cost of checking a frame within budget (in seconds)
+
+
+def force_hitch(frame_timer):
+    """Time a frame with a garbage collection during the collision phase"""
+    frame_timer.start_frame()
+    frame_timer.mark(FrameTimer.PHASE_SPRITES)
+    gc.collect()
+    frame_timer.mark(FrameTimer.PHASE_COLLISION)
+    frame_timer.end_frame()
+
+
+def main():
+    hitch_path = os.path.join(tempfile.mkdtemp(), "hitches.jsonl")
+    frame_timer = FrameTimer()
+    watchdog = HitchWatchdog(path=hitch_path, budget=1.0, incident_gap=0.0, max_bytes=100000, backup_count=2)
+
+    # Fill the frame history
+    for frame_num in range(frame_timer.history):
+        frame_timer.start_frame()
+        frame_timer.mark(FrameTimer.PHASE_LOGIC)
+        frame_timer.end_frame()
+
+    # Frames within budget
+    start_time = time.perf_counter()
+    for check_num in range(CHECKS):
+        watchdog.start_frame()
+        watchdog.check_frame(frame_timer)
+    check_time = (time.perf_counter() - start_time) / CHECKS
+    print(f"Check within budget: {check_time * 1e9:.0f} ns per frame")
+
+    # Consecutive hitches: One incident with one full record, and a summary when a frame is within budget again
+    incident_records = []
+    for hitch_num in range(HITCHES):
+        watchdog.budget = 0.0
+        watchdog.start_frame()
+        force_hitch(frame_timer)
+        incident_records.append(watchdog.check_frame(frame_timer))
+    watchdog.budget = 1.0
+    force_hitch(frame_timer)
+    watchdog.check_frame(frame_timer)
+    with open(hitch_path) as file:
+        incident_lines = [json.loads(line) for line in file.read().splitlines()]
+    os.remove(hitch_path)
+    incident_valid = incident_records[0] is not None and incident_records[1:] == [None] * (HITCHES - 1)
+    incident_valid = incident_valid and [line["type"] for line in incident_lines] == ["hitch", "incident_end"] and incident_lines[1]["hitches"] == HITCHES
+    print(f"Consecutive hitches: {HITCHES} hitches -> {len(incident_lines)} records ({'Valid' if incident_valid else 'Invalid'} incident)")
+
+    # Separate incidents: Garbage collection during the collision phase
+    watchdog.budget = 0.0
+    records = []
+    write_time = 0.0
+    for hitch_num in range(HITCHES):
+        watchdog.start_frame()
+        force_hitch(frame_timer)
+        start_time = time.perf_counter()
+        records.append(watchdog.check_frame(frame_timer, get_context=lambda: {"screen": "benchmark"}))
+        write_time += time.perf_counter() - start_time
+        with contextlib.redirect_stdout(None): # Summary line of every incident is not printed
+            watchdog.end_incident()
+    watchdog.close()
+    print(f"Hitch record: {write_time / HITCHES * 1000:.2f} ms per incident ({frame_timer.history} frames of history)")
+
+    # Every record names the slow phase and the collection, and the hitch log is rotated
+    with open(hitch_path) as file:
+        last_record = json.loads(file.read().splitlines()[-2]) # Last line is the incident summary
+    records_valid = all(record["slowest_phase"] == "Collision" and record["gc"] and record["context"]["screen"] == "benchmark" for record in records)
+    records_valid = records_valid and len(last_record["history"]["frames_ms"]) == frame_timer.history
+    rotated = os.path.exists(f"{hitch_path}.1") and os.path.exists(f"{hitch_path}.2") and not os.path.exists(f"{hitch_path}.3")
+    print(f"Hitch log: {'Valid' if records_valid else 'Invalid'} records | {'Rotated' if rotated else 'Not rotated'}")
+
+    passed = check_time < MAX_CHECK_TIME and incident_valid and records_valid and rotated
+    print("Passed" if passed else "Failed")
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
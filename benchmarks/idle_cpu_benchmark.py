@@ -0,0 +1,75 @@
+# benchmarks/idle_cpu_benchmark.py
+
+"""
+Idle CPU Benchmark
+
+Runs the game loop on the start screen without input for IDLE_SECONDS, with IDLE_RENDERING disabled (Menu drawn
+every frame) and enabled (Menu waits for input), and prints CPU time used compared to time passed, and frames drawn.
+Then checks that the idle menu still reacts to a key press in the next frame. Exits with code 1 if idle rendering
+does not use less than MAX_IDLE_CPU of one core, or the key press is not handled.
+
+Usage: python -m benchmarks.idle_cpu_benchmark
+"""
+
+import sys
+import time
+import pygame
+import game_components.core.game_logic as game_logic
+from game_components.core import Game
+
+IDLE_SECONDS = 5 # Time the start screen is left idle per run (in seconds)
+MAX_IDLE_CPU = 0.05 # Maximum share of one core used by an idle menu with idle rendering
+
+
+def run_idle(game, seconds):
+    """Run game loop without input
+
+    Parameters:
+        game (Game):        Game on start screen
+        seconds (float):    Time to run (in seconds)
+    Returns:
+        Share of one core used, frames drawn (tuple)
+    """
+    frames = 0
+    present = game.game_screen.present
+    def counted_present():
+        nonlocal frames
+        frames += 1
+        present()
+    game.game_screen.present = counted_present
+
+    start_time = time.perf_counter()
+    start_cpu_time = time.process_time()
+    while time.perf_counter() - start_time < seconds:
+        game.update()
+    cpu_share = (time.process_time() - start_cpu_time) / (time.perf_counter() - start_time)
+    game.game_screen.present = present
+    return cpu_share, frames
+
+
+def main():
+    game = Game(seed=1)
+    game.update() # Draw start screen
+
+    results = {}
+    for idle_rendering in (False, True):
+        game_logic.IDLE_RENDERING = idle_rendering
+        results[idle_rendering] = run_idle(game, IDLE_SECONDS)
+        cpu_share, frames = results[idle_rendering]
+        print(f"Idle rendering {'on ' if idle_rendering else 'off'}: CPU {cpu_share:6.1%} of one core | {frames / IDLE_SECONDS:5.1f} frames per second")
+
+    # Idle menu must react to the next key press
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_DOWN, mod=0, unicode="", scancode=0))
+    start_time = time.perf_counter()
+    game.update()
+    reaction_time = time.perf_counter() - start_time
+    reacted = game.game_screen.selected_btn == 1
+    print(f"Key press on idle menu: {'Handled' if reacted else 'Not handled'} in {reaction_time * 1000:.1f} ms")
+
+    passed = results[True][0] < MAX_IDLE_CPU and reacted
+    print("Passed" if passed else "Failed")
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# benchmarks/perf_hud_benchmark.py
+
+"""
+Performance HUD Benchmark
+
+Prints what the performance HUD costs, so it can be left on during playtests:
+- Drawing the HUD (Frames with and without text updates)
+- Engine steps with and without a frame timer marking engine phases (Headless)
+
+Exits with code 1 if the HUD takes more than MAX_HUD_SHARE of the frame time budget (1 / FRAME_RATE).
+
+Usage: python -m benchmarks.perf_hud_benchmark
+"""
+
+import sys
+import time
+import pygame
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, FRAME_RATE, SIMULATION_TICK_RATE, PERF_HUD_TEXT_INTERVAL
+from game_components.core import GameEngine, FrameTimer
+from game_components.ui import PerfHUD
+
+FRAMES = 3000 # HUD frames drawn
+TICKS = 100000 # Engine steps per measurement
+MAX_HUD_SHARE = 0.05 # Maximum share of the frame time budget used by the HUD
+
+
+def time_hud(perf_hud, screen, frame_timer):
+    """Draw HUD FRAMES times (Frame timer gets a new frame before every draw, like in the game loop)
+
+    Returns:
+        Time per frame (in seconds)
+    """
+    start_time = time.perf_counter()
+    for frame_num in range(FRAMES):
+        frame_timer.start_frame()
+        perf_hud.draw(screen)
+        frame_timer.end_frame()
+    return (time.perf_counter() - start_time) / FRAMES
+
+
+def time_steps(engine):
+    """Step engine with the engine bot TICKS times (Restarts when a game ends)
+
+    Returns:
+        Time per step (in seconds)
+    """
+    dt = 1 / SIMULATION_TICK_RATE
+    engine.reset(1)
+    start_time = time.perf_counter()
+    for tick in range(TICKS):
+        if GameEngine.EVENT_GAME_OVER in engine.step(dt, engine.get_bot_input()):
+            engine.reset(1)
+    return (time.perf_counter() - start_time) / TICKS
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    frame_timer = FrameTimer()
+    perf_hud = PerfHUD(frame_timer, SCREEN_WIDTH)
+
+    # HUD drawing (Ring buffer filled first, so the graph is drawn with every frame)
+    time_hud(perf_hud, screen, frame_timer)
+    hud_time = time_hud(perf_hud, screen, frame_timer)
+    frame_budget = 1 / FRAME_RATE
+    print(f"HUD draw: {hud_time * 1e6:.1f} us per frame (Texts every {PERF_HUD_TEXT_INTERVAL} frames) | "
+          f"{hud_time / frame_budget:.2%} of the {frame_budget * 1000:.1f} ms frame budget")
+
+    # Engine steps with and without phase marks
+    engine = GameEngine(seed=1)
+    untimed_step = time_steps(engine)
+    engine.frame_timer = frame_timer
+    frame_timer.start_frame()
+    timed_step = time_steps(engine)
+    print(f"Engine step: {untimed_step * 1e6:.2f} us without frame timer | {timed_step * 1e6:.2f} us with frame timer "
+          f"({(timed_step - untimed_step) * 1e6:+.2f} us)")
+
+    passed = hud_time / frame_budget < MAX_HUD_SHARE
+    print("Passed" if passed else "Failed: HUD is too slow")
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
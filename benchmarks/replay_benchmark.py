@@ -0,0 +1,98 @@
+# benchmarks/replay_benchmark.py
+
+"""
+Replay Benchmark
+
+Replays recorded sessions (See RECORD_SESSIONS in configuration) headless as fast as the CPU allows, checks every
+game against its recorded state hashes, and prints how many simulation ticks per second one CPU core can replay.
+Exits with code 1 if a replayed game differs from its recording (e.g. after a change to the game rules).
+
+Without session files, a session of bot games is recorded first and then replayed. The engine bot never loses,
+so it pauses at random (Like a distracted player), and games still running after BOT_MAX_GAME_TICKS are recorded as quit.
+
+Usage: python -m benchmarks.replay_benchmark [session files]
+"""
+
+import os
+import random
+import sys
+import tempfile
+from config import SIMULATION_TICK_RATE
+from game_components.core import GameEngine, SessionRNG
+from game_components.replay import SessionFile, SessionRecorder, ReplayMismatchError, replay_session
+
+BOT_GAMES = 50 # Bot games recorded when no session files are given
+BOT_MAX_GAME_TICKS = SIMULATION_TICK_RATE * 120 # Bot games are quit after 2 simulated minutes
+BOT_PAUSE_CHANCE = 0.01 # Chance per tick that the bot pauses
+BOT_PAUSE_TICKS = (30, 150) # Minimum and maximum length of a bot pause (in ticks)
+
+
+def record_bot_session(path, games=BOT_GAMES):
+    """Record a session of bot games
+
+    Parameters:
+        path (str):     Session file path
+        games (int):    Number of games to record
+    Returns:
+        None
+    """
+    engine = GameEngine()
+    recorder = SessionRecorder(path, SessionRNG.BACKEND)
+    dt = 1 / SIMULATION_TICK_RATE
+    bot_rng = random.Random() # Bot pauses (Not part of the game: Only the recorded input matters)
+
+    for game_num in range(games):
+        seed = random.getrandbits(64)
+        engine.reset(seed)
+        recorder.start_game(seed)
+        pause_ticks = 0
+        completed = False
+
+        for tick in range(BOT_MAX_GAME_TICKS):
+            if pause_ticks == 0 and bot_rng.random() < BOT_PAUSE_CHANCE:
+                pause_ticks = bot_rng.randint(*BOT_PAUSE_TICKS)
+            if pause_ticks > 0:
+                pause_ticks -= 1
+                input_bits = 0
+            else:
+                input_bits = engine.get_bot_input()
+
+            events = engine.step(dt, input_bits)
+            recorder.record_tick(input_bits, engine)
+            if GameEngine.EVENT_GAME_OVER in events:
+                completed = True
+                break
+        recorder.end_game(engine.highscore_num, completed)
+
+
+def main():
+    paths = sys.argv[1:]
+    if not paths:
+        paths = [os.path.join(tempfile.mkdtemp(), "bot_session.adrs")]
+        record_bot_session(paths[0])
+        print(f"Recorded {BOT_GAMES} bot games")
+
+    passed = True
+    for path in paths:
+        session = SessionFile.load(path)
+        ticks = sum(game.tick_count for game in session.games)
+        print(f"{path}: {len(session.games)} games | {ticks} ticks | {os.path.getsize(path)} bytes ({os.path.getsize(path) * 8 / max(ticks, 1):.2f} bits per tick)")
+
+        try:
+            result = replay_session(session)
+        except ReplayMismatchError as error:
+            print(f"    Failed: {error}")
+            passed = False
+            continue
+
+        print(f"    Run time:         {result['run_time']:.2f} s")
+        print(f"    Ticks per second: {result['ticks_per_second']:.0f}")
+        if result["games"] > 0:
+            print(f"    Average score:    {sum(result['scores']) / result['games']:.1f}")
+
+    print("Passed" if passed else "Failed: Replayed games differ from recordings")
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# benchmarks/sampling_profiler_benchmark.py
+
+"""
+Sampling Profiler Benchmark
+
+Runs the headless engine without and with the sampling profiler (At PROFILE_SAMPLE_RATE and 5x that rate), and
+prints the ticks per second of both runs (Overhead of the profiler) and the time per sample. Checks that the
+profile contains samples in 'GameEngine.step', labeled with the run label, and that the folded stacks file is
+written. Exits with code 1 if not, or if the overhead at PROFILE_SAMPLE_RATE is above MAX_OVERHEAD.
+
+Speeds are the fastest of RUNS runs (Other load on the machine only slows runs down, so a single slow run does not
+fail the overhead check).
+
+Usage: python -m benchmarks.sampling_profiler_benchmark
+"""
+
+import os
+import sys
+import tempfile
+from config import SIMULATION_TICK_RATE, PROFILE_SAMPLE_RATE
+from game_components.core import run_headless
+from game_components.diagnostics import SamplingProfiler
+
+HEADLESS_TICKS = SIMULATION_TICK_RATE * 60 * 30 # Engine ticks per measurement (30 simulated minutes, split into RUNS runs)
+RUNS = 5 # Runs per measurement (Fastest run is used)
+MAX_OVERHEAD = 0.05 # Maximum slowdown of the profiled thread at PROFILE_SAMPLE_RATE
+
+
+def measure_speed():
+    """Run the headless engine RUNS times
+
+    Returns:
+        Ticks per second of the fastest run (float)
+    """
+    return max(run_headless(ticks=HEADLESS_TICKS // RUNS)["ticks_per_second"] for run_num in range(RUNS))
+
+
+def main():
+    run_headless(ticks=HEADLESS_TICKS // 10) # Warm up
+    base_speed = measure_speed()
+    print(f"Without profiler: {base_speed:.0f} ticks/s")
+
+    passed = True
+    for sample_rate in (PROFILE_SAMPLE_RATE, PROFILE_SAMPLE_RATE * 5):
+        profile_path = os.path.join(tempfile.mkdtemp(), "profile.folded")
+        profiler = SamplingProfiler(sample_rate, get_label=lambda: "headless")
+        profiler.start(profile_path)
+        speed = measure_speed()
+        profiler.stop()
+
+        overhead = 1 - speed / base_speed
+        with open(profile_path) as file:
+            lines = file.read().splitlines()
+        step_samples = sum(int(line.rsplit(" ", 1)[1]) for line in lines if line.startswith("headless;") and "step (game_engine.py" in line)
+        print(f"{sample_rate:>5} samples/s: {speed:.0f} ticks/s (Overhead {overhead:+.1%}) | {profiler.sample_count} samples, "
+              f"{step_samples} in GameEngine.step | {len(lines)} folded stacks")
+        passed = passed and step_samples > 0
+        if sample_rate == PROFILE_SAMPLE_RATE:
+            passed = passed and overhead < MAX_OVERHEAD
+
+    print("Passed" if passed else "Failed")
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# benchmarks/session_rng_benchmark.py
+
+"""
+Session RNG Benchmark
+
+Prints the cost per random number of a session RNG stream (Pre-generated in blocks of RNG_BLOCK_SIZE)
+compared to Python's random module, for spawn rolls ('random') and spawn positions ('randrange'),
+and the cost per respawn of many apples (High-entity mode).
+Expect a stream 'random' to be slower than Python's (Python method call against a C call), a stream 'randrange' to be
+a little faster, and respawns to cost the same (The free spawn area computation dominates). Timings vary between runs.
+
+Usage: python -m benchmarks.session_rng_benchmark
+"""
+
+import random
+import time
+import pygame
+from config import RNG_BLOCK_SIZE
+from game_components.core import GameEngine, SessionRNG
+from game_components.collectibles import Apple, SpawnRestrictions
+
+DRAWS = 1000000 # Random numbers drawn per method
+RESPAWNS = 20000 # Apple respawns per generator
+
+
+def time_draws(draw, argument=None):
+    """Draw DRAWS random numbers
+
+    Returns:
+        Time per random number (in seconds)
+    """
+    start_time = time.perf_counter()
+    if argument is None:
+        for draw_num in range(DRAWS):
+            draw()
+    else:
+        for draw_num in range(DRAWS):
+            draw(argument)
+    return (time.perf_counter() - start_time) / DRAWS
+
+
+def time_respawns(apples, rng):
+    """Respawn apples RESPAWNS times in total
+
+    Returns:
+        Time per respawn (in seconds)
+    """
+    start_time = time.perf_counter()
+    for respawn_num in range(RESPAWNS):
+        apples[respawn_num % len(apples)].respawn(rng=rng)
+    return (time.perf_counter() - start_time) / RESPAWNS
+
+
+def main():
+    pygame.init()
+    python_rng = random.Random(1)
+    stream = SessionRNG(1).get_stream("spawn")
+
+    print(f"Backend: {SessionRNG.BACKEND} | Block size: {RNG_BLOCK_SIZE}")
+    print(f"random()        Python: {time_draws(python_rng.random) * 1e9:6.1f} ns | Stream: {time_draws(stream.random) * 1e9:6.1f} ns")
+    print(f"randrange(n)    Python: {time_draws(python_rng.randrange, 480000) * 1e9:6.1f} ns | Stream: {time_draws(stream.randrange, 480000) * 1e9:6.1f} ns")
+
+    spawn_restrictions = SpawnRestrictions(GameEngine.measure_hud_boundaries())
+    apples = [Apple() for apple_num in range(100)]
+    for apple in apples:
+        apple.set_spawn_restrictions(spawn_restrictions)
+    print(f"Apple respawn   Python: {time_respawns(apples, python_rng) * 1e6:6.2f} us | Stream: {time_respawns(apples, stream) * 1e6:6.2f} us")
+
+
+if __name__ == "__main__":
+    main()
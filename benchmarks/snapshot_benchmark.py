@@ -0,0 +1,80 @@
+# benchmarks/snapshot_benchmark.py
+
+"""
+Snapshot Benchmark
+
+Prints the snapshot size and the cost of a snapshot/restore round trip for the game engine (Headless)
+and the whole game (Engine, game screen and session random number streams), and checks that a restored game
+continues exactly like the original: The engine is stepped from a snapshot twice, and the state hashes of every
+tick must match (See 'GameEngine.get_state_hash'). Exits with code 1 if they do not.
+
+Usage: python -m benchmarks.snapshot_benchmark
+"""
+
+import sys
+import time
+from config import SIMULATION_TICK_RATE
+from game_components.core import Game, GameEngine
+
+ROUND_TRIPS = 20000 # Snapshot/restore round trips per measurement
+CHECK_TICKS = SIMULATION_TICK_RATE * 30 # Ticks stepped after restoring (30 simulated seconds)
+
+
+def time_round_trips(state):
+    """Save and restore a game state ROUND_TRIPS times (Snapshot buffer is reused)
+
+    Parameters:
+        state (GameEngine or Game): State to save and restore
+    Returns:
+        Time per round trip (in seconds) and snapshot size (in bytes) (tuple)
+    """
+    buffer = state.snapshot()
+    start_time = time.perf_counter()
+    for round_trip_num in range(ROUND_TRIPS):
+        state.snapshot(buffer)
+        state.restore(buffer)
+    return (time.perf_counter() - start_time) / ROUND_TRIPS, len(buffer)
+
+
+def run_ticks(engine, ticks):
+    """Step engine with the engine bot (Pausing every few seconds, so gold apples and time run out too)
+
+    Returns:
+        Chained state hash of all ticks (int)
+    """
+    dt = 1 / SIMULATION_TICK_RATE
+    state_hash = 0
+    for tick in range(ticks):
+        input_bits = engine.get_bot_input() if tick % 300 < 200 else 0
+        if GameEngine.EVENT_GAME_OVER in engine.step(dt, input_bits):
+            engine.reset()
+        state_hash = engine.get_state_hash(state_hash)
+    return state_hash
+
+
+def main():
+    # Engine: Play a bit first, so gold apple and random number buffers are in use
+    engine = GameEngine(seed=1)
+    run_ticks(engine, SIMULATION_TICK_RATE * 20)
+    engine_time, engine_size = time_round_trips(engine)
+
+    # Restored engine must continue exactly like the original
+    snapshot = engine.snapshot()
+    first_hash = run_ticks(engine, CHECK_TICKS)
+    engine.restore(snapshot)
+    second_hash = run_ticks(engine, CHECK_TICKS)
+    passed = first_hash == second_hash
+
+    # Whole game
+    game = Game(seed=1)
+    game.game_screen.screen_manager("main_screen")
+    game_time, game_size = time_round_trips(game)
+
+    print(f"Engine snapshot: {engine_size} bytes | Round trip: {engine_time * 1e6:.1f} us")
+    print(f"Game snapshot:   {game_size} bytes | Round trip: {game_time * 1e6:.1f} us")
+    print(f"Restored engine continues like original ({CHECK_TICKS} ticks): {'Passed' if passed else 'Failed'}")
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
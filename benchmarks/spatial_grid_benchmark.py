@@ -0,0 +1,141 @@
+# benchmarks/spatial_grid_benchmark.py
+
+"""
+Spatial Grid Benchmark
+
+Scales the number of collectibles from 10 to 100k, and compares collision queries with the spatial grid
+against the linear scan of 'pygame.sprite.spritecollide'.
+The arena grows with the number of collectibles (Same collectible density as a crowded screen),
+like an arena mode would.
+
+Measured per entity count:
+- Player vs. collectibles: Time per query (Spatial grid vs. spritecollide)
+- Respawn: Time to move a collectible to a new random position in the grid
+- Collectible vs. collectibles: Time to find all overlapping pairs (Naive pair check only up to MAX_NAIVE_PAIRS_COUNT)
+
+Usage: python -m benchmarks.spatial_grid_benchmark
+"""
+
+import math
+import random
+import time
+import pygame
+from config import COLLISION_GRID_CELL_SIZE
+from game_components.core import SpatialGrid
+
+ENTITY_COUNTS = (10, 100, 1000, 10000, 100000) # Number of collectibles to benchmark
+COLLECTIBLE_SIZE = 51 # Collectible width and height (in pixels) [Size of scaled apple image]
+PLAYER_SIZE = 143 # Player width and height (in pixels) [Size of scaled player image]
+AREA_PER_COLLECTIBLE = 100 * 100 # Arena area per collectible (in pixels)
+QUERIES = 2000 # Player queries per entity count
+MAX_NAIVE_PAIRS_COUNT = 2000 # Naive pair check is O(n^2): Skipped above this entity count
+
+
+class Collectible(pygame.sprite.Sprite):
+    """Minimal collectible sprite (Only a rectangle is needed for collisions)"""
+
+    def __init__(self, x_pos, y_pos):
+        super().__init__()
+        self.rect = pygame.Rect(x_pos, y_pos, COLLECTIBLE_SIZE, COLLECTIBLE_SIZE)
+
+
+def time_per_call(function, calls):
+    """Run function a number of times
+
+    Returns:
+        Average time per call (in seconds) (float)
+    """
+    start_time = time.perf_counter()
+    for call in range(calls):
+        function()
+    return (time.perf_counter() - start_time) / calls
+
+
+def benchmark(entity_count, rng):
+    """Benchmark grid and linear scan for one entity count
+
+    Returns:
+        A dictionary with timings (in seconds) (dict)
+    """
+    arena_size = int(math.sqrt(entity_count * AREA_PER_COLLECTIBLE))
+    random_position = lambda size: (rng.randrange(arena_size - size), rng.randrange(arena_size - size))
+
+    collectibles = [Collectible(*random_position(COLLECTIBLE_SIZE)) for collectible_num in range(entity_count)]
+    collectible_group = pygame.sprite.Group(collectibles)
+
+    # Build grid
+    grid = SpatialGrid(COLLISION_GRID_CELL_SIZE)
+    start_time = time.perf_counter()
+    for collectible in collectibles:
+        grid.insert(collectible)
+    insert_time = (time.perf_counter() - start_time) / entity_count
+
+    # Player vs. collectibles (Same player positions for both methods)
+    player = pygame.sprite.Sprite()
+    player.rect = pygame.Rect(0, 0, PLAYER_SIZE, PLAYER_SIZE)
+    player_positions = [random_position(PLAYER_SIZE) for query_num in range(QUERIES)]
+
+    def query_positions(query):
+        hits = 0
+        for position in player_positions:
+            player.rect.topleft = position
+            hits += len(query())
+        return hits
+
+    start_time = time.perf_counter()
+    grid_hits = query_positions(lambda: grid.query(player.rect))
+    grid_query_time = (time.perf_counter() - start_time) / QUERIES
+
+    linear_queries = QUERIES if entity_count <= 10000 else QUERIES // 20 # Linear scan is slow for many collectibles
+    player_positions = player_positions[:linear_queries]
+    start_time = time.perf_counter()
+    linear_hits = query_positions(lambda: pygame.sprite.spritecollide(player, collectible_group, False))
+    linear_query_time = (time.perf_counter() - start_time) / linear_queries
+
+    # Respawn: Move collectibles to new random positions
+    def respawn():
+        collectible = collectibles[rng.randrange(entity_count)]
+        collectible.rect.topleft = random_position(COLLECTIBLE_SIZE)
+        grid.move(collectible)
+    respawn_time = time_per_call(respawn, QUERIES)
+
+    # Collectible vs. collectibles
+    start_time = time.perf_counter()
+    grid_pairs = len(grid.query_pairs())
+    grid_pairs_time = time.perf_counter() - start_time
+
+    naive_pairs_time = None
+    if entity_count <= MAX_NAIVE_PAIRS_COUNT:
+        rects = [collectible.rect for collectible in collectibles]
+        start_time = time.perf_counter()
+        naive_pairs = sum(len(rect.collidelistall(rects[index + 1:])) for index, rect in enumerate(rects))
+        naive_pairs_time = time.perf_counter() - start_time
+        assert naive_pairs == grid_pairs, "Spatial grid found other pairs than naive pair check"
+
+    return {
+        "insert": insert_time,
+        "grid_query": grid_query_time,
+        "linear_query": linear_query_time,
+        "respawn": respawn_time,
+        "grid_pairs": grid_pairs_time,
+        "naive_pairs": naive_pairs_time,
+        "pairs": grid_pairs,
+        "hits_per_query": grid_hits / QUERIES,
+        "linear_hits_per_query": linear_hits / linear_queries,
+    }
+
+
+def main():
+    rng = random.Random(1)
+    print(f"Cell size: {COLLISION_GRID_CELL_SIZE} px | Collectible: {COLLECTIBLE_SIZE} px | Player: {PLAYER_SIZE} px")
+    print(f"{'Entities':>9} | {'insert':>8} | {'grid query':>10} | {'spritecollide':>13} | {'respawn':>8} | {'grid pairs':>10} | {'naive pairs':>11} | pairs")
+    for entity_count in ENTITY_COUNTS:
+        result = benchmark(entity_count, rng)
+        naive_pairs = f"{result['naive_pairs'] * 1e3:8.2f} ms" if result["naive_pairs"] is not None else f"{'-':>11}"
+        print(f"{entity_count:>9} | {result['insert'] * 1e6:5.2f} us | {result['grid_query'] * 1e6:7.2f} us | "
+              f"{result['linear_query'] * 1e6:10.1f} us | {result['respawn'] * 1e6:5.2f} us | "
+              f"{result['grid_pairs'] * 1e3:7.2f} ms | {naive_pairs} | {result['pairs']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# benchmarks/spawn_sampler_benchmark.py
+
+"""
+Spawn Sampler Benchmark
+
+Measures apple respawn latency for player positions all over the screen, and prints the worst case.
+For comparison, the old rejection loop (Random positions until one is valid) is measured on the same positions.
+The old loop is stopped after MAX_LEGACY_TRIES tries, as it can loop forever when the valid area is empty.
+When the HUD texts get wide (e.g. a very high score), the old loop excludes almost every position and does not finish.
+
+Also measures a worst case for the spawn sampler: a very small free area left by large exclusion rectangles.
+
+Usage: python -m benchmarks.spawn_sampler_benchmark
+"""
+
+import random
+import time
+import pygame
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+from game_components.collectibles import Apple, SpawnSampler, SpawnAreaEmptyError, SpawnRestrictions
+from game_components.character import Player
+from game_components.core import GameEngine
+
+MAX_LEGACY_TRIES = 100000 # Maximum tries for the old rejection loop
+RESPAWNS_PER_POSITION = 10 # Respawns measured per player position
+
+
+def legacy_respawn(apple):
+    """Old rejection loop from 'Apple.respawn' (Excludes whole horizontal and vertical bands)
+
+    Returns:
+        Number of tries, or None if no valid position was found within MAX_LEGACY_TRIES (int)
+    """
+    spawn_margin = 4
+    player_spawn_margin = 60
+    restriction_rects = apple.spawn_restrictions.hud_rects
+    half_width = int(apple.image.get_width() / 2)
+    half_height = int(apple.image.get_height() / 2)
+
+    x_min_pos = half_width + spawn_margin
+    x_max_pos = int(SCREEN_WIDTH - apple.image.get_width() / 2) - spawn_margin
+    y_min_pos = half_height + spawn_margin
+    y_max_pos = int(SCREEN_HEIGHT - apple.image.get_height() / 2) - spawn_margin
+
+    ranges = []
+    for name, margin in (("highscore", spawn_margin), ("countdown_timer", spawn_margin), ("player", player_spawn_margin)):
+        rect = apple.spawn_restrictions.player.rect if name == "player" else restriction_rects[name]
+        x_start = int(rect.centerx - rect.width / 2) - half_width - margin
+        x_end = int(rect.centerx + rect.width / 2) + half_width + margin
+        y_start = int(rect.centery - rect.height / 2) - half_height - margin
+        y_end = int(rect.centery + rect.height / 2) + half_height + margin
+        ranges.append((range(x_start, x_end), range(max(y_start, spawn_margin) if name == "highscore" else y_start, y_end)))
+
+    for tries in range(1, MAX_LEGACY_TRIES + 1):
+        x_pos = random.randint(x_min_pos, x_max_pos)
+        y_pos = random.randint(y_min_pos, y_max_pos)
+        if not any(x_pos in x_range or y_pos in y_range for x_range, y_range in ranges):
+            return tries
+    return None
+
+
+def measure(respawn, apple, player, grid_step=50):
+    """Measure respawn latency for player positions on a grid over the screen (Grid step in pixels)
+
+    Returns:
+        A list with latency of every respawn (in seconds), and the number of respawns that did not finish (tuple)
+    """
+    latencies = []
+    unfinished = 0
+    for player_x in range(0, SCREEN_WIDTH + 1, grid_step):
+        for player_y in range(0, SCREEN_HEIGHT + 1, grid_step):
+            player.rect.center = (player_x, player_y)
+            for respawn_num in range(RESPAWNS_PER_POSITION):
+                start_time = time.perf_counter()
+                result = respawn(apple)
+                latencies.append(time.perf_counter() - start_time)
+                if result is None:
+                    unfinished += 1
+    return latencies, unfinished
+
+
+def print_latencies(name, latencies, unfinished):
+    latencies = sorted(latencies)
+    percentile_99 = latencies[int(len(latencies) * 0.99)]
+    print(f"{name:<16} respawns: {len(latencies):>5} | mean {sum(latencies) / len(latencies) * 1e6:8.1f} us | "
+          f"p99 {percentile_99 * 1e6:8.1f} us | worst {latencies[-1] * 1e6:10.1f} us | unfinished: {unfinished}")
+
+
+def main():
+    random.seed(1)
+    apple = Apple()
+    player = Player()
+    apple.set_spawn_restrictions(SpawnRestrictions(GameEngine.measure_hud_boundaries(), player))
+
+    print("Default HUD:")
+    print_latencies("Spawn sampler", *measure(lambda apple: apple.respawn() or True, apple, player))
+    print_latencies("Rejection loop", *measure(legacy_respawn, apple, player))
+
+    # Wide highscore text (e.g. very high score): The old loop excludes almost every x-pos
+    print("Wide highscore text:")
+    highscore_rect = apple.spawn_restrictions.hud_rects["highscore"]
+    apple.spawn_restrictions.set_hud_rect("highscore", highscore_rect.inflate(SCREEN_WIDTH - 60 - highscore_rect.width, 0))
+    print_latencies("Spawn sampler", *measure(lambda apple: apple.respawn() or True, apple, player, grid_step=200))
+    print_latencies("Rejection loop", *measure(legacy_respawn, apple, player, grid_step=200))
+
+    # Worst case for spawn sampler: Many exclusion rectangles leaving a single free position
+    sampler = SpawnSampler(pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
+    exclusion_rects = [pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT // 2), pygame.Rect(0, SCREEN_HEIGHT // 2 + 1, SCREEN_WIDTH, SCREEN_HEIGHT),
+                       pygame.Rect(0, 0, SCREEN_WIDTH // 2, SCREEN_HEIGHT), pygame.Rect(SCREEN_WIDTH // 2 + 1, 0, SCREEN_WIDTH, SCREEN_HEIGHT)]
+    start_time = time.perf_counter()
+    sampler.set_exclusions(exclusion_rects)
+    position = sampler.sample()
+    print(f"Single free position: {position} found in {(time.perf_counter() - start_time) * 1e6:.1f} us")
+
+    # Empty spawn area is reported instead of looping forever
+    sampler.set_exclusions([pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)])
+    try:
+        sampler.sample()
+    except SpawnAreaEmptyError as error:
+        print(f"Empty spawn area: {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# benchmarks/swept_collision_benchmark.py
+
+"""
+Swept Collision Benchmark
+
+Moves the player rectangle in straight lines across an apple placed on its path, for a few move speeds and
+simulation tick rates, and prints how many apples are missed (Jumped over between two ticks) with:
+- Discrete collision: Rectangle overlap at the end position of every tick ('SpatialGrid.query')
+- Swept collision: Rectangle overlap along the whole movement of every tick ('SpatialGrid.query_sweep')
+
+Swept collision must not miss any apple. Also prints the cost per collision check of both methods with
+APPLE_COUNT_BENCHMARK apples in the grid. Exits with code 1 if swept collision misses an apple.
+
+Usage: python -m benchmarks.swept_collision_benchmark
+"""
+
+import math
+import random
+import sys
+import time
+import pygame
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+from game_components.character import Player
+from game_components.collectibles import Apple
+from game_components.core import SpatialGrid
+
+MOVE_SPEEDS = (240, 1200, 4800) # Player move speeds (in pixels per second) [240 = Default speed]
+TICK_RATES = (60, 20, 10) # Simulation tick rates (in ticks per second)
+PASSES = 2000 # Straight passes across an apple per speed and tick rate
+CHECKS = 100000 # Collision checks per method for timing
+APPLE_COUNT_BENCHMARK = 20 # Apples in grid for timing
+
+
+def run_passes(grid, apple, player_rect, speed, tick_rate, rng):
+    """Move player rectangle across an apple PASSES times (Random direction and apple position)
+
+    Returns:
+        Apples missed by discrete collision and by swept collision (tuple)
+    """
+    discrete_misses = 0
+    swept_misses = 0
+    step = speed / tick_rate # Movement per tick (in pixels)
+    start_rect = player_rect.copy()
+    for pass_num in range(PASSES):
+        # Apple somewhere on screen, player path through its center
+        apple.rect.center = (rng.randrange(200, SCREEN_WIDTH - 200), rng.randrange(200, SCREEN_HEIGHT - 200))
+        grid.move(apple)
+        angle = rng.uniform(0, 2 * math.pi)
+        direction_x, direction_y = math.cos(angle), math.sin(angle)
+        start_distance = 600 + rng.uniform(-step, step) # Random tick phase
+        start_x = apple.rect.centerx - direction_x * start_distance
+        start_y = apple.rect.centery - direction_y * start_distance
+
+        discrete_hit = False
+        swept_hit = False
+        player_rect.center = (round(start_x), round(start_y))
+        for tick in range(1, int(1200 / step) + 2):
+            start_rect.topleft = player_rect.topleft
+            player_rect.center = (round(start_x + direction_x * step * tick), round(start_y + direction_y * step * tick))
+            if grid.query(player_rect):
+                discrete_hit = True
+            if grid.query_sweep(start_rect, player_rect.x - start_rect.x, player_rect.y - start_rect.y):
+                swept_hit = True
+        discrete_misses += discrete_hit == False
+        swept_misses += swept_hit == False
+    return discrete_misses, swept_misses
+
+
+def time_checks(check, grid, player_rect, moves):
+    """Run collision check for every player movement
+
+    Returns:
+        Time per check (in seconds)
+    """
+    start_rect = player_rect.copy()
+    start_time = time.perf_counter()
+    for x_pos, y_pos, dx, dy in moves:
+        start_rect.topleft = (x_pos, y_pos)
+        check(grid, start_rect, dx, dy)
+    return (time.perf_counter() - start_time) / len(moves)
+
+
+def main():
+    pygame.init()
+    rng = random.Random(1)
+    player_rect = Player().rect.copy()
+    apple = Apple()
+    grid = SpatialGrid()
+    grid.insert(apple)
+
+    # Missed apples
+    all_passed = True
+    print(f"Player {player_rect.width}x{player_rect.height} | Apple {apple.rect.width}x{apple.rect.height} | {PASSES} passes each")
+    for speed in MOVE_SPEEDS:
+        for tick_rate in TICK_RATES:
+            discrete_misses, swept_misses = run_passes(grid, apple, player_rect, speed, tick_rate, rng)
+            all_passed = all_passed and swept_misses == 0
+            print(f"Speed {speed:>4} px/s at {tick_rate:>2} Hz ({speed / tick_rate:6.1f} px per tick): "
+                  f"Missed apples: Discrete {discrete_misses / PASSES:6.1%} | Swept {swept_misses / PASSES:6.1%}")
+
+    # Cost per check (Apples spread over screen)
+    for apple_num in range(APPLE_COUNT_BENCHMARK - 1):
+        extra_apple = Apple()
+        extra_apple.rect.topleft = (rng.randrange(0, SCREEN_WIDTH - 51), rng.randrange(0, SCREEN_HEIGHT - 51))
+        grid.insert(extra_apple)
+
+    def discrete_check(grid, start_rect, dx, dy):
+        start_rect.move_ip(dx, dy)
+        return grid.query(start_rect)
+
+    def swept_check(grid, start_rect, dx, dy):
+        return grid.query_sweep(start_rect, dx, dy)
+
+    print(f"Cost per collision check ({APPLE_COUNT_BENCHMARK} apples in grid):")
+    for step in (4, 24, 120):
+        moves = []
+        for check_num in range(CHECKS):
+            angle = rng.uniform(0, 2 * math.pi)
+            moves.append((rng.randrange(0, SCREEN_WIDTH - player_rect.width), rng.randrange(0, SCREEN_HEIGHT - player_rect.height),
+                          round(math.cos(angle) * step), round(math.sin(angle) * step)))
+        discrete_time = time_checks(discrete_check, grid, player_rect, moves)
+        swept_time = time_checks(swept_check, grid, player_rect, moves)
+        print(f"Movement {step:>3} px per tick: Discrete {discrete_time * 1e6:.2f} us | Swept {swept_time * 1e6:.2f} us")
+
+    print("Passed" if all_passed else "Failed: Swept collision missed apples")
+    sys.exit(0 if all_passed else 1)
+
+
+if __name__ == "__main__":
+    main()
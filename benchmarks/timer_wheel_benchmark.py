@@ -0,0 +1,70 @@
+# benchmarks/timer_wheel_benchmark.py
+
+"""
+Timer Wheel Benchmark
+
+Schedules many timers with random delays (Up to 10x the wheel size, so most of them wait for several turns of the wheel),
+cancels some of them, and advances the wheel until every timer has fired. Prints the cost per tick and per timer
+for growing numbers of pending timers (Cost per timer should stay flat), and checks that every timer that was not
+cancelled fired exactly once, at its due tick. Exits with code 1 if not.
+
+Usage: python -m benchmarks.timer_wheel_benchmark
+"""
+
+import random
+import sys
+import time
+from config import TIMER_WHEEL_SLOTS
+from game_components.core import TimerWheel
+
+TIMER_COUNTS = (1000, 10000, 100000) # Pending timers per run
+MAX_DELAY = TIMER_WHEEL_SLOTS * 10 # Maximum timer delay (in ticks)
+CANCEL_CHANCE = 0.25 # Chance to cancel a timer after scheduling it
+
+
+def run(timer_count, rng):
+    """Schedule timer_count timers and advance until all have fired
+
+    Parameters:
+        timer_count (int):      Number of timers
+        rng (random.Random):    Random number generator used for delays and cancels
+    Returns:
+        Time per tick (in seconds), time per timer (in seconds), check passed (tuple)
+    """
+    timer_wheel = TimerWheel()
+    fired_ticks = {} # Timer number -> Ticks the timer fired at
+    expected_ticks = {} # Timer number -> Due tick (Timers not cancelled)
+
+    start_time = time.perf_counter()
+    for timer_num in range(timer_count):
+        delay = rng.randint(1, MAX_DELAY)
+        timer = timer_wheel.schedule(delay, lambda timer_num=timer_num: fired_ticks.setdefault(timer_num, []).append(timer_wheel.tick))
+        if rng.random() < CANCEL_CHANCE:
+            timer_wheel.cancel(timer)
+        else:
+            expected_ticks[timer_num] = delay
+
+    ticks = 0
+    while timer_wheel.pending_count > 0:
+        timer_wheel.advance()
+        ticks += 1
+    run_time = time.perf_counter() - start_time
+
+    passed = len(fired_ticks) == len(expected_ticks) and all(fired_ticks.get(timer_num) == [due_tick] for timer_num, due_tick in expected_ticks.items())
+    return run_time / ticks, run_time / timer_count, passed
+
+
+def main():
+    rng = random.Random(1)
+    all_passed = True
+    print(f"Timer wheel: {TIMER_WHEEL_SLOTS} slots | Delays: 1 - {MAX_DELAY} ticks | {CANCEL_CHANCE:.0%} cancelled")
+    for timer_count in TIMER_COUNTS:
+        tick_time, timer_time, passed = run(timer_count, rng)
+        all_passed = all_passed and passed
+        print(f"{timer_count:>7} timers | Per tick: {tick_time * 1e6:7.2f} us | Per timer (Schedule, cancel or fire): {timer_time * 1e6:.2f} us | "
+              f"{'Passed' if passed else 'Failed'}")
+    sys.exit(0 if all_passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# benchmarks/tracer_benchmark.py
+
+"""
+Tracer Benchmark
+
+Prints the cost of tracer calls (Span, begin/end and counter) with tracing off and on, and the headless engine speed
+with tracing off and on (Apple respawns are traced). Then writes the trace and checks that it is valid Chrome Trace
+Event JSON with matching begin and end events, also when the event buffer fills up inside open spans.
+Exits with code 1 if a call with tracing off costs more than MAX_OFF_CALL_TIME, or a trace is not valid.
+
+Usage: python -m benchmarks.tracer_benchmark
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from config import SIMULATION_TICK_RATE
+from game_components.core import run_headless
+from game_components.diagnostics import Tracer, tracer as shared_tracer
+
+CALLS = 200000 # Calls per measurement
+HEADLESS_TICKS = SIMULATION_TICK_RATE * 60 * 3 # Engine ticks per run (3 simulated minutes)
+MAX_OFF_CALL_TIME = 1e-6 # Maximum cost of a tracer call with tracing off (in seconds)
+
+
+def time_calls(tracer):
+    """Time span, begin/end and counter calls
+
+    Returns:
+        Time per span, per begin/end pair and per counter call (in seconds) (tuple)
+    """
+    start_time = time.perf_counter()
+    for call_num in range(CALLS):
+        with tracer.span("span"):
+            pass
+    span_time = (time.perf_counter() - start_time) / CALLS
+
+    start_time = time.perf_counter()
+    for call_num in range(CALLS):
+        tracer.begin("begin")
+        tracer.end()
+    begin_end_time = (time.perf_counter() - start_time) / CALLS
+
+    start_time = time.perf_counter()
+    for call_num in range(CALLS):
+        tracer.counter("counter", call_num)
+    counter_time = (time.perf_counter() - start_time) / CALLS
+    return span_time, begin_end_time, counter_time
+
+
+def main():
+    # Tracer calls (Separate tracer: Off and on)
+    tracer = Tracer()
+    off_times = time_calls(tracer)
+    trace_path = os.path.join(tempfile.mkdtemp(), "trace.json")
+    tracer.start(trace_path)
+    on_times = time_calls(tracer)
+    for call_name, off_time, on_time in zip(("Span", "Begin/end", "Counter"), off_times, on_times):
+        print(f"{call_name:<10} Off: {off_time * 1e9:6.0f} ns | On: {on_time * 1e9:6.0f} ns")
+
+    # Trace file must be valid, with a matching end for every begin
+    event_count = len(tracer.events)
+    tracer.stop()
+    with open(trace_path) as file:
+        trace = json.load(file)
+    phases = [event["ph"] for event in trace["traceEvents"]]
+    trace_valid = len(phases) == event_count + 1 and phases.count("B") == phases.count("E") # Events and thread name
+    print(f"Trace file: {os.path.getsize(trace_path) / 1e6:.1f} MB | {event_count} events | {'Valid' if trace_valid else 'Invalid'}")
+
+    # Full buffer: Spans open when the buffer fills up are still ended, spans begun after it are dropped completely
+    full_tracer = Tracer(max_events=7) # Fills up inside the spans of the second frame
+    full_tracer.start(os.path.join(tempfile.mkdtemp(), "full_trace.json"))
+    for frame_num in range(5):
+        full_tracer.begin("Game.update")
+        full_tracer.begin("Events")
+        full_tracer.counter("counter", frame_num)
+        full_tracer.end()
+        full_tracer.end()
+    full_phases = [event[0] for event in full_tracer.events]
+    full_valid = full_phases.count("B") == full_phases.count("E") and full_tracer.dropped_events > 0
+    full_tracer.stop()
+    print(f"Full buffer: {len(full_phases)} events, {full_tracer.dropped_events} dropped | {'Valid' if full_valid else 'Invalid'}")
+
+    # Headless engine (Shared tracer: Apple respawns are traced)
+    off_result = run_headless(ticks=HEADLESS_TICKS)
+    shared_tracer.start(os.path.join(tempfile.mkdtemp(), "engine_trace.json"))
+    on_result = run_headless(ticks=HEADLESS_TICKS)
+    traced_events = len(shared_tracer.events)
+    shared_tracer.stop()
+    print(f"Headless engine: Off {off_result['ticks_per_second']:.0f} ticks/s | On {on_result['ticks_per_second']:.0f} ticks/s ({traced_events} events)")
+
+    passed = max(off_times) < MAX_OFF_CALL_TIME and trace_valid and full_valid
+    print("Passed" if passed else "Failed")
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
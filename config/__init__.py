@@ -1,7 +1,7 @@
 # config/__init__.py
 
 # Game setup configuration
-from .configuration import SCREEN_WIDTH, SCREEN_HEIGHT, FRAME_RATE, GAME_TITLE
+from .configuration import SCREEN_WIDTH, SCREEN_HEIGHT, FRAME_RATE, GAME_TITLE, SIMULATION_TICK_RATE, MAX_FRAME_TIME
 
 # Image paths + font path
 from .configuration import GAME_ICON_IMAGE_PATH, FONT_PATH, PLAYER_IMAGE_PATH, APPLE_IMAGE_PATH, GOLD_APPLE_IMAGE_PATH, BG_IMAGE_FOLDER_PATH, ARROW_KEYS_IMAGE_PATH, ENTER_KEY_IMAGE_PATH, SPACE_KEY_IMAGE_PATH
@@ -12,7 +12,40 @@ from .configuration import MENU_SELECTION_SOUND_PATH, GOLD_APPLE_SPAWN_SOUND_PAT
 from .configuration import PLAYER_MOVE_SPEED_X, PLAYER_MOVE_SPEED_Y
 
 # Gameplay behavior variables
-from .configuration import COUNTDOWN_DEFAULT_START_TIMER_VALUE, APPLE_TIME_BONUS, GOLD_APPLE_TIME_BONUS, GOLD_APPLE_SPAWN_CHANCE, GOLD_APPLE_CHECK_INTERVAL
+from .configuration import COUNTDOWN_DEFAULT_START_TIMER_VALUE, APPLE_COUNT, APPLE_TIME_BONUS, GOLD_APPLE_TIME_BONUS, GOLD_APPLE_SPAWN_CHANCE, GOLD_APPLE_CHECK_INTERVAL
+
+# Input settings
+from .configuration import KEY_REPEAT_DELAY, KEY_REPEAT_INTERVAL, INPUT_LATENCY_STATS
+
+# Collision settings
+from .configuration import COLLISION_GRID_CELL_SIZE, PRECISE_COLLISION, SWEPT_COLLISION
+
+# Random number settings
+from .configuration import RNG_BLOCK_SIZE
+
+# Timer settings
+from .configuration import TIMER_WHEEL_SLOTS
+
+# Session recording settings
+from .configuration import RECORD_SESSIONS, SESSION_RECORDING_FOLDER_PATH, REPLAY_CHECKPOINT_INTERVAL, REPLAY_KEYFRAME_INTERVAL
+
+# Text rendering settings
+from .configuration import TEXT_CACHE_MAX_SURFACES
+
+# Rendering settings
+from .configuration import DIRTY_RECT_RENDERING, RENDER_STATS, IDLE_RENDERING, IDLE_WAIT_TIMEOUT, UNFOCUSED_WAIT_TIMEOUT
+
+# Performance HUD settings
+from .configuration import PERF_HUD_VISIBLE, PERF_HUD_HISTORY, PERF_HUD_TEXT_INTERVAL
+
+# Tracing settings
+from .configuration import TRACE_FOLDER_PATH, TRACE_MAX_EVENTS
+
+# Profiling settings
+from .configuration import PROFILE_FOLDER_PATH, PROFILE_SAMPLE_RATE
+
+# Hitch watchdog settings
+from .configuration import HITCH_WATCHDOG, HITCH_BUDGET_FACTOR, HITCH_INCIDENT_GAP, HITCH_LOG_PATH, HITCH_LOG_MAX_BYTES, HITCH_LOG_BACKUP_COUNT
 
 # Custom debug function
 from .debug import debug
\ No newline at end of file
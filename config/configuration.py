@@ -11,12 +11,16 @@ player settings, font paths, and image paths for game elements like the player,
 # ---- Game setup configuration ---- #
 SCREEN_WIDTH = 800  # Screen width (in pixels)
 SCREEN_HEIGHT = 600 # Screen height (in pixels)
-FRAME_RATE = 60 # Game frame rate (in frames per second)
+FRAME_RATE = 60 # Game frame rate (in frames per second) [Render rate: Can be lowered on weak machines without changing gameplay]
+SIMULATION_TICK_RATE = 60 # Game logic update rate (in ticks per second) [Independent of frame rate]
+MAX_FRAME_TIME = 0.25 # Maximum time simulated per frame (in seconds) [Prevents a long frame from causing a burst of catch-up ticks]
 GAME_TITLE = "AppleDroid v0.6" # Game title
 
 # ---- Gameplay behavior variables ---- #
 COUNTDOWN_DEFAULT_START_TIMER_VALUE = 10 # Default start value for countdown timer (in seconds)
 
+APPLE_COUNT = 1 # Number of regular apples on the main screen [More than 1 = Multi-apple mode]
+
 APPLE_TIME_BONUS = 1 # Time bonus for collecting apple (in seconds)
 GOLD_APPLE_TIME_BONUS = 2 # Time bonus for collecting gold apple (in seconds)
 
@@ -24,8 +28,61 @@ GOLD_APPLE_SPAWN_CHANCE = 60 # Gold apple spawn chance (in percent)
 GOLD_APPLE_CHECK_INTERVAL = 2.5 # Gold apple spawn check interval (in seconds)
 
 # ---- Player settings ---- #
-PLAYER_MOVE_SPEED_X = 4 # Player movement speed x-axis (in pixels)
-PLAYER_MOVE_SPEED_Y = 4 # Player movement speed y-axis (in pixels)
+PLAYER_MOVE_SPEED_X = 240 # Player movement speed x-axis (in pixels per second)
+PLAYER_MOVE_SPEED_Y = 240 # Player movement speed y-axis (in pixels per second)
+
+# ---- Input settings ---- #
+KEY_REPEAT_DELAY = 300 # Time a key is held before it repeats in menus (in milliseconds) [0 = No key repeat]
+KEY_REPEAT_INTERVAL = 100 # Time between repeated key presses of a held key (in milliseconds)
+INPUT_LATENCY_STATS = False # Print input-to-photon latency of menu inputs per screen when the game is closed
+
+# ---- Collision settings ---- #
+COLLISION_GRID_CELL_SIZE = 64 # Cell size of the spatial grid used to find collisions with collectibles (in pixels) [Best around the size of the largest collectible]
+PRECISE_COLLISION = False # Pixel-accurate collision with masks (Transparent image corners do not count as hits) [Only checked when rectangles overlap]
+SWEPT_COLLISION = True # Check collisions over the whole player movement of each tick (Swept AABB: Fast player cannot jump over apples at high speeds or low tick rates)
+
+# ---- Random number settings ---- #
+RNG_BLOCK_SIZE = 256 # Random numbers pre-generated at once per random number stream (With NumPy: One call per block)
+
+# ---- Timer settings ---- #
+TIMER_WHEEL_SLOTS = 512 # Slots of the game-time timer wheel (Timers due within this many ticks are only visited when they fire)
+
+# ---- Session recording settings ---- #
+RECORD_SESSIONS = False # Record player input of every game to a session file (Replay with 'benchmarks/replay_benchmark.py')
+SESSION_RECORDING_FOLDER_PATH = "recordings/" # Folder for recorded session files
+REPLAY_CHECKPOINT_INTERVAL = 60 # Ticks between stored state hash checkpoints in recorded games (1 = Store state hash of every tick)
+REPLAY_KEYFRAME_INTERVAL = 300 # Ticks between game state keyframes in the session scrubber (Seeking simulates at most this many ticks)
+
+# ---- Text rendering settings ---- #
+TEXT_CACHE_MAX_SURFACES = 256 # Maximum number of rendered text surfaces kept in the text cache (Least recently used are removed first)
+
+# ---- Rendering settings ---- #
+DIRTY_RECT_RENDERING = False # Only redraw and push changed areas of the main screen, instead of flipping the whole window
+RENDER_STATS = False # Show pixels pushed per frame compared to full flips (Requires DIRTY_RECT_RENDERING)
+IDLE_RENDERING = True # Menus wait for input instead of redrawing every frame, and the game pauses while the window is unfocused or minimized
+IDLE_WAIT_TIMEOUT = 1000 # Maximum time an idle menu waits for input before checking again (in milliseconds)
+UNFOCUSED_WAIT_TIMEOUT = 500 # Maximum time an unfocused or minimized window waits for events before checking again (in milliseconds)
+
+# ---- Performance HUD settings ---- #
+PERF_HUD_VISIBLE = False # Show performance HUD when the game starts (Toggle with F3): FPS, frame times and time per frame phase
+PERF_HUD_HISTORY = 240 # Frames kept in the frame timing ring buffer (Averages and frame time graph)
+PERF_HUD_TEXT_INTERVAL = 15 # Frames between performance HUD text updates (Graph is updated every frame)
+
+# ---- Tracing settings ---- #
+TRACE_FOLDER_PATH = "traces/" # Folder for trace files written with '--trace' (Chrome Trace Event JSON: Open in https://ui.perfetto.dev)
+TRACE_MAX_EVENTS = 2000000 # Maximum number of trace events buffered in memory (About 20 minutes of play: Later events are dropped)
+
+# ---- Profiling settings ---- #
+PROFILE_FOLDER_PATH = "profiles/" # Folder for profiles written with '--profile' (Folded stacks: Open with a flamegraph tool)
+PROFILE_SAMPLE_RATE = 200 # Stack samples per second taken by the sampling profiler
+
+# ---- Hitch watchdog settings ---- #
+HITCH_WATCHDOG = True # Write a diagnostic record when frames start going over the hitch budget (Frame phases are timed every frame)
+HITCH_BUDGET_FACTOR = 2 # Hitch budget: Frames longer than this many times 1 / FRAME_RATE are hitches
+HITCH_INCIDENT_GAP = 1.0 # Time without hitches that ends a hitch incident (in seconds): Only the first hitch of an incident gets a full record
+HITCH_LOG_PATH = "diagnostics/hitches.jsonl" # Hitch log (One full JSON record per incident: Slowest phase, GC collections, screen, entity counts and frame history)
+HITCH_LOG_MAX_BYTES = 5000000 # Hitch log size that causes a rotation (in bytes)
+HITCH_LOG_BACKUP_COUNT = 3 # Number of rotated hitch logs kept (hitches.jsonl.1, .2, ...)
 
 # ---- Font paths ---- #
 FONT_PATH = "assets/font/boba_cups.ttf" # Default font
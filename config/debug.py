@@ -6,16 +6,19 @@ Debug Class
 This class draws some text on screen, that can be used for debugging purposes
 
 Note: Text is positioned from top left corner, not center-based
+Note: Text is rendered through the shared text cache, so debug text that does not change is not re-rendered
 """
 
 import pygame
 
 # Draw debug text
 def debug(text="", font_size=30, color="White", x_pos=10, y_pos=10, enable_bg=False, bg_color="Black"):
+    # Imported here to avoid a circular import (game_components imports config)
+    from game_components.ui.text_cache import text_cache
+
     screen = pygame.display.get_surface() # Get current display surface
 
-    font = pygame.font.SysFont("Arial", font_size) # Create font
-    display_text = font.render(str(text), True, color) # Create text
+    display_text = text_cache.render(str(text), font_size, color, "Arial", system_font=True) # Get text from text cache
     display_text_rect = display_text.get_rect(topleft=(x_pos, y_pos)) # Position text
 
     # Check if background is enabled
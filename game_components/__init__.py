@@ -1,7 +1,10 @@
 # game_components/__init__.py
 
 # Core imports
-from .core import Game
+from .core import Game, GameEngine
+
+# Asset imports
+from .assets import AssetManager
 
 # UI imports
 from .ui import GameScreen
@@ -10,4 +13,7 @@ from .ui import GameScreen
 from .character import Player
 
 # Collectible imports
-from .collectibles import Apple, GoldApple
\ No newline at end of file
+from .collectibles import Apple, GoldApple
+
+# Diagnostics imports
+from .diagnostics import Tracer, SamplingProfiler, HitchWatchdog
\ No newline at end of file
@@ -0,0 +1,3 @@
+# game_components/assets/__init__.py
+
+from .asset_manager import AssetManager, assets
@@ -0,0 +1,214 @@
+# game_components/assets/asset_manager.py
+
+"""
+Asset Manager Class
+
+This class loads all game assets (images and sounds) and keeps them in memory, so each asset is only
+loaded from disk, converted and scaled once. Assets are keyed by the paths in 'config/configuration.py'.
+Load time and memory usage is recorded for every asset (See 'get_report').
+
+Scaled and transparent variants of an image are cached separately, but share the same loaded file.
+Collision masks are built once per image variant (See 'get_mask').
+
+Note: Surfaces are shared between everything that uses them, so they must never be drawn on or modified.
+      If a modified version is needed, request it as a variant (e.g. 'alpha') instead
+Loading, scaling and mask building are traced as spans with the asset path (See 'tracer').
+
+Note: Without a display, images are not converted. Without an initialized mixer, sounds are replaced
+      by silent sounds, so game components can be created headless (e.g. by the game engine)
+"""
+
+import pygame
+import time
+from game_components.diagnostics.tracer import tracer
+
+
+class SilentSound():
+    """Sound placeholder used when the mixer is not initialized (Has the sound methods used by the game)"""
+
+    def play(self, *args, **kwargs):
+        pass
+
+    def stop(self):
+        pass
+
+    def set_volume(self, value):
+        pass
+
+
+class AssetManager():
+
+    def __init__(self):
+        """Initialize Asset Manager"""
+        self.files = {} # Loaded image files: path -> pygame.Surface (Unscaled)
+        self.images = {} # Image variants: (path, scale, size, alpha) -> pygame.Surface
+        self.masks = {} # Collision masks: (path, scale, size, alpha) -> pygame.mask.Mask
+        self.sounds = {} # Sounds: path -> pygame.mixer.Sound
+        self.asset_info = {} # Asset report: key -> dictionary with asset type, path, load time and memory
+
+    def get_image(self, path, scale=None, size=None, alpha=None):
+        """Get image from cache: Image is only loaded, converted and scaled the first time it is requested
+
+        Parameters:
+            path (str):         Image path
+            scale (float):      Scale factor (Applied with rotozoom) (Default: None = No scaling)
+            size (tuple):       Size (width, height) to scale image to (Default: None = No scaling)
+            alpha (int):        Surface alpha value (0-255) (Default: None = Opaque)
+        Returns:
+            Image surface (pygame.Surface) [Shared: Do not modify]
+        """
+        key = (path, scale, size, alpha)
+        image = self.images.get(key)
+        if image is not None:
+            return image
+
+        start_time = time.perf_counter() # Used to measure load time
+        with tracer.span("AssetManager.get_image", {"path": path}):
+            image = self.load_file(path)
+
+            # Apply scaling
+            if scale is not None:
+                image = pygame.transform.rotozoom(image, 0, scale)
+            if size is not None:
+                image = pygame.transform.scale(image, size)
+
+            # Apply transparency (Copy image, so the shared file is not modified)
+            if alpha is not None:
+                if image is self.files[path]:
+                    image = image.copy()
+                image.set_alpha(alpha)
+
+        self.images[key] = image
+        self.asset_info[key] = {
+            "type": "image",
+            "path": path,
+            "load_time": time.perf_counter() - start_time,
+            "memory": image.get_pitch() * image.get_height(),
+        }
+        return image
+
+    def get_mask(self, path, scale=None, size=None, alpha=None):
+        """Get collision mask of an image variant from cache: Mask is only built the first time it is requested
+
+        Parameters:
+            Same as 'get_image'
+        Returns:
+            Collision mask of image (pygame.mask.Mask) [Shared: Do not modify]
+        """
+        key = (path, scale, size, alpha)
+        mask = self.masks.get(key)
+        if mask is not None:
+            return mask
+
+        image = self.get_image(path, scale, size, alpha)
+        start_time = time.perf_counter() # Used to measure build time
+        with tracer.span("AssetManager.get_mask", {"path": path}):
+            mask = pygame.mask.from_surface(image)
+
+        self.masks[key] = mask
+        self.asset_info[("mask",) + key] = {
+            "type": "mask",
+            "path": path,
+            "load_time": time.perf_counter() - start_time,
+            "memory": (mask.get_size()[0] + 7) // 8 * mask.get_size()[1], # One bit per pixel
+        }
+        return mask
+
+    def load_file(self, path):
+        """Load image file from disk (Only once per path)
+
+        Parameters:
+            path (str): Image path
+        Returns:
+            Unscaled image surface (pygame.Surface)
+        """
+        image = self.files.get(path)
+        if image is None:
+            start_time = time.perf_counter() # Used to measure load time
+            with tracer.span("AssetManager.load_file", {"path": path}):
+                image = pygame.image.load(path)
+
+                # Convert image for faster blitting (Only possible when a display surface exists)
+                if pygame.display.get_surface() is not None:
+                    image = image.convert_alpha()
+
+            self.files[path] = image
+            self.asset_info[path] = {
+                "type": "image_file",
+                "path": path,
+                "load_time": time.perf_counter() - start_time,
+                "memory": image.get_pitch() * image.get_height(),
+            }
+        return image
+
+    def release_files(self):
+        """Release unscaled image files that are not used directly as an image variant
+        Call when all images have been requested (e.g. after startup) to free memory.
+        Requesting a new variant of a released file loads it from disk again
+
+        Returns:
+            None
+        """
+        used_images = set(id(image) for image in self.images.values()) # Surfaces in use as image variants
+
+        for path in list(self.files):
+            if id(self.files[path]) not in used_images:
+                del self.files[path]
+                self.asset_info[path]["memory"] = 0 # Released (Load time is kept in report)
+
+    def get_sound(self, path):
+        """Get sound from cache: Sound is only loaded the first time it is requested
+
+        Parameters:
+            path (str): Sound path
+        Returns:
+            Sound object (pygame.mixer.Sound) [Shared]
+        """
+        sound = self.sounds.get(path)
+        if sound is not None:
+            return sound
+
+        # Mixer is not initialized (Headless): Use silent sound
+        if pygame.mixer.get_init() is None:
+            sound = SilentSound()
+            self.sounds[path] = sound
+            return sound
+
+        start_time = time.perf_counter() # Used to measure load time
+        with tracer.span("AssetManager.get_sound", {"path": path}):
+            sound = pygame.mixer.Sound(path)
+
+        self.sounds[path] = sound
+        self.asset_info[path] = {
+            "type": "sound",
+            "path": path,
+            "load_time": time.perf_counter() - start_time,
+            "memory": len(sound.get_raw()),
+        }
+        return sound
+
+    def get_report(self):
+        """Return load time and memory usage of all loaded assets
+
+        Returns:
+            A list of dictionaries (One per asset) sorted by memory usage, largest first (list)
+        """
+        report = []
+        for key, info in self.asset_info.items():
+            entry = dict(info)
+            entry["key"] = key
+            report.append(entry)
+        report.sort(key=lambda entry: entry["memory"], reverse=True)
+        return report
+
+    def get_total_memory(self):
+        """Return total memory usage of all loaded assets
+
+        Returns:
+            Total memory usage (in bytes) (int)
+        """
+        return sum(info["memory"] for info in self.asset_info.values())
+
+
+# Shared asset manager (Used by screens, player and collectibles)
+assets = AssetManager()
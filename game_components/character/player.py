@@ -5,10 +5,18 @@ Player Class
 
 This class represents the player character in the game, managing the loading of the player's image,
 determining initial positioning, movement based on keyboard input, and respawn functionality when required.
+
+The player position is stored as floats and moved with a fixed time step (See 'move'). When drawing,
+the position is interpolated between the last two time steps (See 'interpolate'), so movement looks smooth
+at any frame rate.
+
+The player state can be written to and read from a byte buffer with a fixed layout (See 'write_snapshot').
 """
 
 import pygame
+import struct
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, PLAYER_IMAGE_PATH, PLAYER_MOVE_SPEED_X, PLAYER_MOVE_SPEED_Y
+from game_components.assets import assets
 
 
 class Player(pygame.sprite.Sprite):
@@ -20,30 +28,66 @@ class Player(pygame.sprite.Sprite):
     DEFAULT_X_POS = SCREEN_WIDTH / 2
     DEFAULT_Y_POS = SCREEN_HEIGHT / 2
 
+    # Input bits (Player input is stored as a bitmask, so it can come from the keyboard or any other source)
+    INPUT_UP = 1
+    INPUT_DOWN = 2
+    INPUT_LEFT = 4
+    INPUT_RIGHT = 8
+
+    # Snapshot layout: Position, previous position and velocity (See 'write_snapshot')
+    SNAPSHOT_STRUCT = struct.Struct("<dddddd")
+
     # Constructor: Initialize the object
     def __init__(self):
         super().__init__() # Call the parent class (Sprite) constructor
-        self.image = pygame.image.load(PLAYER_IMAGE_PATH).convert_alpha() # Load player.png with transparency (Used for pygame performance)
-        self.image = pygame.transform.rotozoom(self.image, 0, self.PLAYER_SCALE_NUM) # Apply scaling to player
+        self.image = assets.get_image(PLAYER_IMAGE_PATH, scale=self.PLAYER_SCALE_NUM) # Get scaled player image (Shared)
+        self.mask = assets.get_mask(PLAYER_IMAGE_PATH, scale=self.PLAYER_SCALE_NUM) # Get collision mask of scaled image (Shared) [Used for precise collision]
         self.rect = self.image.get_rect(center=(self.DEFAULT_X_POS, self.DEFAULT_Y_POS)) # Set initial player position
+        self.position = pygame.math.Vector2(self.rect.center) # Player position (Floats: Used for movement)
+        self.previous_position = pygame.math.Vector2(self.position) # Player position at previous time step (Used for interpolation)
+        self.vx, self.vy = 0, 0 # Player velocity (in pixels per second)
   
     def keyboard_input(self):
-        """Handles keyboard input: Sets player velocity based on keyboard input"""
-        self.vx, self.vy = 0, 0 # Player velocity
+        """Handles keyboard input: Converts pressed arrow keys to input bits
+
+        Returns:
+            Input bitmask (int)
+        """
         keys = pygame.key.get_pressed()  # Get the state of all keyboard buttons
 
-        # UP ARROW
-        if keys[pygame.K_UP] and self.rect.top >= 1:
+        input_bits = 0
+        if keys[pygame.K_UP]: # UP ARROW
+            input_bits |= self.INPUT_UP
+        if keys[pygame.K_DOWN]: # DOWN ARROW
+            input_bits |= self.INPUT_DOWN
+        if keys[pygame.K_LEFT]: # LEFT ARROW
+            input_bits |= self.INPUT_LEFT
+        if keys[pygame.K_RIGHT]: # RIGHT ARROW
+            input_bits |= self.INPUT_RIGHT
+        return input_bits
+
+    def set_velocity(self, input_bits=0):
+        """Sets player velocity based on input bits
+
+        Parameters:
+            input_bits (int): Input bitmask (See INPUT_UP, INPUT_DOWN, INPUT_LEFT, INPUT_RIGHT)
+        Returns:
+            None
+        """
+        self.vx, self.vy = 0, 0 # Player velocity
+
+        # UP
+        if input_bits & self.INPUT_UP and self.rect.top >= 1:
             self.vy = -PLAYER_MOVE_SPEED_Y
-        # DOWN ARROW
-        if keys[pygame.K_DOWN] and self.rect.bottom <= SCREEN_HEIGHT:
+        # DOWN
+        if input_bits & self.INPUT_DOWN and self.rect.bottom <= SCREEN_HEIGHT:
             self.vy = PLAYER_MOVE_SPEED_Y
 
-        # LEFT ARROW
-        if keys[pygame.K_LEFT] and self.rect.left >= -35:
+        # LEFT
+        if input_bits & self.INPUT_LEFT and self.rect.left >= -35:
             self.vx = -PLAYER_MOVE_SPEED_X
-        # RIGHT ARROW
-        if keys[pygame.K_RIGHT] and self.rect.right <= SCREEN_WIDTH + 35:
+        # RIGHT
+        if input_bits & self.INPUT_RIGHT and self.rect.right <= SCREEN_WIDTH + 35:
             self.vx = PLAYER_MOVE_SPEED_X
         
         # Normalize diagonal movement to maintain the same speed in all directions
@@ -51,30 +95,79 @@ class Player(pygame.sprite.Sprite):
             self.vx *= 0.7071 # Reduce player x-velocity by 0.7071 (1/sqrt(2)) or /= 1.4142
             self.vy *= 0.7071 # Reduce player y-velocity by 0.7071 (1/sqrt(2)) or /= 1.4142
         
-    def move(self):
-        """Moves player based on velocity"""
-        self.rect.x += self.vx # Update player x-pos
-        self.rect.y += self.vy # Update player y-pos
+    def move(self, dt=0):
+        """Moves player based on velocity
+
+        Parameters:
+            dt (float): Time step (in seconds)
+        Returns:
+            None
+        """
+        self.previous_position.update(self.position) # Store position before moving (Used for interpolation)
+        self.position.x += self.vx * dt # Update player x-pos
+        self.position.y += self.vy * dt # Update player y-pos
+        self.rect.center = (round(self.position.x), round(self.position.y))
         
-    def update(self):
-        """Call keyboard_input to respond to player action
-        Note: 'update' is a built-in method in pygame's Sprite class. It's called once per frame
+    def update(self, dt=0, input_bits=None):
+        """Respond to player action: Uses given input bits, or keyboard input if no input bits are given
+        Note: 'update' is a built-in method in pygame's Sprite class. It's called once per simulation tick
+
+        Parameters:
+            dt (float):         Time step (in seconds)
+            input_bits (int):   Input bitmask (Default: None = Read keyboard)
+        Returns:
+            None
         """
-        self.keyboard_input() # Keyboard input
-        self.move() # Move player
+        self.rect.center = (round(self.position.x), round(self.position.y)) # Undo interpolation from last drawn frame
+        if input_bits is None:
+            input_bits = self.keyboard_input() # Keyboard input
+        self.set_velocity(input_bits) # Set velocity from input
+        self.move(dt) # Move player
+
+    def interpolate(self, alpha=1):
+        """Move player rect between previous and current position (Used for drawing between time steps)
+
+        Parameters:
+            alpha (float): Interpolation factor (0 = previous position, 1 = current position)
+        Returns:
+            None
+        """
+        x_pos = self.previous_position.x + (self.position.x - self.previous_position.x) * alpha
+        y_pos = self.previous_position.y + (self.position.y - self.previous_position.y) * alpha
+        self.rect.center = (round(x_pos), round(y_pos))
         
     def respawn(self):
         """Handles respawn: Spawns player to default location"""
         # Move player to default x- & y-pos
         self.rect.center = (self.DEFAULT_X_POS, self.DEFAULT_Y_POS)
+        self.position.update(self.rect.center)
+        self.previous_position.update(self.rect.center)
+        self.vx, self.vy = 0, 0 # Stop player (New game must not depend on previous game)
+
+    def write_snapshot(self, buffer, offset=0):
+        """Write player state into a byte buffer (See 'SNAPSHOT_STRUCT')
+
+        Parameters:
+            buffer (bytearray): Buffer to write into
+            offset (int):       Position in buffer (in bytes)
+        Returns:
+            Position after player state (int)
+        """
+        self.SNAPSHOT_STRUCT.pack_into(buffer, offset, self.position.x, self.position.y,
+                                       self.previous_position.x, self.previous_position.y, self.vx, self.vy)
+        return offset + self.SNAPSHOT_STRUCT.size
 
-    # Return player boundaries (Used to restrict apple-spawn)
-    def get_player_boundaries(self):
-        """Return player boundaries: Used to restrict apple-spawn
+    def read_snapshot(self, buffer, offset=0):
+        """Read player state from a byte buffer written by 'write_snapshot'
 
+        Parameters:
+            buffer (bytes):     Buffer to read from
+            offset (int):       Position in buffer (in bytes)
         Returns:
-            values_dict (dict): Dictionary with player boundaries
+            Position after player state (int)
         """
-        # Create dictionary with the player boundaries
-        values_dict = {"x_pos": self.rect.centerx, "y_pos": self.rect.centery, "width": self.rect.width, "height": self.rect.height}
-        return values_dict
\ No newline at end of file
+        x_pos, y_pos, previous_x_pos, previous_y_pos, self.vx, self.vy = self.SNAPSHOT_STRUCT.unpack_from(buffer, offset)
+        self.position.update(x_pos, y_pos)
+        self.previous_position.update(previous_x_pos, previous_y_pos)
+        self.rect.center = (round(x_pos), round(y_pos))
+        return offset + self.SNAPSHOT_STRUCT.size
@@ -1,4 +1,8 @@
 # game_components/collectibles/__init__.py
 
 from .apple import Apple
-from .gold_apple import GoldApple
\ No newline at end of file
+from .gold_apple import GoldApple
+from .spawn_sampler import SpawnSampler, SpawnAreaEmptyError
+from .spawn_restrictions import SpawnRestrictions
+from .collectible_type import CollectibleType
+from .collectible_pool import CollectiblePool
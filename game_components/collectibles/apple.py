@@ -6,130 +6,137 @@ Apple Class
 This class represents the apple collectible in the game, handling the loading of the apple image,
 determining initial positioning, and respawn functionality when collected by the player. 
 The apple can respawn at a default or random location.
+
+Image, mask, sounds and spawn sampler are shared by all apples of the same type (See 'CollectibleType'),
+so creating an apple does not load anything.
+
+The apple position can be written to and read from a byte buffer with a fixed layout (See 'write_snapshot').
 """
 
 import pygame
 import random
+import struct
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, APPLE_IMAGE_PATH, PURPLE_APPLE_COLLISION_SOUND_PATH
+from game_components.collectibles.collectible_type import CollectibleType
+from game_components.diagnostics.tracer import tracer
 
 class Apple(pygame.sprite.Sprite):
 
     # Apple scale factor (Picture is too big, so scale it down)
     APPLE_SCLAE_NUM = 0.1
 
+    # Apple type (Used to get shared prototype)
+    TYPE_NAME = "apple"
+    IMAGE_PATH = APPLE_IMAGE_PATH
+    COLLISION_SOUND_PATH = PURPLE_APPLE_COLLISION_SOUND_PATH
+    SPAWN_SOUND_PATH = None # No spawn sound
+
     # Default x- & y-pos
     DEFAULT_X_POS = 200
     DEFAULT_Y_POS = 200
 
+    # Spawn margins (in pixels)
+    SPAWN_MARGIN = 4 # Minimum spawn distance from screen edge and texts
+    PLAYER_SPAWN_MARGIN = 60 # Minimum spawn distance from player
+
+    # Snapshot layout: Top left position (See 'write_snapshot')
+    SNAPSHOT_STRUCT = struct.Struct("<ii")
+
     def __init__(self):
         super().__init__()
-        self.image = pygame.image.load(APPLE_IMAGE_PATH).convert_alpha()
-        self.image = pygame.transform.rotozoom(self.image, 0, self.APPLE_SCLAE_NUM) # Resize apple image
+        # Get shared prototype of apple type (Created on first apple of this type)
+        self.prototype = CollectibleType.get_prototype(self.TYPE_NAME, self.IMAGE_PATH, self.APPLE_SCLAE_NUM, self.COLLISION_SOUND_PATH, self.SPAWN_SOUND_PATH)
+        self.image = self.prototype.image # Resized apple image (Shared)
+        self.mask = self.prototype.mask # Collision mask (Shared)
         self.rect = self.image.get_rect(center=(self.DEFAULT_X_POS, self.DEFAULT_Y_POS))
-        self.type = "apple" # Set apple type (To differentiate between apples)
-        self.collision_sound = pygame.mixer.Sound(PURPLE_APPLE_COLLISION_SOUND_PATH) # Load collision sound
-        self.spawn_restrictions = {} # Create spawn restrictions dictionary
-
-    def update_spawn_restrictions(self, get_spawn_restrictions={}):
-        """Update spawn restrictions dictionary with cached text information
-        Gets text positions and dimensions within a dictionary, which is used to create
-        boundaries around text, in order to create spawn restrictions for apple.
-        If we do not create spawn restrictions, then apple(s) can spawn on top of texts
-         
+        self.type = self.TYPE_NAME # Set apple type (To differentiate between apples)
+        self.collision_sound = self.prototype.collision_sound # Collision sound (Shared)
+        self.spawn_sound = self.prototype.spawn_sound # Spawn sound (Shared) [None if apple type has no spawn sound]
+        self.spawn_restrictions = None # Spawn restrictions provider (Set with 'set_spawn_restrictions')
+        self.spawn_sampler = self.prototype.spawn_sampler # Used to pick random spawn locations outside spawn restrictions (Shared)
+
+    def set_spawn_restrictions(self, spawn_restrictions):
+        """Set spawn restrictions provider
+        The provider gives areas around texts and player, which is used to create spawn restrictions for apple.
+        If we do not create spawn restrictions, then apple(s) can spawn on top of texts.
+        Restrictions are only requested when apple respawns
+
         Parameters:
-            get_spawn_restrictions (dict): Dictionary with cached text position and size
+            spawn_restrictions (SpawnRestrictions): Spawn restrictions provider (Shared by all apples)
         Returns:
             None
         """
-        self.spawn_restrictions = get_spawn_restrictions
+        self.spawn_restrictions = spawn_restrictions
+
+    def get_exclusion_rects(self):
+        """Get spawn avoidance rectangles around texts and player from spawn restrictions provider
+        Rectangles contain every apple center position where the apple would overlap (or be too close to) a text or the player
+
+        Returns:
+            List of exclusion rectangles (list)
+        """
+        return self.spawn_restrictions.get_exclusion_rects(self.image.get_size(), self.SPAWN_MARGIN, self.PLAYER_SPAWN_MARGIN)
 
     # Respawn apple to new location
-    def respawn(self, default_spawn_location=False):
+    def respawn(self, default_spawn_location=False, rng=random):
         """Respawn apple to random or default location
+        Random locations are picked from the free spawn area (Screen minus area around texts and player) in bounded time
         
         Parameters:
             default_spawn_location (bool): Flag to determine if apple should spawn to default location
+            rng (RNGStream):               Random number generator used to pick location (Default: random module) [Seeded generator = Reproducible locations]
         Returns:
             None
+        Raises:
+            SpawnAreaEmptyError: If texts and player leave no free spawn area
         """
         # If default_spawn_location is True, move apple to default location (Apple never despawns, only changes position)
         if default_spawn_location == True:
             self.rect.center = (self.DEFAULT_X_POS, self.DEFAULT_Y_POS)
         
-        # Else, move apple to random location
+        # Else, move apple to random location (Traced: Cost depends on the free spawn area)
         else:
+            with tracer.span("Apple.respawn"):
+                # Define screen boundaries for spawn (Spawn within screen)
+                x_min_pos = int(self.image.get_width() / 2) + self.SPAWN_MARGIN
+                x_max_pos = int(SCREEN_WIDTH - self.image.get_width() / 2) - self.SPAWN_MARGIN
+
+                y_min_pos = int(self.image.get_height() / 2) + self.SPAWN_MARGIN
+                y_max_pos = int(SCREEN_HEIGHT - self.image.get_height() / 2) - self.SPAWN_MARGIN
 
-            spawn_margin = 4 # Minimum spawn distance from screen edge (in pixels)
-
-            # Define screen boundaries for spawn (Spawn within screen)
-            x_min_pos = int(self.image.get_width() / 2) + spawn_margin
-            x_max_pos = int(SCREEN_WIDTH - self.image.get_width() / 2) - spawn_margin
-
-            y_min_pos = int(self.image.get_height() / 2) + spawn_margin
-            y_max_pos = int(SCREEN_HEIGHT - self.image.get_height() / 2) - spawn_margin
-
-            # Create random spawn coordinates
-            x_pos = random.randint(x_min_pos, x_max_pos)
-            y_pos = random.randint(y_min_pos, y_max_pos)
-
-            # Check if spawn coordinates are within the spawn avoidance coordinates
-            while True: # Loop until valid spawn coordinates are found
-                valid_spawn = False # Spawn validity flag
-
-                player_spawn_margin = 60 # Minimum spawn distance from player (in pixels)
-
-                # Create spawn avoidance coordinates ranges (Creates a rectangle area around texts and player)
-                # Highscore text
-                x_start_highscore = int(self.spawn_restrictions["highscore"]["x_pos"] - self.spawn_restrictions["highscore"]["width"] / 2) - int(self.image.get_width() / 2) - spawn_margin
-                x_end_highscore = int(self.spawn_restrictions["highscore"]["x_pos"] + self.spawn_restrictions["highscore"]["width"] / 2) + int(self.image.get_width() / 2) + spawn_margin
-                y_start_highscore = spawn_margin # Calculated value equals -1, so set to value of spawn_margin instead
-                y_end_highscore = int(self.spawn_restrictions["highscore"]["y_pos"] + self.spawn_restrictions["highscore"]["height"] / 2) + int(self.image.get_height() / 2) + spawn_margin
-
-                # Countdown text
-                x_start_countdown = int(self.spawn_restrictions["countdown_timer"]["x_pos"] - self.spawn_restrictions["countdown_timer"]["width"] / 2) - int(self.image.get_width() / 2) - spawn_margin
-                x_end_countdown = int(self.spawn_restrictions["countdown_timer"]["x_pos"] + self.spawn_restrictions["countdown_timer"]["width"] / 2) + int(self.image.get_width() / 2) + spawn_margin
-                y_start_countdown = int(self.spawn_restrictions["countdown_timer"]["y_pos"] - self.spawn_restrictions["countdown_timer"]["height"] / 2) - int(self.image.get_height() / 2) - spawn_margin
-                y_end_countdown = int(self.spawn_restrictions["countdown_timer"]["y_pos"] + self.spawn_restrictions["countdown_timer"]["height"] / 2) + int(self.image.get_height() / 2) + spawn_margin
-
-                # Player
-                x_start_player = int(self.spawn_restrictions["player"]["x_pos"] - self.spawn_restrictions["player"]["width"] / 2) - int(self.image.get_width() / 2) - player_spawn_margin
-                x_end_player = int(self.spawn_restrictions["player"]["x_pos"] + self.spawn_restrictions["player"]["width"] / 2) + int(self.image.get_width() / 2) + player_spawn_margin
-                y_start_player = int(self.spawn_restrictions["player"]["y_pos"] - self.spawn_restrictions["player"]["height"] / 2) - int(self.image.get_height() / 2) - player_spawn_margin
-                y_end_player = int(self.spawn_restrictions["player"]["y_pos"] + self.spawn_restrictions["player"]["height"] / 2) + int(self.image.get_height() / 2) + player_spawn_margin
-
-                # Check player coordinates ranges: Make sure values does not exceed screen boundaries, as player moves
-                if x_start_player < 0: 
-                    x_start_player = 0 + int(self.image.get_width() / 2) + player_spawn_margin + spawn_margin
-                if x_end_player > SCREEN_WIDTH:
-                    x_end_player = SCREEN_WIDTH - int(self.image.get_width() / 2) - player_spawn_margin - spawn_margin
-                if y_start_player < 0:
-                    y_start_player = 0 + int(self.image.get_height() / 2) + player_spawn_margin + spawn_margin
-                if y_end_player > SCREEN_HEIGHT:
-                    y_end_player = SCREEN_HEIGHT - int(self.image.get_height() / 2) - player_spawn_margin - spawn_margin
-
-                # Check if spawn coordinates are within the spawn avoidance coordinates. If not, create new random spawn coordinates
-                # Check for highscore and countdown text
-                if (x_pos in range(x_start_highscore, x_end_highscore) or y_pos in range(y_start_highscore, y_end_highscore)) or (x_pos in range(x_start_countdown, x_end_countdown) or y_pos in range(y_start_countdown, y_end_countdown)):
-                    x_pos = random.randint(x_min_pos, x_max_pos)
-                    y_pos = random.randint(y_min_pos, y_max_pos)
-                
-                # Check for player
-                elif (x_pos in range(x_start_player, x_end_player) or y_pos in range(y_start_player, y_end_player)):
-                    x_pos = random.randint(x_min_pos, x_max_pos)
-                    y_pos = random.randint(y_min_pos, y_max_pos)
-
-                # Valid spawn coordinates
-                else:
-                    valid_spawn = True # Set spawn validity flag
-                
-                # Check if spawn is valid
-                if valid_spawn == True:
-                    valid_spawn = False # Reset spawn validity flag
-                    break # Exit loop
-
-            # Move apple to new x- & y-pos
-            self.rect.center = (x_pos, y_pos)
+                # Compute free spawn area and pick random spawn coordinates from it
+                self.spawn_sampler.set_spawn_area(pygame.Rect(x_min_pos, y_min_pos, x_max_pos - x_min_pos + 1, y_max_pos - y_min_pos + 1))
+                self.spawn_sampler.set_exclusions(self.get_exclusion_rects())
+                x_pos, y_pos = self.spawn_sampler.sample(rng)
+
+                # Move apple to new x- & y-pos
+                self.rect.center = (x_pos, y_pos)
+
+    def write_snapshot(self, buffer, offset=0):
+        """Write apple position into a byte buffer (See 'SNAPSHOT_STRUCT')
+
+        Parameters:
+            buffer (bytearray): Buffer to write into
+            offset (int):       Position in buffer (in bytes)
+        Returns:
+            Position after apple state (int)
+        """
+        self.SNAPSHOT_STRUCT.pack_into(buffer, offset, self.rect.x, self.rect.y)
+        return offset + self.SNAPSHOT_STRUCT.size
+
+    def read_snapshot(self, buffer, offset=0):
+        """Read apple position from a byte buffer written by 'write_snapshot'
+        Note: Spawned collectibles must be moved in the collision grid afterwards (See 'GameEngine.read_snapshot')
+
+        Parameters:
+            buffer (bytes):     Buffer to read from
+            offset (int):       Position in buffer (in bytes)
+        Returns:
+            Position after apple state (int)
+        """
+        self.rect.topleft = self.SNAPSHOT_STRUCT.unpack_from(buffer, offset)
+        return offset + self.SNAPSHOT_STRUCT.size
 
     # Update function
-    def update(self):
+    def update(self, dt=0):
         pass
\ No newline at end of file
@@ -0,0 +1,76 @@
+# game_components/collectibles/collectible_pool.py
+
+"""
+Collectible Pool Class
+
+This class reuses collectible instances, instead of creating a new collectible every time one spawns.
+Despawned collectibles are released back to the pool (See 'release'), and handed out again on the next
+spawn of the same class (See 'acquire'). Together with shared prototypes (See 'CollectibleType'), spawning
+and despawning many collectibles does not allocate images, sounds or sprites, and memory does not grow.
+
+Counters for created and reused collectibles are kept (See 'get_stats').
+"""
+
+
+class CollectiblePool():
+
+    def __init__(self):
+        """Initialize Collectible Pool"""
+        self.free_collectibles = {} # Released collectibles: collectible class -> list of collectibles
+
+        # Counters
+        self.created = 0 # Collectibles created by the pool
+        self.reused = 0 # Collectibles handed out again
+
+    def acquire(self, collectible_class):
+        """Get a collectible: A released collectible is reused if possible, otherwise a new one is created
+
+        Parameters:
+            collectible_class (class):  Collectible class (e.g. Apple)
+        Returns:
+            Collectible (Not in any sprite group, position is left as it was)
+        """
+        free_collectibles = self.free_collectibles.get(collectible_class)
+        if free_collectibles:
+            self.reused += 1
+            return free_collectibles.pop()
+
+        self.created += 1
+        return collectible_class()
+
+    def release(self, collectible):
+        """Return a despawned collectible to the pool (Removes it from all sprite groups)
+
+        Parameters:
+            collectible (Apple):    Collectible to release
+        Returns:
+            None
+        """
+        collectible.kill() # Remove from all sprite groups
+        self.free_collectibles.setdefault(type(collectible), []).append(collectible)
+
+    def prefill(self, collectible_class, count):
+        """Create collectibles in advance (e.g. at startup), so spawning does not create any later
+
+        Parameters:
+            collectible_class (class):  Collectible class (e.g. Apple)
+            count (int):                Number of free collectibles to have in pool
+        Returns:
+            None
+        """
+        free_collectibles = self.free_collectibles.setdefault(collectible_class, [])
+        while len(free_collectibles) < count:
+            self.created += 1
+            free_collectibles.append(collectible_class())
+
+    def get_stats(self):
+        """Return pool counters
+
+        Returns:
+            A dictionary with created, reused and free collectibles (dict)
+        """
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "free": sum(len(free_collectibles) for free_collectibles in self.free_collectibles.values()),
+        }
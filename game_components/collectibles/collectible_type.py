@@ -0,0 +1,51 @@
+# game_components/collectibles/collectible_type.py
+
+"""
+Collectible Type Class
+
+This class holds the data shared by all collectibles of one type (e.g. all regular apples): image, collision mask,
+sounds and spawn sampler. It is a flyweight: Each type is only created once (See 'get_prototype'), and every
+collectible of that type uses the same prototype, so creating a collectible does not load or convert anything.
+
+Note: Prototype data is shared, so it must never be modified by a single collectible
+"""
+
+from game_components.assets import assets
+from game_components.collectibles.spawn_sampler import SpawnSampler
+
+
+class CollectibleType():
+
+    prototypes = {} # Created prototypes: type name -> CollectibleType (Shared by all collectibles)
+
+    def __init__(self, name, image_path, scale, collision_sound_path, spawn_sound_path=None):
+        """Initialize Collectible Type (Use 'get_prototype' to get a shared prototype)
+
+        Parameters:
+            name (str):                 Type name (e.g. "apple")
+            image_path (str):           Image path
+            scale (float):              Image scale factor
+            collision_sound_path (str): Sound played when player collects the collectible
+            spawn_sound_path (str):     Sound played when collectible spawns (Default: None = No spawn sound)
+        """
+        self.name = name
+        self.image = assets.get_image(image_path, scale=scale) # Scaled image (Shared with asset manager)
+        self.mask = assets.get_mask(image_path, scale=scale) # Collision mask of scaled image (Shared with asset manager)
+        self.collision_sound = assets.get_sound(collision_sound_path) # Collision sound
+        self.spawn_sound = assets.get_sound(spawn_sound_path) if spawn_sound_path is not None else None # Spawn sound
+        self.spawn_sampler = SpawnSampler() # Used to pick random spawn locations (Free area is computed on every respawn)
+
+    @classmethod
+    def get_prototype(cls, name, image_path, scale, collision_sound_path, spawn_sound_path=None):
+        """Get shared prototype of a collectible type: Prototype is only created the first time it is requested
+
+        Parameters:
+            Same as '__init__'
+        Returns:
+            Collectible type prototype (CollectibleType) [Shared]
+        """
+        prototype = cls.prototypes.get(name)
+        if prototype is None:
+            prototype = cls(name, image_path, scale, collision_sound_path, spawn_sound_path)
+            cls.prototypes[name] = prototype
+        return prototype
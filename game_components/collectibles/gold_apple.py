@@ -9,7 +9,6 @@ collected by the player. The gold apple can respawn at a default or random locat
 """
 
 
-import pygame
 from game_components.collectibles.apple import Apple
 from config import GOLD_APPLE_IMAGE_PATH, GOLD_APPLE_COLLISION_SOUND_PATH, GOLD_APPLE_SPAWN_SOUND_PATH
 
@@ -20,15 +19,8 @@ class GoldApple(Apple): # Inherit from Apple class
     DEFAULT_X_POS = 700
     DEFAULT_Y_POS = 500
 
-    def __init__(self):
-        super().__init__()
-        self.image = pygame.image.load(GOLD_APPLE_IMAGE_PATH).convert_alpha()
-        self.image = pygame.transform.rotozoom(self.image, 0, super().APPLE_SCLAE_NUM)
-        self.rect = self.image.get_rect(center=(self.DEFAULT_X_POS, self.DEFAULT_Y_POS))
-        self.type = "gold_apple" # Set apple type
-        self.collision_sound = pygame.mixer.Sound(GOLD_APPLE_COLLISION_SOUND_PATH) # Collision sound
-        self.spawn_sound = pygame.mixer.Sound(GOLD_APPLE_SPAWN_SOUND_PATH) # Spawn sound (Played when apple spawns)
-
-    # Update function
-    def update(self):
-        pass
\ No newline at end of file
+    # Gold apple type (Used to get shared prototype: Apple image and sound are never loaded for gold apples)
+    TYPE_NAME = "gold_apple"
+    IMAGE_PATH = GOLD_APPLE_IMAGE_PATH
+    COLLISION_SOUND_PATH = GOLD_APPLE_COLLISION_SOUND_PATH
+    SPAWN_SOUND_PATH = GOLD_APPLE_SPAWN_SOUND_PATH # Played when gold apple spawns
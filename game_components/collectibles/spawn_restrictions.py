@@ -0,0 +1,85 @@
+# game_components/collectibles/spawn_restrictions.py
+
+"""
+Spawn Restrictions Class
+
+This class provides the areas apples must not spawn in: around the HUD texts (highscore and countdown timer)
+and around the player. Apples ask for the exclusion rectangles when they respawn (See 'get_exclusion_rects'),
+so nothing has to be sent to the apples every frame.
+
+HUD text rectangles are stored in place (See 'set_hud_rect'). Exclusion rectangles around the HUD texts are only
+built when requested, and cached until a HUD text changes size or position. The exclusion rectangle around the
+player is built from the live player rectangle on every request (The player moves every tick).
+"""
+
+import pygame
+
+
+class SpawnRestrictions():
+
+    def __init__(self, hud_rects=None, player=None):
+        """Initialize Spawn Restrictions
+
+        Parameters:
+            hud_rects (dict):       HUD text rectangles: text name -> pygame.Rect (Default: None = No HUD texts) [Copied]
+            player (Player):        Player sprite (Default: None = No player restriction) [Live rectangle is used]
+        """
+        self.hud_rects = {} # HUD text rectangles: text name -> pygame.Rect (Updated in place)
+        self.player = player # Player sprite
+        self.hud_exclusion_cache = {} # Cached exclusion rectangles around HUD texts: (width, height, margin) -> list of rectangles
+
+        if hud_rects is not None:
+            for text_name, hud_rect in hud_rects.items():
+                self.set_hud_rect(text_name, hud_rect)
+
+    def set_hud_rect(self, text_name, rect):
+        """Set position and size of a HUD text (Cached exclusion rectangles are cleared if it changed)
+        Cheap enough to call every frame: The stored rectangle is only compared and updated in place
+
+        Parameters:
+            text_name (str):        HUD text name (e.g. "highscore")
+            rect (pygame.Rect):     Text rectangle
+        Returns:
+            None
+        """
+        hud_rect = self.hud_rects.get(text_name)
+        if hud_rect is None:
+            self.hud_rects[text_name] = pygame.Rect(rect)
+            self.hud_exclusion_cache.clear()
+        elif hud_rect != rect:
+            hud_rect.update(rect)
+            self.hud_exclusion_cache.clear()
+
+    def get_hud_exclusion_rects(self, size, margin):
+        """Get exclusion rectangles around HUD texts (Built on first request, then cached until a HUD text changes)
+        Rectangles contain every center position where an object of the given size would overlap (or be too close to) a text
+
+        Parameters:
+            size (tuple):   Width and height of object to spawn
+            margin (int):   Minimum distance from texts (in pixels)
+        Returns:
+            List of exclusion rectangles (list) [Shared: Do not modify]
+        """
+        key = (size[0], size[1], margin)
+        hud_exclusion_rects = self.hud_exclusion_cache.get(key)
+        if hud_exclusion_rects is None:
+            inflate_x = 2 * (int(size[0] / 2) + margin)
+            inflate_y = 2 * (int(size[1] / 2) + margin)
+            hud_exclusion_rects = [hud_rect.inflate(inflate_x, inflate_y) for hud_rect in self.hud_rects.values()]
+            self.hud_exclusion_cache[key] = hud_exclusion_rects
+        return hud_exclusion_rects
+
+    def get_exclusion_rects(self, size, margin, player_margin):
+        """Get exclusion rectangles around HUD texts and player (Requested when an object respawns)
+
+        Parameters:
+            size (tuple):           Width and height of object to spawn
+            margin (int):           Minimum distance from texts (in pixels)
+            player_margin (int):    Minimum distance from player (in pixels)
+        Returns:
+            List of exclusion rectangles (list)
+        """
+        exclusion_rects = list(self.get_hud_exclusion_rects(size, margin))
+        if self.player is not None:
+            exclusion_rects.append(self.player.rect.inflate(2 * (int(size[0] / 2) + player_margin), 2 * (int(size[1] / 2) + player_margin)))
+        return exclusion_rects
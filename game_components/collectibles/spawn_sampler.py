@@ -0,0 +1,118 @@
+# game_components/collectibles/spawn_sampler.py
+
+"""
+Spawn Sampler Class
+
+This class picks random spawn positions inside an area, while avoiding a number of exclusion rectangles
+(e.g. around HUD texts and the player), in bounded time.
+
+Instead of trying random positions until one is valid, the free area (spawn area minus exclusion rectangles)
+is computed as a list of non-overlapping rectangles. A position is picked from one random number:
+each free rectangle is chosen with a probability proportional to its area, so every free position is equally likely.
+Sampling takes the same time no matter how small the free area is. If there is no free area left,
+'SpawnAreaEmptyError' is raised instead of looping forever.
+
+Note: Rectangles describe positions (e.g. apple centers), not images: Exclusion rectangles must already include
+      the size of the object to spawn and any margins
+"""
+
+import random
+from bisect import bisect_right
+
+
+class SpawnAreaEmptyError(Exception):
+    """Raised when the spawn area is completely covered by exclusion rectangles"""
+
+
+class SpawnSampler():
+
+    def __init__(self, spawn_area=None):
+        """Initialize Spawn Sampler
+
+        Parameters:
+            spawn_area (pygame.Rect):   Area of valid positions (Default: None = Set with 'set_spawn_area')
+        """
+        self.spawn_area = None # Area of valid positions: (left, top, right, bottom)
+        self.free_rects = [] # Free area: List of non-overlapping rectangles (left, top, right, bottom)
+        self.cumulative_areas = [] # Cumulative area of free rectangles (Used to pick a rectangle by area)
+        self.free_area = 0 # Total free area (Number of free positions)
+
+        if spawn_area is not None:
+            self.set_spawn_area(spawn_area)
+
+    def set_spawn_area(self, spawn_area):
+        """Set area of valid positions (Removes all exclusions)
+
+        Parameters:
+            spawn_area (pygame.Rect): Area of valid positions
+        Returns:
+            None
+        """
+        self.spawn_area = (spawn_area.left, spawn_area.top, spawn_area.right, spawn_area.bottom)
+        self.set_exclusions(())
+
+    def set_exclusions(self, exclusion_rects):
+        """Compute free area: Spawn area minus exclusion rectangles
+
+        Parameters:
+            exclusion_rects (list): List of exclusion rectangles (pygame.Rect)
+        Returns:
+            None
+        """
+        free_rects = [self.spawn_area]
+
+        # Subtract each exclusion rectangle from all free rectangles
+        for exclusion_rect in exclusion_rects:
+            ex_left, ex_top, ex_right, ex_bottom = exclusion_rect.left, exclusion_rect.top, exclusion_rect.right, exclusion_rect.bottom
+            remaining_rects = []
+            for left, top, right, bottom in free_rects:
+
+                # No overlap: Keep free rectangle
+                if ex_left >= right or ex_right <= left or ex_top >= bottom or ex_bottom <= top:
+                    remaining_rects.append((left, top, right, bottom))
+                    continue
+
+                # Overlap: Split free rectangle into up to 4 parts around exclusion rectangle
+                if ex_top > top: # Part above
+                    remaining_rects.append((left, top, right, ex_top))
+                if ex_bottom < bottom: # Part below
+                    remaining_rects.append((left, ex_bottom, right, bottom))
+                middle_top = max(top, ex_top)
+                middle_bottom = min(bottom, ex_bottom)
+                if ex_left > left: # Part to the left
+                    remaining_rects.append((left, middle_top, ex_left, middle_bottom))
+                if ex_right < right: # Part to the right
+                    remaining_rects.append((ex_right, middle_top, right, middle_bottom))
+            free_rects = remaining_rects
+
+        # Store free rectangles and their cumulative areas
+        self.free_rects = free_rects
+        self.cumulative_areas = []
+        self.free_area = 0
+        for left, top, right, bottom in free_rects:
+            self.free_area += (right - left) * (bottom - top)
+            self.cumulative_areas.append(self.free_area)
+
+    def sample(self, rng=random):
+        """Pick a random free position (Every free position is equally likely)
+
+        Parameters:
+            rng (random.Random): Random number generator with 'randrange' (Default: random module) (See 'RNGStream')
+        Returns:
+            Tuple with x- & y-pos (tuple)
+        Raises:
+            SpawnAreaEmptyError: If there is no free area
+        """
+        if self.free_area <= 0:
+            raise SpawnAreaEmptyError(f"No free spawn area left: Spawn area {self.spawn_area} is covered by exclusion rectangles")
+
+        # Pick a random free position, and find the free rectangle containing it
+        position_index = rng.randrange(self.free_area)
+        rect_index = bisect_right(self.cumulative_areas, position_index)
+        left, top, right, bottom = self.free_rects[rect_index]
+
+        # Convert position index to position within free rectangle
+        if rect_index > 0:
+            position_index -= self.cumulative_areas[rect_index - 1]
+        width = right - left
+        return left + position_index % width, top + position_index // width
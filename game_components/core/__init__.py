@@ -1,3 +1,9 @@
 # game_components/core/__init__.py
 
-from .game_logic import Game
\ No newline at end of file
+from .game_logic import Game
+from .game_engine import GameEngine, run_headless
+from .batch_simulation import BatchSimulation
+from .spatial_grid import SpatialGrid
+from .session_rng import SessionRNG, RNGStream
+from .timer_wheel import TimerWheel, Timer
+from .frame_timer import FrameTimer
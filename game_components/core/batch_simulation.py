@@ -0,0 +1,389 @@
+# game_components/core/batch_simulation.py
+
+"""
+Batch Simulation Class
+
+This class runs many independent games at once, using the same rules as the game engine (See 'GameEngine').
+Instead of one object per player and apple, the state of all games is stored as NumPy arrays
+(struct-of-arrays: player x/y, apple x/y, gold apple flag, timers, scores...), and one vectorized step
+advances every game, including collision checks and apple respawn sampling.
+
+Used to evaluate balance changes (e.g. GOLD_APPLE_SPAWN_CHANCE) over thousands of bot-driven games in seconds.
+
+Note: Requires NumPy (pip install numpy). The rest of the game does not depend on it
+Note: Games use the same rules, but their own random numbers, so results are statistically (not tick-by-tick) equal to the engine
+Note: HUD text spawn restrictions are measured once, for a new game (Score 0, default countdown timer). The engine measures
+      them again as the HUD texts change, so apples next to wider texts (e.g. 3-digit scores) can spawn where the game
+      would not spawn them (See 'sample_spawn_positions')
+"""
+
+import pygame
+
+try:
+    import numpy as np
+except ImportError: # NumPy is optional: Only needed for batch simulation
+    np = None
+
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, SIMULATION_TICK_RATE, PLAYER_IMAGE_PATH, APPLE_IMAGE_PATH, GOLD_APPLE_IMAGE_PATH, SWEPT_COLLISION
+from config import PLAYER_MOVE_SPEED_X, PLAYER_MOVE_SPEED_Y, COUNTDOWN_DEFAULT_START_TIMER_VALUE, APPLE_TIME_BONUS, GOLD_APPLE_TIME_BONUS, GOLD_APPLE_SPAWN_CHANCE
+from game_components.assets import assets
+from game_components.character import Player
+from game_components.collectibles import Apple, GoldApple, SpawnSampler, SpawnRestrictions
+from game_components.core.game_engine import GameEngine
+
+
+class BatchSimulation():
+
+    # Maximum number of vectorized respawn sampling rounds per step (Remaining apples use the spawn sampler)
+    MAX_RESPAWN_ROUNDS = 4
+
+    # Default session length limit of 'run_sessions' (in simulated seconds) [Bots collecting gold apples can play forever]
+    MAX_SESSION_TIME = 60 * 10
+
+    # Names of all per-game state arrays
+    STATE_ARRAYS = ("player_x", "player_y", "apple_x", "apple_y", "gold_apple_x", "gold_apple_y", "gold_apple_spawned",
+                    "countdown_start_timer_value", "elapsed_time", "gold_apple_check_ticks", "highscore_num",
+                    "games_played", "first_scores")
+
+    def __init__(self, num_games=1000, seed=None, gold_apple_spawn_chance=GOLD_APPLE_SPAWN_CHANCE, tick_rate=SIMULATION_TICK_RATE):
+        """Initialize batch simulation
+
+        Parameters:
+            num_games (int):                    Number of games to simulate in parallel
+            seed (int):                         Random seed (Default: None = Random)
+            gold_apple_spawn_chance (float):    Gold apple spawn chance (in percent)
+            tick_rate (int):                    Simulation ticks per simulated second the games are stepped at (See 'set_tick_rate')
+        """
+        if np is None:
+            raise ImportError("Batch simulation requires NumPy (pip install numpy)")
+
+        self.num_games = num_games
+        self.rng = np.random.default_rng(seed)
+        self.gold_apple_spawn_chance = gold_apple_spawn_chance
+        self.tick_rate = tick_rate
+        self.gold_apple_check_interval_ticks = GameEngine.get_gold_apple_check_interval_ticks(tick_rate) # Ticks between gold apple checks
+
+        # Sprite sizes (Same scaled images as the game)
+        self.player_width, self.player_height = assets.get_image(PLAYER_IMAGE_PATH, scale=Player.PLAYER_SCALE_NUM).get_size()
+        self.apple_width, self.apple_height = assets.get_image(APPLE_IMAGE_PATH, scale=Apple.APPLE_SCLAE_NUM).get_size()
+        self.gold_apple_width, self.gold_apple_height = assets.get_image(GOLD_APPLE_IMAGE_PATH, scale=Apple.APPLE_SCLAE_NUM).get_size()
+
+        # HUD text spawn restrictions (Used to create apple-spawn restrictions) [Player restrictions are vectorized per game]
+        self.spawn_restrictions = SpawnRestrictions(GameEngine.measure_hud_boundaries())
+        self.spawn_sampler = SpawnSampler() # Used for apples without a valid position after vectorized sampling
+
+        # Game state (One entry per game)
+        self.player_x = np.zeros(num_games) # Player position (Center)
+        self.player_y = np.zeros(num_games)
+        self.apple_x = np.zeros(num_games, dtype=np.int64) # Apple position (Center)
+        self.apple_y = np.zeros(num_games, dtype=np.int64)
+        self.gold_apple_x = np.zeros(num_games, dtype=np.int64) # Gold apple position (Center)
+        self.gold_apple_y = np.zeros(num_games, dtype=np.int64)
+        self.gold_apple_spawned = np.zeros(num_games, dtype=bool) # Gold apple spawn flag
+        self.countdown_start_timer_value = np.zeros(num_games) # Start value for countdown timer
+        self.elapsed_time = np.zeros(num_games) # Simulated time since game start
+        self.gold_apple_check_ticks = np.zeros(num_games, dtype=np.int64) # Ticks until next gold apple check (Same as gold apple timer of the engine)
+        self.highscore_num = np.zeros(num_games, dtype=np.int64) # Highscore counter
+
+        # Finished games
+        self.games_played = np.zeros(num_games, dtype=np.int64) # Number of finished games per lane
+        self.first_scores = np.full(num_games, -1, dtype=np.int64) # Final score of first finished game per lane (-1 = Not finished)
+        self.ticks_run = 0 # Ticks run by 'run_sessions'
+        self.sessions_finished = np.zeros(num_games, dtype=bool) # Sessions of 'run_sessions' that ended before the tick limit
+
+        self.reset(np.ones(num_games, dtype=bool))
+
+    def reset(self, mask):
+        """Reset games to start a new game (Same as 'GameEngine.reset')
+
+        Parameters:
+            mask (numpy.ndarray): Boolean array of games to reset
+        Returns:
+            None
+        """
+        self.countdown_start_timer_value[mask] = COUNTDOWN_DEFAULT_START_TIMER_VALUE
+        self.elapsed_time[mask] = 0
+        self.highscore_num[mask] = 0
+        self.player_x[mask] = Player.DEFAULT_X_POS
+        self.player_y[mask] = Player.DEFAULT_Y_POS
+        self.apple_x[mask] = Apple.DEFAULT_X_POS
+        self.apple_y[mask] = Apple.DEFAULT_Y_POS
+        self.gold_apple_x[mask] = GoldApple.DEFAULT_X_POS
+        self.gold_apple_y[mask] = GoldApple.DEFAULT_Y_POS
+        self.gold_apple_spawned[mask] = False
+        self.gold_apple_check_ticks[mask] = self.gold_apple_check_interval_ticks
+
+    def set_tick_rate(self, tick_rate):
+        """Set the simulation tick rate the games are stepped at (Same as 'GameEngine.set_tick_rate')
+        Pending gold apple checks keep their remaining time (in seconds)
+
+        Parameters:
+            tick_rate (int): Simulation ticks per simulated second
+        Returns:
+            None
+        """
+        if tick_rate == self.tick_rate:
+            return
+        self.gold_apple_check_ticks = np.maximum(1, np.round(self.gold_apple_check_ticks * tick_rate / self.tick_rate)).astype(np.int64)
+        self.tick_rate = tick_rate
+        self.gold_apple_check_interval_ticks = GameEngine.get_gold_apple_check_interval_ticks(tick_rate)
+
+    def get_player_rects(self):
+        """Return player rects of all games (Same rounding as pygame.Rect)
+
+        Returns:
+            Tuple of arrays: left, top, right, bottom (tuple)
+        """
+        left = np.round(self.player_x).astype(np.int64) - self.player_width // 2
+        top = np.round(self.player_y).astype(np.int64) - self.player_height // 2
+        return left, top, left + self.player_width, top + self.player_height
+
+    def get_sweep_hits(self, start_rects, dx, dy, target_left, target_top, target_width, target_height):
+        """Check which player rectangles overlap a target rectangle during their movement (Swept AABB)
+        (Same as 'SpatialGrid.get_sweep_interval' for all games at once)
+
+        Parameters:
+            start_rects (tuple):            Player rectangles at start of movement: left, top, right, bottom (Arrays)
+            dx (numpy.ndarray):             Movement along x-axis per game (in pixels)
+            dy (numpy.ndarray):             Movement along y-axis per game (in pixels)
+            target_left (numpy.ndarray):    Left edge of target per game
+            target_top (numpy.ndarray):     Top edge of target per game
+            target_width (int):             Target width
+            target_height (int):            Target height
+        Returns:
+            Boolean array of games whose player overlaps the target during the movement (numpy.ndarray)
+        """
+        left, top, right, bottom = start_rects
+        entry_time = np.full(self.num_games, -np.inf)
+        exit_time = np.full(self.num_games, np.inf)
+        for start, end, target_start, target_end, delta in ((left, right, target_left, target_left + target_width, dx),
+                                                             (top, bottom, target_top, target_top + target_height, dy)):
+            moving = delta != 0
+            safe_delta = np.where(moving, delta, 1) # Not moving: Overlap on this axis does not change
+            axis_entry = (target_start - end) / safe_delta
+            axis_exit = (target_end - start) / safe_delta
+            axis_entry, axis_exit = np.minimum(axis_entry, axis_exit), np.maximum(axis_entry, axis_exit)
+            overlapping = (start < target_end) & (target_start < end)
+            axis_entry = np.where(moving, axis_entry, np.where(overlapping, -np.inf, np.inf))
+            axis_exit = np.where(moving, axis_exit, np.inf)
+            entry_time = np.maximum(entry_time, axis_entry)
+            exit_time = np.minimum(exit_time, axis_exit)
+        return (entry_time < exit_time) & (entry_time < 1) & (exit_time > 0)
+
+    def get_bot_input(self):
+        """Simple bot for all games: Move towards gold apple if spawned, otherwise towards regular apple
+        (Same as 'GameEngine.get_bot_input')
+
+        Returns:
+            Input bitmask per game (numpy.ndarray)
+        """
+        target_x = np.where(self.gold_apple_spawned, self.gold_apple_x, self.apple_x)
+        target_y = np.where(self.gold_apple_spawned, self.gold_apple_y, self.apple_y)
+        player_x = np.round(self.player_x)
+        player_y = np.round(self.player_y)
+
+        input_bits = np.zeros(self.num_games, dtype=np.int64)
+        input_bits |= np.where(target_x < player_x - 2, Player.INPUT_LEFT, 0)
+        input_bits |= np.where(target_x > player_x + 2, Player.INPUT_RIGHT, 0)
+        input_bits |= np.where(target_y < player_y - 2, Player.INPUT_UP, 0)
+        input_bits |= np.where(target_y > player_y + 2, Player.INPUT_DOWN, 0)
+        return input_bits
+
+    def sample_spawn_positions(self, mask, apple_width, apple_height):
+        """Sample random apple positions for masked games, avoiding HUD texts and player (Same rules as 'Apple.respawn')
+        Positions are sampled for all masked games at once, and resampled where rejected, up to MAX_RESPAWN_ROUNDS rounds.
+        Games still without a valid position use the spawn sampler (See 'SpawnSampler'), so every position is valid
+
+        Note: HUD texts are the ones of a new game for every game (Approximation: The engine measures them again
+              when score or countdown timer change the text width)
+
+        Parameters:
+            mask (numpy.ndarray):   Boolean array of games that needs a new apple position
+            apple_width (int):      Apple image width
+            apple_height (int):     Apple image height
+        Returns:
+            Tuple of arrays with x- & y-pos for masked games (tuple)
+        """
+        half_width = int(apple_width / 2)
+        half_height = int(apple_height / 2)
+
+        # Screen boundaries for spawn
+        x_min_pos = half_width + Apple.SPAWN_MARGIN
+        x_max_pos = int(SCREEN_WIDTH - apple_width / 2) - Apple.SPAWN_MARGIN
+        y_min_pos = half_height + Apple.SPAWN_MARGIN
+        y_max_pos = int(SCREEN_HEIGHT - apple_height / 2) - Apple.SPAWN_MARGIN
+
+        # HUD text exclusion rectangles (Same for all games)
+        hud_exclusion_rects = self.spawn_restrictions.get_hud_exclusion_rects((apple_width, apple_height), Apple.SPAWN_MARGIN)
+
+        # Player exclusion rectangles (Per game)
+        left, top, right, bottom = self.get_player_rects()
+        x_start_player = left[mask] - half_width - Apple.PLAYER_SPAWN_MARGIN
+        x_end_player = right[mask] + half_width + Apple.PLAYER_SPAWN_MARGIN
+        y_start_player = top[mask] - half_height - Apple.PLAYER_SPAWN_MARGIN
+        y_end_player = bottom[mask] + half_height + Apple.PLAYER_SPAWN_MARGIN
+
+        count = len(x_start_player)
+        x_pos = np.zeros(count, dtype=np.int64)
+        y_pos = np.zeros(count, dtype=np.int64)
+        pending = np.ones(count, dtype=bool) # Games that still needs a valid position
+
+        for sampling_round in range(self.MAX_RESPAWN_ROUNDS):
+            pending_count = int(pending.sum())
+            if pending_count == 0:
+                break
+
+            x_pos[pending] = self.rng.integers(x_min_pos, x_max_pos, pending_count, endpoint=True)
+            y_pos[pending] = self.rng.integers(y_min_pos, y_max_pos, pending_count, endpoint=True)
+
+            # Reject positions within exclusion rectangles
+            rejected = (x_pos >= x_start_player) & (x_pos < x_end_player) & (y_pos >= y_start_player) & (y_pos < y_end_player)
+            for exclusion_rect in hud_exclusion_rects:
+                rejected |= (x_pos >= exclusion_rect.left) & (x_pos < exclusion_rect.right) & (y_pos >= exclusion_rect.top) & (y_pos < exclusion_rect.bottom)
+            pending &= rejected
+
+        # Use spawn sampler for games still without a valid position (Rare)
+        for index in np.flatnonzero(pending):
+            player_exclusion_rect = pygame.Rect(int(x_start_player[index]), int(y_start_player[index]),
+                                                int(x_end_player[index] - x_start_player[index]), int(y_end_player[index] - y_start_player[index]))
+            self.spawn_sampler.set_spawn_area(pygame.Rect(x_min_pos, y_min_pos, x_max_pos - x_min_pos + 1, y_max_pos - y_min_pos + 1))
+            self.spawn_sampler.set_exclusions(hud_exclusion_rects + [player_exclusion_rect])
+            x_pos[index], y_pos[index] = self.spawn_sampler.sample()
+
+        return x_pos, y_pos
+
+    def step(self, dt, input_bits=None):
+        """Run one simulation tick for all games
+
+        Parameters:
+            dt (float):                     Time step (in seconds) [1 / tick_rate: Gold apple checks are counted in ticks]
+            input_bits (numpy.ndarray):     Player input bitmask per game (Default: None = Bot input)
+        Returns:
+            Boolean array of games that ended during the step (numpy.ndarray)
+        """
+        if input_bits is None:
+            input_bits = self.get_bot_input()
+
+        # Player movement (Same as 'Player.set_velocity' and 'Player.move')
+        start_rects = self.get_player_rects() # Used for swept collision
+        left, top, right, bottom = start_rects
+        vx = np.zeros(self.num_games)
+        vy = np.zeros(self.num_games)
+        vy = np.where((input_bits & Player.INPUT_UP != 0) & (top >= 1), -PLAYER_MOVE_SPEED_Y, vy)
+        vy = np.where((input_bits & Player.INPUT_DOWN != 0) & (bottom <= SCREEN_HEIGHT), PLAYER_MOVE_SPEED_Y, vy)
+        vx = np.where((input_bits & Player.INPUT_LEFT != 0) & (left >= -35), -PLAYER_MOVE_SPEED_X, vx)
+        vx = np.where((input_bits & Player.INPUT_RIGHT != 0) & (right <= SCREEN_WIDTH + 35), PLAYER_MOVE_SPEED_X, vx)
+        diagonal = (vx != 0) & (vy != 0)
+        vx[diagonal] *= 0.7071
+        vy[diagonal] *= 0.7071
+        self.player_x += vx * dt
+        self.player_y += vy * dt
+
+        # Timers
+        self.elapsed_time += dt
+        countdown_timer_value = np.round(self.countdown_start_timer_value - self.elapsed_time, 1)
+
+        # Game over: Store final scores and start new games
+        game_over = countdown_timer_value <= 0
+        if game_over.any():
+            first_game = game_over & (self.first_scores < 0)
+            self.first_scores[first_game] = self.highscore_num[first_game]
+            self.games_played[game_over] += 1
+            self.reset(game_over)
+        playing = ~game_over
+
+        # Gold apple spawn/despawn check (At exact ticks, same as 'GameEngine.check_gold_apple')
+        self.gold_apple_check_ticks[playing] -= 1
+        check = playing & (self.gold_apple_check_ticks <= 0)
+        if check.any():
+            self.gold_apple_check_ticks[check] = self.gold_apple_check_interval_ticks
+            roll = self.rng.random(self.num_games) < (self.gold_apple_spawn_chance / 100)
+            spawn = check & ~self.gold_apple_spawned & roll
+            despawn = check & self.gold_apple_spawned
+            self.gold_apple_spawned[despawn] = False
+            if spawn.any():
+                self.gold_apple_x[spawn], self.gold_apple_y[spawn] = self.sample_spawn_positions(spawn, self.gold_apple_width, self.gold_apple_height)
+                self.gold_apple_spawned[spawn] = True
+
+        # Collision between player and apple(s) (AABB, same as pygame.Rect.colliderect) [Swept over movement with SWEPT_COLLISION]
+        left, top, right, bottom = self.get_player_rects()
+        apple_left = self.apple_x - self.apple_width // 2
+        apple_top = self.apple_y - self.apple_height // 2
+        gold_apple_left = self.gold_apple_x - self.gold_apple_width // 2
+        gold_apple_top = self.gold_apple_y - self.gold_apple_height // 2
+        if SWEPT_COLLISION == True:
+            dx, dy = left - start_rects[0], top - start_rects[1]
+            apple_hit = playing & self.get_sweep_hits(start_rects, dx, dy, apple_left, apple_top, self.apple_width, self.apple_height)
+            gold_apple_hit = playing & self.gold_apple_spawned & self.get_sweep_hits(start_rects, dx, dy, gold_apple_left, gold_apple_top, self.gold_apple_width, self.gold_apple_height)
+        else:
+            apple_hit = playing & (left < apple_left + self.apple_width) & (apple_left < right) & (top < apple_top + self.apple_height) & (apple_top < bottom)
+            gold_apple_hit = playing & self.gold_apple_spawned & (left < gold_apple_left + self.gold_apple_width) & (gold_apple_left < right) & (top < gold_apple_top + self.gold_apple_height) & (gold_apple_top < bottom)
+
+        if apple_hit.any():
+            self.apple_x[apple_hit], self.apple_y[apple_hit] = self.sample_spawn_positions(apple_hit, self.apple_width, self.apple_height)
+            self.highscore_num[apple_hit] += 1
+            self.countdown_start_timer_value[apple_hit] += APPLE_TIME_BONUS
+        if gold_apple_hit.any():
+            self.gold_apple_spawned[gold_apple_hit] = False
+            self.gold_apple_check_ticks[gold_apple_hit] = self.gold_apple_check_interval_ticks # Restart spawn timer
+            self.highscore_num[gold_apple_hit] += 1
+            self.countdown_start_timer_value[gold_apple_hit] += GOLD_APPLE_TIME_BONUS
+
+        return game_over
+
+    def keep_games(self, mask):
+        """Keep only masked games (Used to stop simulating finished games)
+
+        Parameters:
+            mask (numpy.ndarray): Boolean array of games to keep
+        Returns:
+            None
+        """
+        for name in self.STATE_ARRAYS:
+            setattr(self, name, getattr(self, name)[mask])
+        self.num_games = int(mask.sum())
+
+    def run_sessions(self, tick_rate=None, max_ticks=None):
+        """Run until every game has finished once (One bot-driven session per game) or the tick limit is reached
+        Finished games are removed from the simulation every simulated second, so a few long sessions
+        do not keep the whole batch running. Sessions still running at the tick limit keep their score at the limit
+        (See 'sessions_finished': Otherwise long sessions, e.g. with high gold apple spawn chances, are left out)
+
+        Parameters:
+            tick_rate (int):    Simulation ticks per simulated second (Default: None = Tick rate of the batch)
+            max_ticks (int):    Maximum number of ticks to run (Default: None = MAX_SESSION_TIME simulated seconds)
+        Returns:
+            Score of every session: Final score, or score at the tick limit if not finished (numpy.ndarray)
+        """
+        if tick_rate is not None:
+            self.set_tick_rate(tick_rate)
+        tick_rate = self.tick_rate
+        dt = 1 / tick_rate
+        if max_ticks is None:
+            max_ticks = self.MAX_SESSION_TIME * tick_rate
+        session_scores = np.full(self.num_games, -1, dtype=np.int64) # Final score per session
+        self.sessions_finished = np.zeros(self.num_games, dtype=bool)
+        session_ids = np.arange(self.num_games) # Session of each simulated game
+
+        ticks = 0
+        while self.num_games > 0 and ticks < max_ticks:
+            self.step(dt)
+            ticks += 1
+
+            # Store scores of finished sessions and stop simulating them
+            if ticks % tick_rate == 0:
+                finished = self.first_scores >= 0
+                if finished.any():
+                    session_scores[session_ids[finished]] = self.first_scores[finished]
+                    self.sessions_finished[session_ids[finished]] = True
+                    session_ids = session_ids[~finished]
+                    self.keep_games(~finished)
+
+        # Store scores of sessions that finished since last check, and current scores of sessions still running
+        finished = self.first_scores >= 0
+        session_scores[session_ids[finished]] = self.first_scores[finished]
+        self.sessions_finished[session_ids[finished]] = True
+        session_scores[session_ids[~finished]] = self.highscore_num[~finished]
+
+        self.ticks_run = ticks
+        return session_scores
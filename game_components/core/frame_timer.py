@@ -0,0 +1,158 @@
+# game_components/core/frame_timer.py
+
+"""
+Frame Timer Class
+
+This class measures how long each phase of a frame takes (Event pump, game logic, sprite updates, spawn
+bookkeeping, collision, drawing, display update and frame rate sleep), and keeps the timings of the last
+PERF_HUD_HISTORY frames in a fixed-size ring buffer (Shown by the performance HUD, see 'PerfHUD', and written with
+every frame hitch, see 'HitchWatchdog').
+
+Phases are measured with marks: 'mark' adds the time since the previous mark to a phase, so a frame is split into
+phases without gaps. Engine phases are marked once per simulation tick, and added up over all ticks of the frame.
+
+Nothing is allocated per frame: The ring buffer is preallocated, and running sums per phase are updated when a
+frame is stored, so averages cost the same no matter how many frames are kept.
+"""
+
+import time
+from config import PERF_HUD_HISTORY
+
+
+class FrameTimer():
+
+    # Phases of a frame (Index into timings)
+    PHASE_EVENTS = 0    # Event pump (Input handler)
+    PHASE_LOGIC = 1     # Game logic around engine steps (Player input, recording, HUD values, sounds)
+    PHASE_SPRITES = 2   # Player and apple sprite updates (Engine)
+    PHASE_SPAWN = 3     # Spawn restriction bookkeeping and timed events, e.g. gold apple spawns (Engine)
+    PHASE_COLLISION = 4 # Collision checks and collected apples (Engine)
+    PHASE_DRAW = 5      # Drawing the active screen ('GameScreen.update_frame')
+    PHASE_OVERLAY = 6   # Drawing the performance HUD
+    PHASE_FLIP = 7      # Pushing the frame to the display ('GameScreen.present')
+    PHASE_SLEEP = 8     # Frame rate limiter ('clock.tick')
+    PHASE_NAMES = ("Events", "Logic", "Sprites", "Spawn", "Collision", "Draw", "Overlay", "Flip", "Sleep")
+
+    def __init__(self, history=PERF_HUD_HISTORY):
+        """Initialize Frame Timer
+
+        Parameters:
+            history (int): Number of frames kept in the ring buffer
+        """
+        self.history = history
+        phase_count = len(self.PHASE_NAMES)
+
+        # Ring buffer (Oldest frame is overwritten first)
+        self.frame_times = [0.0] * history # Frame time of each frame (in seconds)
+        self.phase_times = [[0.0] * phase_count for frame_num in range(history)] # Phase times of each frame (in seconds)
+        self.index = 0 # Slot of next frame
+        self.count = 0 # Number of frames stored (Up to history)
+
+        # Running sums over stored frames (Used for averages)
+        self.frame_time_sum = 0.0
+        self.phase_time_sums = [0.0] * phase_count
+
+        # Current frame
+        self.current_phase_times = [0.0] * phase_count
+        self.frame_start = 0.0 # Start time of current frame [time.perf_counter]
+        self.last_mark = 0.0 # Time of last mark [time.perf_counter]
+
+    def start_frame(self):
+        """Start measuring a frame (Timings of a frame that was not ended are dropped)"""
+        for phase in range(len(self.current_phase_times)):
+            self.current_phase_times[phase] = 0.0
+        self.frame_start = self.last_mark = time.perf_counter()
+
+    def mark(self, phase):
+        """Add time since last mark to a phase
+
+        Parameters:
+            phase (int): Phase that just ended (e.g. FrameTimer.PHASE_EVENTS)
+        Returns:
+            None
+        """
+        now = time.perf_counter()
+        self.current_phase_times[phase] += now - self.last_mark
+        self.last_mark = now
+
+    def end_frame(self):
+        """Store current frame in the ring buffer (Frame time: Time since 'start_frame')"""
+        frame_time = time.perf_counter() - self.frame_start
+        self.frame_time_sum += frame_time - self.frame_times[self.index]
+        self.frame_times[self.index] = frame_time
+
+        stored_phase_times = self.phase_times[self.index]
+        for phase, phase_time in enumerate(self.current_phase_times):
+            self.phase_time_sums[phase] += phase_time - stored_phase_times[phase]
+            stored_phase_times[phase] = phase_time
+
+        self.index = (self.index + 1) % self.history
+        self.count = min(self.count + 1, self.history)
+
+    def get_average_frame_time(self):
+        """Get average frame time of stored frames
+
+        Returns:
+            Average frame time (in seconds) (float) [0 if no frame is stored]
+        """
+        return self.frame_time_sum / self.count if self.count > 0 else 0.0
+
+    def get_max_frame_time(self):
+        """Get longest frame time of stored frames
+
+        Returns:
+            Longest frame time (in seconds) (float) [0 if no frame is stored]
+        """
+        return max(self.frame_times) if self.count > 0 else 0.0 # Unused slots are 0
+
+    def get_average_phase_times(self):
+        """Get average time of every phase over stored frames
+
+        Returns:
+            Average phase times, in the order of PHASE_NAMES (in seconds) (list)
+        """
+        if self.count == 0:
+            return [0.0] * len(self.PHASE_NAMES)
+        return [phase_time_sum / self.count for phase_time_sum in self.phase_time_sums]
+
+    def get_last_frame(self):
+        """Get timings of the frame stored last
+
+        Returns:
+            Frame time (in seconds) and phase times in the order of PHASE_NAMES (in seconds) (tuple) [Phase times are not copied]
+        """
+        last_index = (self.index - 1) % self.history
+        return self.frame_times[last_index], self.phase_times[last_index]
+
+    def get_history(self):
+        """Get timings of stored frames
+
+        Returns:
+            (Frame time, phase times) per frame, oldest first (in seconds) (list)
+        """
+        first_index = self.index if self.count == self.history else 0
+        return [(self.frame_times[frame_index % self.history], list(self.phase_times[frame_index % self.history]))
+                for frame_index in range(first_index, first_index + self.count)]
+
+    def get_frame_time_history(self):
+        """Get frame times of stored frames
+
+        Returns:
+            Frame times, oldest first (in seconds) (list)
+        """
+        if self.count < self.history:
+            return self.frame_times[:self.count]
+        return self.frame_times[self.index:] + self.frame_times[:self.index]
+
+    def reset(self):
+        """Drop all stored frames"""
+        for frame_num in range(self.history):
+            self.frame_times[frame_num] = 0.0
+            stored_phase_times = self.phase_times[frame_num]
+            for phase in range(len(stored_phase_times)):
+                stored_phase_times[phase] = 0.0
+        self.frame_time_sum = 0.0
+        for phase in range(len(self.phase_time_sums)):
+            self.phase_time_sums[phase] = 0.0
+        self.index = 0
+        self.count = 0
@@ -0,0 +1,588 @@
+# game_components/core/game_engine.py
+
+"""
+Game Engine Class
+
+This class contains the game rules of the main screen: player movement, countdown timer, time bonuses,
+gold apple spawn/despawn checks, and collision scoring. It does not use the display, the mixer or the clock,
+so it can be stepped by any driver: The game window (See 'Game'), or a headless run that simulates
+as fast as the CPU allows (See 'run_headless').
+
+Instead of playing sounds and changing screens, the engine reports what happened during a step as events
+(See 'events'). The driver decides what to do with them, e.g. play a sound or show the end screen.
+
+Collisions are found with a spatial grid of the spawned collectibles (See 'SpatialGrid'), so the cost of a
+collision check does not grow with the number of collectibles. With PRECISE_COLLISION, collisions found by
+rectangle overlap are confirmed with the cached collision masks of player and collectibles (See 'get_collisions').
+With SWEPT_COLLISION, the player is checked over its whole movement of a tick (Swept AABB), so collectibles
+between two positions are not jumped over at high move speeds or low tick rates.
+
+Timed game events (e.g. gold apple spawn/despawn checks) are scheduled at exact ticks on a timer wheel
+(See 'TimerWheel'), which is advanced once per tick. Pending timers are cancelled when a new game starts
+(See 'reset') and when the main screen is left (See 'cancel_timers').
+
+A game only depends on its seed and the player input of every tick: All random decisions use the engine's own
+random number streams (See 'SessionRNG', seeded on 'reset'), and HUD text rectangles used for apple-spawn
+restrictions are measured by the engine itself. This is used to record and replay games
+(See 'get_state_hash' and 'game_components.replay').
+
+The whole game state (Including random number streams) can be saved to and restored from a byte buffer with a fixed
+layout in microseconds (See 'snapshot' and 'restore'), e.g. to fork one game state into many simulated futures.
+
+If a frame timer is set (See 'frame_timer', used by the performance HUD), 'step' marks the time spent on sprite
+updates, spawn bookkeeping and collision. Without it, steps are not timed.
+"""
+
+import pygame
+import struct
+import time
+import zlib
+from config import SIMULATION_TICK_RATE, FONT_PATH, COUNTDOWN_DEFAULT_START_TIMER_VALUE, APPLE_COUNT, APPLE_TIME_BONUS, GOLD_APPLE_TIME_BONUS, GOLD_APPLE_CHECK_INTERVAL, GOLD_APPLE_SPAWN_CHANCE
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, PRECISE_COLLISION, SWEPT_COLLISION
+from game_components.ui.text_cache import text_cache
+from game_components.character import Player
+from game_components.collectibles import Apple, GoldApple, CollectiblePool, SpawnRestrictions
+from game_components.core.spatial_grid import SpatialGrid
+from game_components.core.session_rng import SessionRNG
+from game_components.core.timer_wheel import TimerWheel
+from game_components.core.frame_timer import FrameTimer
+
+
+class GameEngine():
+
+    # Events reported by 'step'
+    EVENT_APPLE_COLLECTED = "apple_collected"
+    EVENT_GOLD_APPLE_COLLECTED = "gold_apple_collected"
+    EVENT_GOLD_APPLE_SPAWNED = "gold_apple_spawned"
+    EVENT_GOLD_APPLE_DESPAWNED = "gold_apple_despawned"
+    EVENT_GAME_OVER = "game_over"
+
+    # HUD texts on main screen: text name -> (text format, font size, y-pos in percent) [Same as drawn by 'GameScreen.main_screen']
+    HUD_TEXT_LAYOUT = {
+        "highscore": ("Score: {}", 40, 6),
+        "countdown_timer": ("Timer: {}", 25, 11.5),
+    }
+
+    # Packed game state used for state hashes (Player position, apple & gold apple positions, highscore,
+    # countdown start value, elapsed time, ticks until gold apple check and spawn flag)
+    STATE_HASH_STRUCT = struct.Struct("<ddiiiiIddI?")
+    APPLE_STATE_HASH_STRUCT = struct.Struct("<ii") # Position of an extra apple (Multi-apple mode)
+
+    # Snapshot layout of engine values: Countdown start value, elapsed time, countdown timer value, current tick,
+    # tick of next gold apple check (0 = None), highscore, gold apple spawn flag, highscore and countdown timer of measured HUD texts
+    # (Followed by player, apples and random number streams: See 'write_snapshot')
+    SNAPSHOT_STRUCT = struct.Struct("<dddIII?Id")
+
+    def __init__(self, seed=None, tick_rate=SIMULATION_TICK_RATE):
+        """Initialize game engine: Creates player and apple(s), and sets default game state
+
+        Parameters:
+            seed (int):         Seed of random number streams (Default: None = Random seed)
+            tick_rate (int):    Simulation ticks per simulated second the engine is stepped at (See 'set_tick_rate')
+        """
+        # Simulation tick rate (Timed game events are scheduled in ticks)
+        self.tick_rate = tick_rate
+        self.gold_apple_check_interval_ticks = self.get_gold_apple_check_interval_ticks(tick_rate) # Ticks between gold apple spawn/despawn checks
+
+        # Random number streams (Every random decision uses one: Reseeded on 'reset')
+        self.rng = SessionRNG(seed)
+        self.spawn_rng = self.rng.get_stream("spawn") # Apple spawn locations
+        self.gold_apple_rng = self.rng.get_stream("gold_apple") # Gold apple spawn rolls
+
+        # Player setup
+        self.player = Player() # Create player
+        self.player_group = pygame.sprite.GroupSingle() # Create SingleGroup (Used to store single sprite)
+        self.player_group.add(self.player) # Add player to group
+
+        # Apple(s) setup
+        self.apple = Apple() # Create apple
+        self.gold_apple = GoldApple() # Create gold apple
+        self.apple_group = pygame.sprite.Group() # Create sprite group (Used to store multiple sprites)
+        self.apple_group.add(self.apple) # Add apple to group
+
+        # Extra apples (Multi-apple mode: APPLE_COUNT > 1) [Reused from pool on every new game]
+        self.collectible_pool = CollectiblePool()
+        self.extra_apples = []
+
+        # Spatial grid of spawned collectibles (Used to find collisions without checking every collectible)
+        # Updated whenever a collectible spawns, respawns or despawns
+        self.collectible_grid = SpatialGrid()
+        self.collectible_grid.insert(self.apple)
+        self.collision_order = {self.apple: 0, self.gold_apple: 1} # Collectible -> Index (Collisions are handled in this order)
+        self.sweep_start_rect = self.player.rect.copy() # Player rectangle at start of tick (Used for swept collision)
+
+        # Apple-spawn restrictions (Shared by all apples: Only requested when an apple respawns)
+        # HUD text rectangles are measured from the HUD font whenever highscore or countdown timer changes (See 'update_hud_rects')
+        self.spawn_restrictions = SpawnRestrictions(self.measure_hud_boundaries(), self.player)
+        self.hud_highscore = 0 # Highscore value of measured HUD text
+        self.hud_countdown_timer = float(COUNTDOWN_DEFAULT_START_TIMER_VALUE) # Countdown timer value of measured HUD text
+        self.apple.set_spawn_restrictions(self.spawn_restrictions) # Send to apple class
+        self.gold_apple.set_spawn_restrictions(self.spawn_restrictions) # Send to gold apple class
+
+        self.events = [] # Events that happened during last step
+        self.timer_wheel = TimerWheel() # Timed game events (Advanced once per tick)
+        self.frame_timer = None # Frame timer marking engine phases of every step (None = Steps are not timed)
+
+        # Set default game state
+        self.countdown_start_timer_value = COUNTDOWN_DEFAULT_START_TIMER_VALUE # Start value for countdown timer
+        self.elapsed_time = 0 # Simulated time since game start (in seconds)
+        self.countdown_timer_value = COUNTDOWN_DEFAULT_START_TIMER_VALUE # Countdown timer value (in seconds)
+        self.gold_apple_spawned = False # Gold apple spawn flag (Used to check whether gold apple should spawn/despawn)
+        self.gold_apple_timer = self.timer_wheel.schedule(self.gold_apple_check_interval_ticks, self.check_gold_apple) # Next gold apple spawn/despawn check
+        self.highscore_num = 0 # Highscore counter
+
+        self.spawn_extra_apples() # Spawn extra apples (Multi-apple mode)
+
+    def reset(self, seed=None):
+        """Reset game state to start a new game
+        With a seed, the new game is reproducible: It only depends on the seed and the player input of every tick
+
+        Parameters:
+            seed (int): Seed of random number streams (Default: None = Keep stream states)
+        Returns:
+            None
+        """
+        if seed is not None:
+            self.rng.seed(seed) # Reseed random number streams
+
+        self.countdown_start_timer_value = COUNTDOWN_DEFAULT_START_TIMER_VALUE # Reset countdown timer to default value
+        self.elapsed_time = 0 # Reset time since game start
+        self.countdown_timer_value = float(COUNTDOWN_DEFAULT_START_TIMER_VALUE) # Reset countdown timer value
+        self.timer_wheel.reset() # Cancel timers of previous game (Games must not depend on previous games)
+        self.gold_apple_timer = self.timer_wheel.schedule(self.gold_apple_check_interval_ticks, self.check_gold_apple) # Schedule first gold apple check
+        self.highscore_num = 0 # Reset highscore
+        self.update_hud_rects() # Measure HUD texts of new game
+        self.player.respawn() # Respawn player to default position
+        self.apple.respawn(default_spawn_location=True) # Respawn apple to default position
+        self.collectible_grid.move(self.apple) # Update apple position in grid
+        self.apple_group.remove(self.gold_apple) # Despawn gold apple
+        self.collectible_grid.remove(self.gold_apple) # Remove gold apple from grid
+        self.gold_apple.respawn(default_spawn_location=True) # Move despawned gold apple to default position (Its position is hashed)
+        self.gold_apple_spawned = False # Update the gold apple spawn flag
+        self.spawn_extra_apples() # Respawn extra apples (Multi-apple mode)
+
+    def spawn_extra_apples(self):
+        """Despawn extra apples, and spawn APPLE_COUNT - 1 extra apples to random locations (Apples are reused from pool)"""
+        for apple in self.extra_apples:
+            self.collectible_grid.remove(apple) # Remove apple from grid
+            del self.collision_order[apple]
+            self.collectible_pool.release(apple) # Despawn apple (Returns it to pool)
+        self.extra_apples.clear()
+
+        for apple_num in range(APPLE_COUNT - 1):
+            apple = self.collectible_pool.acquire(Apple) # Get apple from pool
+            apple.set_spawn_restrictions(self.spawn_restrictions) # Send spawn restrictions to apple
+            apple.respawn(rng=self.spawn_rng) # Spawn to random location
+            self.apple_group.add(apple) # Spawn apple
+            self.collectible_grid.insert(apple) # Add apple to grid
+            self.collision_order[apple] = len(self.collision_order)
+            self.extra_apples.append(apple)
+
+    @classmethod
+    def measure_hud_text(cls, text_name, value):
+        """Measure a HUD text rectangle without drawing (Same text, size and position as on main screen)
+
+        Parameters:
+            text_name (str):    HUD text name (See 'HUD_TEXT_LAYOUT')
+            value:              Value shown in text (e.g. highscore)
+        Returns:
+            Text rectangle (pygame.Rect)
+        """
+        if pygame.font.get_init() == False:
+            pygame.font.init()
+
+        text_format, font_size, y_pos = cls.HUD_TEXT_LAYOUT[text_name]
+        text_rect = pygame.Rect((0, 0), text_cache.get_font(FONT_PATH, font_size).size(text_format.format(value)))
+        text_rect.center = (SCREEN_WIDTH * (50 / 100), SCREEN_HEIGHT * (y_pos / 100))
+        return text_rect
+
+    @classmethod
+    def measure_hud_boundaries(cls):
+        """Measure HUD text boundaries of a new game without drawing
+
+        Returns:
+            A dictionary with highscore and countdown timer text rectangles (dict)
+        """
+        return {
+            "highscore": cls.measure_hud_text("highscore", 0),
+            "countdown_timer": cls.measure_hud_text("countdown_timer", float(COUNTDOWN_DEFAULT_START_TIMER_VALUE)),
+        }
+
+    def update_hud_rects(self):
+        """Send HUD text rectangles to spawn restrictions if highscore or countdown timer changed
+        Texts are measured by the engine (Not taken from drawn texts), so apple spawns do not depend on the frame rate
+
+        Returns:
+            None
+        """
+        self.set_hud_values(self.highscore_num, self.countdown_timer_value)
+
+    def set_hud_values(self, highscore, countdown_timer):
+        """Measure HUD texts for the given values, and send changed text rectangles to spawn restrictions
+
+        Parameters:
+            highscore (int):            Highscore shown in HUD
+            countdown_timer (float):    Countdown timer shown in HUD
+        Returns:
+            None
+        """
+        if highscore != self.hud_highscore:
+            self.hud_highscore = highscore
+            self.spawn_restrictions.set_hud_rect("highscore", self.measure_hud_text("highscore", highscore))
+        if countdown_timer != self.hud_countdown_timer:
+            self.hud_countdown_timer = countdown_timer
+            self.spawn_restrictions.set_hud_rect("countdown_timer", self.measure_hud_text("countdown_timer", countdown_timer))
+
+    def step(self, dt, input_bits=None):
+        """Run one simulation tick (Player movement, timers, spawning and collision)
+
+        Parameters:
+            dt (float):         Time step (in seconds)
+            input_bits (int):   Player input bitmask (Default: None = Read keyboard) (See 'Player.INPUT_UP' etc.)
+        Returns:
+            List of events that happened during the step (list) [Reused: Cleared on next step]
+        """
+        self.events.clear()
+        frame_timer = self.frame_timer
+
+        self.player_group.update(dt, input_bits) # Update player (Updates player)
+        self.apple_group.update(dt)              # Update apple(s) (Updates all sprites within group, e.g., apple(s))
+        if frame_timer is not None:
+            frame_timer.mark(FrameTimer.PHASE_SPRITES)
+
+        # Countdown timer: Tracks the remaining time before the game ends
+        self.elapsed_time += dt # Simulated time since game start
+        self.countdown_timer_value = round(self.countdown_start_timer_value - self.elapsed_time, 1) # Start countdown timer from default value
+
+        # If countdown timer reaches 0, end game (Driver resets the game when it is done with the final score)
+        if self.countdown_timer_value <= 0:
+            self.events.append(self.EVENT_GAME_OVER)
+            return self.events
+
+        self.update_hud_rects() # Apples must not spawn on top of changed countdown timer text
+
+        self.timer_wheel.advance() # Fire timed events due at this tick (e.g. gold apple spawn/despawn check)
+        if frame_timer is not None:
+            frame_timer.mark(FrameTimer.PHASE_SPAWN)
+
+        # Store collisions between player and apple(s) in list
+        collision_list = self.get_collisions() # Returns list of collided sprites
+        for apple in collision_list: # Check which apple was collided with
+
+            # Collision with regular apple
+            if apple.type == "apple":
+                self.highscore_num += 1 # Increase highscore
+                self.update_hud_rects() # Apple must not spawn on top of changed highscore text
+                apple.respawn(rng=self.spawn_rng) # Respawn regular apple
+                self.collectible_grid.move(apple) # Update apple position in grid
+                self.countdown_start_timer_value += APPLE_TIME_BONUS # Increase countdown timer by bonus value
+                self.events.append(self.EVENT_APPLE_COLLECTED)
+
+            # Collision with gold apple
+            if apple.type == "gold_apple":
+                self.apple_group.remove(self.gold_apple) # Despawn gold apple
+                self.collectible_grid.remove(self.gold_apple) # Remove gold apple from grid
+                self.gold_apple_spawned = False # Update the gold apple spawn flag
+                self.highscore_num += 1 # Increase highscore
+                self.countdown_start_timer_value += GOLD_APPLE_TIME_BONUS # Increase countdown timer by bonus value
+                self.schedule_gold_apple_check() # Restart spawn timer (Next check one full interval after collection)
+                self.events.append(self.EVENT_GOLD_APPLE_COLLECTED)
+
+        if frame_timer is not None:
+            frame_timer.mark(FrameTimer.PHASE_COLLISION)
+        return self.events
+
+    def check_gold_apple(self):
+        """Gold apple spawn/despawn check (Timer callback: Runs every GOLD_APPLE_CHECK_INTERVAL simulated seconds)
+        Spawns the gold apple based on spawn chance, or despawns it if it is spawned
+        """
+        # Spawn gold apple
+        if self.gold_apple_spawned == False and self.gold_apple_rng.random() < (GOLD_APPLE_SPAWN_CHANCE/100): # Check if gold apple should spawn based on spawn chance
+            self.apple_group.add(self.gold_apple) # Spawn gold apple
+            self.gold_apple.respawn(rng=self.spawn_rng) # Spawn to random location
+            self.collectible_grid.insert(self.gold_apple) # Add gold apple to grid
+            self.gold_apple_spawned = True # Update the gold apple spawn flag
+            self.events.append(self.EVENT_GOLD_APPLE_SPAWNED)
+
+        # Despawn gold apple
+        elif self.gold_apple_spawned == True: # Check if gold apple is spawned
+            self.apple_group.remove(self.gold_apple) # Despawn gold apple
+            self.collectible_grid.remove(self.gold_apple) # Remove gold apple from grid
+            self.gold_apple_spawned = False # Update the gold apple spawn flag
+            self.events.append(self.EVENT_GOLD_APPLE_DESPAWNED)
+
+        self.gold_apple_timer = self.timer_wheel.schedule(self.gold_apple_check_interval_ticks, self.check_gold_apple) # Schedule next check
+
+    def schedule_gold_apple_check(self):
+        """Cancel pending gold apple check, and schedule the next one GOLD_APPLE_CHECK_INTERVAL seconds from now"""
+        self.timer_wheel.cancel(self.gold_apple_timer)
+        self.gold_apple_timer = self.timer_wheel.schedule(self.gold_apple_check_interval_ticks, self.check_gold_apple)
+
+    @staticmethod
+    def get_gold_apple_check_interval_ticks(tick_rate):
+        """Get ticks between gold apple spawn/despawn checks at a tick rate
+
+        Parameters:
+            tick_rate (int): Simulation ticks per simulated second
+        Returns:
+            Ticks per GOLD_APPLE_CHECK_INTERVAL (At least 1) (int)
+        """
+        return max(1, round(GOLD_APPLE_CHECK_INTERVAL * tick_rate))
+
+    def set_tick_rate(self, tick_rate):
+        """Set the simulation tick rate the engine is stepped at (Used by headless runs and replays of recorded tick rates)
+        Timed game events are scheduled in ticks, so the gold apple check interval is converted to ticks at this rate.
+        A pending gold apple check keeps its remaining time (in seconds)
+
+        Parameters:
+            tick_rate (int): Simulation ticks per simulated second
+        Returns:
+            None
+        """
+        if tick_rate == self.tick_rate:
+            return
+        if self.gold_apple_timer is not None and self.gold_apple_timer.is_pending() == True:
+            remaining_ticks = self.gold_apple_timer.due_tick - self.timer_wheel.tick
+            self.timer_wheel.cancel(self.gold_apple_timer)
+            self.gold_apple_timer = self.timer_wheel.schedule(max(1, round(remaining_ticks * tick_rate / self.tick_rate)), self.check_gold_apple)
+        self.tick_rate = tick_rate
+        self.gold_apple_check_interval_ticks = self.get_gold_apple_check_interval_ticks(tick_rate)
+
+    def cancel_timers(self):
+        """Cancel all timed game events (Used when the main screen is left: Nothing happens until the next 'reset')"""
+        self.timer_wheel.cancel_all()
+        self.gold_apple_timer = None
+
+    def get_collisions(self):
+        """Find apple(s) colliding with player
+        Only collectibles in grid cells near the player are checked. With SWEPT_COLLISION, the player rectangle is
+        checked over its movement since the last tick (See 'SpatialGrid.query_sweep'). With PRECISE_COLLISION,
+        rectangle hits are confirmed with the collision masks (Transparent pixels do not count as hits)
+
+        Returns:
+            List of collided apple(s) (list)
+        """
+        player = self.player
+        if SWEPT_COLLISION == True:
+            # Movement of player rectangle during last tick (Same rounding as 'Player.move')
+            start_rect = self.sweep_start_rect
+            start_rect.center = (round(player.previous_position.x), round(player.previous_position.y))
+            dx, dy = player.rect.x - start_rect.x, player.rect.y - start_rect.y
+            collision_list = self.collectible_grid.query_sweep(start_rect, dx, dy) # Rectangle overlap along movement (Cheap prefilter)
+            if PRECISE_COLLISION == True and collision_list:
+                collision_list = [apple for apple in collision_list if self.is_precise_sweep_hit(apple, start_rect, dx, dy) == True]
+        else:
+            collision_list = self.collectible_grid.query(player.rect) # Rectangle overlap (Cheap prefilter)
+            if PRECISE_COLLISION == True and collision_list:
+                player_x, player_y = player.rect.topleft
+                collision_list = [apple for apple in collision_list
+                                  if player.mask.overlap(apple.mask, (apple.rect.x - player_x, apple.rect.y - player_y)) is not None]
+
+        # Grid cells are sets (Order depends on memory addresses): Handle collisions in a fixed order, so games are reproducible
+        if len(collision_list) > 1:
+            collision_list.sort(key=self.collision_order.__getitem__)
+        return collision_list
+
+    def is_precise_sweep_hit(self, apple, start_rect, dx, dy):
+        """Confirm a swept rectangle hit with the collision masks
+        Masks are checked at the end position, and at the position of deepest overlap along the movement
+
+        Parameters:
+            apple (Apple):              Collectible hit by player rectangle
+            start_rect (pygame.Rect):   Player rectangle at start of movement
+            dx (int):                   Player movement along x-axis (in pixels)
+            dy (int):                   Player movement along y-axis (in pixels)
+        Returns:
+            True if masks overlap (bool)
+        """
+        player = self.player
+        if player.mask.overlap(apple.mask, (apple.rect.x - player.rect.x, apple.rect.y - player.rect.y)) is not None:
+            return True
+
+        sweep_interval = SpatialGrid.get_sweep_interval(start_rect, dx, dy, apple.rect)
+        if sweep_interval is None:
+            return False
+        sweep_time = (max(sweep_interval[0], 0) + min(sweep_interval[1], 1)) / 2 # Middle of overlap
+        player_x = start_rect.x + round(dx * sweep_time)
+        player_y = start_rect.y + round(dy * sweep_time)
+        return player.mask.overlap(apple.mask, (apple.rect.x - player_x, apple.rect.y - player_y)) is not None
+
+    def get_state_hash(self, previous_hash=0):
+        """Get hash of game state (CRC-32 of packed state values)
+        Hashes can be chained over ticks (Pass hash of previous tick), so a single hash covers every tick of a game
+
+        Parameters:
+            previous_hash (int): Hash of previous tick (Default: 0 = First tick)
+        Returns:
+            State hash (int)
+        """
+        player_position = self.player.position
+        gold_apple_check_tick = self.get_gold_apple_check_tick()
+        state_hash = zlib.crc32(self.STATE_HASH_STRUCT.pack(
+            player_position.x, player_position.y,
+            self.apple.rect.x, self.apple.rect.y,
+            self.gold_apple.rect.x, self.gold_apple.rect.y,
+            self.highscore_num, self.countdown_start_timer_value, self.elapsed_time,
+            gold_apple_check_tick - self.timer_wheel.tick if gold_apple_check_tick != 0 else 0, self.gold_apple_spawned), previous_hash)
+        for apple in self.extra_apples:
+            state_hash = zlib.crc32(self.APPLE_STATE_HASH_STRUCT.pack(apple.rect.x, apple.rect.y), state_hash)
+        return state_hash
+
+    def get_gold_apple_check_tick(self):
+        """Get tick of next gold apple spawn/despawn check
+
+        Returns:
+            Tick of next check (0 = No check scheduled) (int)
+        """
+        if self.gold_apple_timer is not None and self.gold_apple_timer.is_pending() == True:
+            return self.gold_apple_timer.due_tick
+        return 0
+
+    def get_snapshot_size(self):
+        """Get size of game state snapshots (Fixed for the number of apples and the random number backend)
+
+        Returns:
+            Snapshot size (in bytes) (int)
+        """
+        return (self.SNAPSHOT_STRUCT.size + Player.SNAPSHOT_STRUCT.size + (2 + len(self.extra_apples)) * Apple.SNAPSHOT_STRUCT.size
+                + self.rng.get_snapshot_size())
+
+    def write_snapshot(self, buffer, offset=0):
+        """Write game state into a byte buffer: Engine values, player, apples and random number streams
+
+        Parameters:
+            buffer (bytearray): Buffer to write into
+            offset (int):       Position in buffer (in bytes)
+        Returns:
+            Position after game state (int)
+        """
+        self.SNAPSHOT_STRUCT.pack_into(buffer, offset, self.countdown_start_timer_value, self.elapsed_time, self.countdown_timer_value,
+                                       self.timer_wheel.tick, self.get_gold_apple_check_tick(), self.highscore_num, self.gold_apple_spawned,
+                                       self.hud_highscore, self.hud_countdown_timer)
+        offset += self.SNAPSHOT_STRUCT.size
+        offset = self.player.write_snapshot(buffer, offset)
+        offset = self.apple.write_snapshot(buffer, offset)
+        offset = self.gold_apple.write_snapshot(buffer, offset)
+        for apple in self.extra_apples:
+            offset = apple.write_snapshot(buffer, offset)
+        return self.rng.write_snapshot(buffer, offset)
+
+    def read_snapshot(self, buffer, offset=0):
+        """Read game state from a byte buffer written by 'write_snapshot' (Spawned collectibles are moved in the collision grid)
+
+        Parameters:
+            buffer (bytes):     Buffer to read from
+            offset (int):       Position in buffer (in bytes)
+        Returns:
+            Position after game state (int)
+        """
+        (self.countdown_start_timer_value, self.elapsed_time, self.countdown_timer_value, tick, gold_apple_check_tick,
+         self.highscore_num, self.gold_apple_spawned, hud_highscore, hud_countdown_timer) = self.SNAPSHOT_STRUCT.unpack_from(buffer, offset)
+        offset += self.SNAPSHOT_STRUCT.size
+
+        # Schedule timers again (Pending timers of current state are cancelled)
+        self.timer_wheel.reset(tick)
+        self.gold_apple_timer = None
+        if gold_apple_check_tick != 0:
+            self.gold_apple_timer = self.timer_wheel.schedule_at(gold_apple_check_tick, self.check_gold_apple)
+        self.set_hud_values(hud_highscore, hud_countdown_timer) # Only measured again if a HUD text changed
+
+        offset = self.player.read_snapshot(buffer, offset)
+        offset = self.apple.read_snapshot(buffer, offset)
+        self.collectible_grid.move(self.apple)
+
+        # Spawn or despawn gold apple
+        offset = self.gold_apple.read_snapshot(buffer, offset)
+        if self.gold_apple_spawned == True:
+            self.apple_group.add(self.gold_apple)
+            self.collectible_grid.insert(self.gold_apple) # Moved if already in grid
+        else:
+            self.apple_group.remove(self.gold_apple)
+            self.collectible_grid.remove(self.gold_apple)
+
+        for apple in self.extra_apples:
+            offset = apple.read_snapshot(buffer, offset)
+            self.collectible_grid.move(apple)
+        return self.rng.read_snapshot(buffer, offset)
+
+    def snapshot(self, buffer=None):
+        """Save game state (See 'write_snapshot')
+
+        Parameters:
+            buffer (bytearray): Buffer to reuse (Default: None = Create new buffer) [Must have snapshot size]
+        Returns:
+            Snapshot (bytearray)
+        """
+        if buffer is None:
+            buffer = bytearray(self.get_snapshot_size())
+        self.write_snapshot(buffer)
+        return buffer
+
+    def restore(self, snapshot):
+        """Restore game state saved with 'snapshot' (Snapshot can be restored any number of times)
+
+        Parameters:
+            snapshot (bytes): Snapshot
+        Returns:
+            None
+        Raises:
+            ValueError: If the snapshot size does not match (e.g. other number of apples)
+        """
+        if len(snapshot) != self.get_snapshot_size():
+            raise ValueError(f"Snapshot has {len(snapshot)} bytes, but game state has {self.get_snapshot_size()} bytes")
+        self.read_snapshot(snapshot)
+
+    def get_bot_input(self):
+        """Simple bot: Move towards gold apple if spawned, otherwise towards regular apple (Used for headless runs)
+
+        Returns:
+            Input bitmask (int)
+        """
+        target = self.gold_apple if self.gold_apple_spawned == True else self.apple
+        input_bits = 0
+
+        # Move along an axis until target is within a few pixels (Prevents jittering around target)
+        if target.rect.centerx < self.player.rect.centerx - 2:
+            input_bits |= Player.INPUT_LEFT
+        elif target.rect.centerx > self.player.rect.centerx + 2:
+            input_bits |= Player.INPUT_RIGHT
+        if target.rect.centery < self.player.rect.centery - 2:
+            input_bits |= Player.INPUT_UP
+        elif target.rect.centery > self.player.rect.centery + 2:
+            input_bits |= Player.INPUT_DOWN
+        return input_bits
+
+
+def run_headless(ticks=SIMULATION_TICK_RATE * 60, tick_rate=SIMULATION_TICK_RATE, engine=None):
+    """Run the game rules headless on simulated time (No window, no audio, no sleeping)
+    The player is controlled by the engine bot. A new game is started every time a game ends
+
+    Parameters:
+        ticks (int):            Number of simulation ticks to run (Default: 60 simulated seconds)
+        tick_rate (int):        Simulation ticks per simulated second
+        engine (GameEngine):    Engine to step (Default: None = Create new engine)
+    Returns:
+        A dictionary with games played, scores, ticks run and ticks per second (dict)
+    """
+    if engine is None:
+        engine = GameEngine(tick_rate=tick_rate)
+    engine.set_tick_rate(tick_rate) # Timed game events in ticks of this rate
+    dt = 1 / tick_rate
+
+    scores = [] # Final score of each finished game
+    start_time = time.perf_counter()
+
+    for tick in range(ticks):
+        events = engine.step(dt, engine.get_bot_input())
+        if GameEngine.EVENT_GAME_OVER in events:
+            scores.append(engine.highscore_num)
+            engine.reset()
+
+    run_time = time.perf_counter() - start_time
+    return {
+        "games": len(scores),
+        "scores": scores,
+        "ticks": ticks,
+        "run_time": run_time,
+        "ticks_per_second": ticks / run_time if run_time > 0 else 0,
+    }
@@ -4,169 +4,404 @@
 Game Logic Class
 
 This class handles the core game logic, managing the main game loop and event handling.
-It initializes and updates game components like the game screen, player, apples, and gold apples,
-manages the countdown timer, highscore, and gold apple spawn/despawn logic, and processes user input.
+The game loop runs the game logic with a fixed time step, independent of the frame rate (See 'update').
+It initializes and updates game components like the game screen and the game engine (See 'GameEngine'),
+which contains the game rules (countdown timer, highscore, gold apple spawn/despawn logic, collision).
+The game loop plays sounds for engine events, and changes screens.
+
+All random numbers come from one seeded session RNG (See 'SessionRNG' and '--seed' in main.py): Every game is started
+with a seed drawn from it (See 'prepare_game'), and player input is read once per tick and passed to the
+engine, so games can be recorded (RECORD_SESSIONS) and replayed headless (See 'game_components.replay').
+Menu input is not recorded: It does not change the game state.
+
+The game state (Engine, HUD values, active screen and random number streams) can be saved and restored in
+microseconds (See 'snapshot' and 'restore'), e.g. for practice save states. Session recordings are not part of it.
+
+With IDLE_RENDERING, idle menus block on the event queue instead of drawing every frame, and the game is paused while
+the window is unfocused or minimized (See 'update'), so an idle game uses almost no CPU time.
+
+F3 toggles the performance HUD (See 'PerfHUD'): While it is shown, every phase of a frame is timed into a ring buffer
+(See 'FrameTimer'), and idle rendering is paused so every frame is drawn. While it is hidden, frames are only timed
+if the hitch watchdog is enabled.
+
+With HITCH_WATCHDOG, the first frame of every hitch incident (Frames over the hitch budget) is written to the hitch log
+with its slowest phase, garbage collections, active screen, entity counts and frame history, followed by a summary when
+the incident ends (See 'HitchWatchdog' and 'get_hitch_context').
+Idle frames (Waiting for events) are not checked.
+
+Every frame and its phases are traced as spans, with the number of simulation ticks per frame as a counter
+(See 'tracer', enabled with '--trace' in main.py).
 """
 
+import gc
 import pygame
-import random
+import struct
 import sys
+import time
 # Game settings
-from config import SCREEN_WIDTH, SCREEN_HEIGHT, FRAME_RATE, GAME_TITLE, COUNTDOWN_DEFAULT_START_TIMER_VALUE, APPLE_TIME_BONUS, GOLD_APPLE_TIME_BONUS, GOLD_APPLE_CHECK_INTERVAL, GOLD_APPLE_SPAWN_CHANCE
-# Sound paths + Game icon image path
-from config import PURPLE_APPLE_COLLISION_SOUND_PATH, GOLD_APPLE_COLLISION_SOUND_PATH, GOLD_APPLE_SPAWN_SOUND_PATH, GAME_ICON_IMAGE_PATH
-from game_components.ui import GameScreen
-from game_components.character import Player
-from game_components.collectibles import Apple, GoldApple
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, FRAME_RATE, SIMULATION_TICK_RATE, MAX_FRAME_TIME, GAME_TITLE
+# Game icon image path
+from config import GAME_ICON_IMAGE_PATH
+# Session recording settings
+from config import RECORD_SESSIONS, SESSION_RECORDING_FOLDER_PATH
+# Input settings
+from config import INPUT_LATENCY_STATS
+# Rendering settings
+from config import IDLE_RENDERING, IDLE_WAIT_TIMEOUT, UNFOCUSED_WAIT_TIMEOUT
+# Performance HUD settings
+from config import PERF_HUD_VISIBLE
+# Hitch watchdog settings
+from config import HITCH_WATCHDOG
+from game_components.assets import assets
+from game_components.ui import GameScreen, InputHandler, PerfHUD
+from game_components.core.game_engine import GameEngine
+from game_components.core.frame_timer import FrameTimer
+from game_components.diagnostics.tracer import tracer
+from game_components.diagnostics.hitch_watchdog import HitchWatchdog
+from game_components.ui.text_cache import text_cache
+from game_components.core.session_rng import SessionRNG
+from game_components.replay import SessionRecorder
 
 
 class Game():
 
-    def __init__(self):
-        """Initialize game components and variables"""
+    # Snapshot layout of game loop values: Time not yet simulated, engine reset for next game
+    # (Followed by game screen, engine and session random number streams: See 'write_snapshot')
+    SNAPSHOT_STRUCT = struct.Struct("<d?")
+
+    # Key toggling the performance HUD
+    PERF_HUD_KEY = pygame.K_F3
+
+    def __init__(self, seed=None):
+        """Initialize game components and variables
+
+        Parameters:
+            seed (int): Session seed (Default: None = Random seed) [Same seed = Same games for the same input]
+        """
         pygame.init() # Initialize pygame
 
+        # Session RNG: One random number stream per purpose, all derived from the session seed
+        self.session_rng = SessionRNG(seed)
+        self.game_seed_rng = self.session_rng.get_stream("games") # Seeds of games
+
         # Create the screen surface and set the window dimensions
         pygame.display.set_caption(GAME_TITLE) # Set window caption
-        pygame.display.set_icon(pygame.image.load(GAME_ICON_IMAGE_PATH)) # Set window icon
+        pygame.display.set_icon(assets.get_image(GAME_ICON_IMAGE_PATH)) # Set window icon
         screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         
         
         # Create a clock object to control the frame rate
         self.clock = pygame.time.Clock()
 
-        # Get current time since game start
-        self.game_start_time = round(pygame.time.get_ticks() / 1000, 1) # Convert to seconds with one decimal
-
-        # Set default start value for countdown timer
-        self.countdown_start_timer_value = COUNTDOWN_DEFAULT_START_TIMER_VALUE
-
-        # Initialize gold apple spawn timer (Used to check if gold apple should spawn/despawn)
-        self.gold_apple_spawn_start_time = self.game_start_time # Same value as game_start_time
-
-        # Create gold apple spawn flag (Used to check whether gold apple should spawn/despawn)
-        self.gold_apple_spawned = False
+        # Fixed time step simulation (Game logic runs at SIMULATION_TICK_RATE, independent of FRAME_RATE)
+        self.tick_time = 1 / SIMULATION_TICK_RATE # Time step of one simulation tick (in seconds)
+        self.frame_time = 0 # Time passed since last frame (in seconds)
+        self.accumulator = 0 # Time not yet simulated (in seconds)
+        self.simulation_ticks = 0 # Simulation ticks run in current frame
 
-        # Create highscore counter
-        self.highscore_num = 0
+        # Input handler: Reads key presses from the event queue once per frame (Used by menus)
+        self.input_handler = InputHandler()
 
         # Create game screen object: Used to manage game screens
-        self.game_screen = GameScreen(screen) # Needs a screen surface as argument
+        self.game_screen = GameScreen(screen, rng=self.session_rng.get_stream("backgrounds"), input_handler=self.input_handler) # Needs a screen surface as argument
 
-        # Player setup
-        self.player = Player() # Create player
-        self.player_group = pygame.sprite.GroupSingle() # Create SingleGroup (Used to store single sprite)
-        self.player_group.add(self.player) # Add player to group
-        
-        # Apple(s) setup
-        self.apple = Apple() # Create apple
-        self.gold_apple = GoldApple() # Create gold apple
-        self.apple_group = pygame.sprite.Group() # Create sprite group (Used to store multiple sprites)
-        self.apple_group.add(self.apple) # Add apple to group
+        # Create game engine: Contains game rules and game state (Creates player and apple(s))
+        self.engine = GameEngine()
+
+        # Player and apple(s) from game engine (Used to draw sprites and play sounds)
+        self.player = self.engine.player
+        self.player_group = self.engine.player_group
+        self.apple = self.engine.apple
+        self.gold_apple = self.engine.gold_apple
+        self.apple_group = self.engine.apple_group
 
         # Send sprites groups to game screen (Used to draw sprites)
         self.game_screen.retrieve_sprites(player_group=self.player_group, sprite_group=self.apple_group)
+        self.game_screen.on_screen_change = self.handle_screen_change # Cancel timed game events on screen changes
+
+        # Session recorder (Records seed and player input of every game)
+        self.session_recorder = None
+        if RECORD_SESSIONS == True:
+            session_path = f"{SESSION_RECORDING_FOLDER_PATH}session_{time.strftime('%Y%m%d_%H%M%S')}.adrs"
+            self.session_recorder = SessionRecorder(session_path, SessionRNG.BACKEND, tick_rate=SIMULATION_TICK_RATE)
+        self.game_prepared = False # Engine was reset for next game
+
+        # Performance HUD: Frame phase timings (Only measured while the HUD is shown or the hitch watchdog is enabled)
+        self.frame_timer = FrameTimer()
+        self.perf_hud = PerfHUD(self.frame_timer, SCREEN_WIDTH)
+        self.perf_hud_visible = False
+        self.hitch_watchdog = HitchWatchdog() if HITCH_WATCHDOG == True else None # Writes hitch incidents to the hitch log
+        self.active_frame_timer = None # Frame timer timing current frames (None = Frames are not timed)
+        self.set_frame_timer()
+        if PERF_HUD_VISIBLE == True:
+            self.toggle_perf_hud()
+
+        # Free unscaled image files (All images have been loaded and scaled at this point)
+        assets.release_files()
 
         # Use 'screen_manager' to change screens
         self.game_screen.screen_manager("start_screen") # Change to start screen (Default screen) 
 
     # Update function (Game loop = Needs to run constantly)
     def update(self):
-        """Run the game loop"""
-        
-        self.game_screen.update_frame() # Update screen frame on active screen (Used to draw sprites and text)
-        self.player_group.update()      # Update player (Updates player)
-        self.apple_group.update()       # Update apple(s) (Updates all sprites within group, e.g., apple(s))
+        """Run the game loop
+        Game logic runs with a fixed time step (See 'simulate'), independent of the frame rate.
+        Time since last frame is collected in an accumulator, and one simulation tick is run for every full
+        time step in it. The time left in the accumulator is used to interpolate the player position when drawing
+
+        With IDLE_RENDERING, menus without new input wait for the next event (Up to IDLE_WAIT_TIMEOUT) and are not
+        drawn again, and an unfocused or minimized window waits up to UNFOCUSED_WAIT_TIMEOUT per frame (Game paused)
+        """
+        tracer.begin("Game.update")
+        on_main_screen = self.game_screen.active_game_screen == "main_screen"
+        frame_timer = self.active_frame_timer
+        if frame_timer is not None:
+            frame_timer.start_frame()
+        if self.hitch_watchdog is not None:
+            self.hitch_watchdog.start_frame()
+
+        tracer.begin("Events")
+        idle = False # Nothing to simulate: Wait for events instead of running frames
+        if IDLE_RENDERING == True and self.perf_hud_visible == False: # Every frame is drawn while the HUD is shown
+            if self.input_handler.window_active == False:
+                idle = True
+                self.input_handler.wait(UNFOCUSED_WAIT_TIMEOUT, collect_menu_inputs=on_main_screen == False)
+            elif on_main_screen == False and self.game_screen.redraw_needed == False and not self.input_handler.menu_inputs:
+                idle = True
+                self.input_handler.wait(IDLE_WAIT_TIMEOUT)
+
+        # Handle events (Menu key presses are queued for the menus)
+        if idle == False:
+            self.input_handler.pump(collect_menu_inputs=on_main_screen == False)
+        tracer.end()
+        if frame_timer is not None:
+            frame_timer.mark(FrameTimer.PHASE_EVENTS)
+
+        # Toggle performance HUD
+        if self.PERF_HUD_KEY in self.input_handler.pressed_keys:
+            self.toggle_perf_hud()
+
+        # If the user clicks the 'X' button, exit the game
+        if self.input_handler.quit_requested == True:
+            if self.session_recorder is not None and self.game_screen.active_game_screen == "main_screen":
+                self.session_recorder.end_game(self.engine.highscore_num, completed=False) # Save game in progress
+            if INPUT_LATENCY_STATS == True:
+                print("\n".join(self.input_handler.format_latency_stats())) # Input-to-photon latency per screen
+            tracer.end() # End frame span (Trace file is written at exit)
+            pygame.quit() # Quit pygame
+            sys.exit() # Exit script
+
+        # Pause game while window is unfocused or minimized
+        if IDLE_RENDERING == True and self.input_handler.window_active == False:
+            self.accumulator = 0 # Time passed while paused is not simulated
 
         # Check if main screen is active
-        if self.game_screen.active_game_screen == "main_screen":
-
-            # Countdown timer: Tracks the remaining time before the game ends
-            current_time = round(pygame.time.get_ticks() / 1000, 1) # Get current time
-            elapsed_time = round(current_time - self.game_start_time, 1) # Calculate elapsed time since game start
-            self.countdown_timer_value = round(self.countdown_start_timer_value - elapsed_time, 1) # Start countdown timer from default value
-
-            # Calculate time passed since last check for gold apple spawn
-            gold_apple_spawn_time_passed = round(current_time - self.gold_apple_spawn_start_time, 1) 
-
-            # Send updated text values to game screen
-            self.game_screen.update_text(text_to_update="highscore", new_text_value=self.highscore_num) # Highscore
-            self.game_screen.update_text(text_to_update="countdown_timer", new_text_value=self.countdown_timer_value) # Countdown timer
-
-            # Cache position and size of texts in game_screen class (Used to create bouandaries arond texts)
-            highscore_boundaries = self.game_screen.cache_text_info(return_text_info="highscore") # Cache highscore
-            countdown_timer_boundaries = self.game_screen.cache_text_info(return_text_info="countdown_timer") # Cache countdown timer
-            # Get player boundaries (Used to create boundaries around player)
-            player_boundaries = self.player.get_player_boundaries()
-            # Create dictionary to store values (Used to create apple-spawn restrictions)
-            self.spawn_restrictions = {"highscore": highscore_boundaries, "countdown_timer": countdown_timer_boundaries, "player": player_boundaries}
-            # Send spawn restrictions to apple(s) classes
-            self.apple.update_spawn_restrictions(self.spawn_restrictions) # Send to apple class
-            self.gold_apple.update_spawn_restrictions(self.spawn_restrictions) # Send to gold apple class
-
-            # If countdown timer reaches 0, end game
-            if self.countdown_timer_value <= 0:
-                self.game_screen.screen_manager("end_screen") # Change to end screen
-                self.countdown_start_timer_value = COUNTDOWN_DEFAULT_START_TIMER_VALUE # Reset countdown timer to default value
-                self.highscore_num = 0 # Reset highscore
-                self.player.respawn() # Respawn player to default position
-                self.apple.respawn(default_spawn_location=True) # Respawn apple to default position
-                self.gold_apple.respawn() # Respawn gold apple to random position
-
-            # Perform gold apple spawn/despawn check
-            if gold_apple_spawn_time_passed >= GOLD_APPLE_CHECK_INTERVAL: # Add check interval to gold apple spawn timer
-                self.gold_apple_spawn_start_time = current_time # Update last check time for gold apple spawn/despawn to current time
-            
-                # Spawn gold apple
-                if self.gold_apple_spawned == False and random.random() < (GOLD_APPLE_SPAWN_CHANCE/100): # Check if gold apple should spawn based on spawn chance
-                    self.gold_apple.spawn_sound.play() # Play spawn sound
-                    self.apple_group.add(self.gold_apple) # Spawn gold apple
-                    self.gold_apple.respawn() # Spawn to random location
-                    self.gold_apple_spawned = True # Update the gold apple spawn flag
-
-                # Despawn gold apple
-                elif self.gold_apple_spawned == True: # Check if gold apple is spawned
-                    self.apple_group.remove(self.gold_apple) # Despawn gold apple
-                    self.gold_apple_spawned = False # Update the gold apple spawn flag
-
-            # Store collisions between player and apple(s) in list
-            collision_list = pygame.sprite.spritecollide(self.player_group.sprite, self.apple_group, False) # Returns list of collided sprites
-            if collision_list != None: # If there is a collision
-                for apple in collision_list: # Check which apple was collided with
-
-                    # Collision with regular apple
-                    if apple.type == "apple":
-                        self.apple.collision_sound.play() # Play collision sound
-                        self.apple.respawn() # Respawn regular apple
-                        self.highscore_num += 1 # Increase highscore
-                        self.countdown_start_timer_value += APPLE_TIME_BONUS # Increase countdown timer by bonus value
-                    
-                    # Collision with gold apple
-                    if apple.type == "gold_apple":
-                        self.gold_apple.collision_sound.play() # Play collision sound
-                        self.apple_group.remove(self.gold_apple) # Despawn gold apple
-                        self.gold_apple_spawned = False # Update the gold apple spawn flag
-                        self.highscore_num += 1 # Increase highscore
-                        self.countdown_start_timer_value += GOLD_APPLE_TIME_BONUS # Increase countdown timer by bonus value
+        elif self.game_screen.active_game_screen == "main_screen":
+
+            # Run simulation ticks for time passed since last frame
+            self.accumulator += self.frame_time
+            self.simulation_ticks = 0
+            tracer.begin("Simulation")
+            while self.accumulator >= self.tick_time:
+                self.simulate(self.tick_time)
+                self.accumulator -= self.tick_time
+                self.simulation_ticks += 1
+
+                # Stop simulating if game ended
+                if self.game_screen.active_game_screen != "main_screen":
+                    self.accumulator = 0
+                    break
+            tracer.end()
+            tracer.counter("Simulation ticks", self.simulation_ticks)
+
+            # Interpolate player position between the last two ticks (Used for drawing)
+            self.player.interpolate(self.accumulator / self.tick_time)
 
         # If main screen is not active
         else:
-            self.game_start_time = round(pygame.time.get_ticks() / 1000, 1) # Reset current time since game start
-            self.countdown_timer_value = 0 # Reset countdown timer value
-            self.player.respawn() # Respawn player to default position
-            self.apple_group.remove(self.gold_apple) # Despawn gold apple
-            self.gold_apple_spawned = False # Update the gold apple spawn flag
-        
+            self.accumulator = 0 # Reset simulation time
+            self.simulation_ticks = 0
+            if self.game_prepared == False:
+                self.prepare_game() # Reset game state (Game starts from default state when main screen is entered)
+
+        # Draw frame (Idle frames are only drawn if something changed)
+        if idle == False or self.game_screen.redraw_needed == True or self.input_handler.redraw_requested == True or self.input_handler.menu_inputs:
+            self.game_screen.redraw_needed = False # Set again by screen changes and menu inputs while drawing
+            self.input_handler.redraw_requested = False
+            if frame_timer is not None:
+                frame_timer.mark(FrameTimer.PHASE_LOGIC) # Time since last engine step
+            self.game_screen.update_frame() # Update screen frame on active screen (Used to draw sprites and text)
+            if frame_timer is not None:
+                frame_timer.mark(FrameTimer.PHASE_DRAW)
+
+            # Update the display to show the new frame (Draws performance HUD on top)
+            with tracer.span("GameScreen.present"):
+                self.game_screen.present()
+            self.input_handler.frame_presented() # Measure latency of menu inputs shown in this frame
+            if frame_timer is not None:
+                frame_timer.mark(FrameTimer.PHASE_FLIP)
+
+        # Control the frame rate and store time passed (Used by simulation next frame)
+        with tracer.span("Clock.tick"):
+            self.frame_time = min(self.clock.tick(FRAME_RATE) / 1000, MAX_FRAME_TIME) # Convert to seconds
+        if idle == True:
+            self.frame_time = 0 # Time spent waiting is not simulated (e.g. when a menu starts a game)
+        if frame_timer is not None and idle == False: # Idle frames are not stored (Time spent waiting is not a hitch)
+            frame_timer.mark(FrameTimer.PHASE_SLEEP)
+            frame_timer.end_frame()
+            if self.hitch_watchdog is not None:
+                self.hitch_watchdog.check_frame(frame_timer, self.get_hitch_context)
+        tracer.end()
+
+    def toggle_perf_hud(self):
+        """Show or hide the performance HUD (Frames are only timed while it is shown or the hitch watchdog is enabled)"""
+        self.perf_hud_visible = not self.perf_hud_visible
+        if self.perf_hud_visible == True and self.hitch_watchdog is None:
+            self.frame_timer.reset() # Timings from before the HUD was hidden are not shown
+        self.set_frame_timer()
+        self.game_screen.set_overlay(self.perf_hud if self.perf_hud_visible == True else None)
+
+    def set_frame_timer(self):
+        """Time frames with the frame timer while the performance HUD is shown or the hitch watchdog is enabled"""
+        frame_timer = self.frame_timer if self.perf_hud_visible == True or self.hitch_watchdog is not None else None
+        self.active_frame_timer = frame_timer
+        self.engine.frame_timer = frame_timer
+        self.game_screen.frame_timer = frame_timer
+
+    def get_hitch_context(self):
+        """Get game context of a frame hitch (Written to the hitch log by the hitch watchdog when an incident starts)
+
+        Returns:
+            Active screen and entity counts (dict)
+        """
+        return {
+            "screen": self.game_screen.active_game_screen,
+            "simulation_ticks": self.simulation_ticks, # Ticks run in the hitched frame
+            "apples": len(self.apple_group),
+            "gold_apple_spawned": self.engine.gold_apple_spawned,
+            "pending_timers": self.engine.timer_wheel.pending_count,
+            "menu_inputs": len(self.input_handler.menu_inputs),
+            "text_surfaces": len(text_cache.surfaces),
+            "highscore": self.engine.highscore_num,
+            "gc_counts": list(gc.get_count()), # Allocations and collections counted towards the next collection per generation
+        }
+
+    def handle_screen_change(self, previous_screen, active_screen):
+        """Cancel timed game events of the engine when the main screen is left (Scheduled again by 'prepare_game'),
+        and drop menu key presses meant for the previous screen
+
+        Parameters:
+            previous_screen (str):  Screen before change
+            active_screen (str):    Screen after change
+        Returns:
+            None
+        """
+        if previous_screen == "main_screen" and active_screen != "main_screen":
+            self.engine.cancel_timers()
+        self.input_handler.clear_menu_inputs()
+
+    def prepare_game(self):
+        """Reset game state with a new seed for the next game (Starts recording the game if RECORD_SESSIONS is enabled)"""
+        seed = self.game_seed_rng.getrandbits(64) # Seed of next game
+        self.engine.reset(seed)
+        if self.session_recorder is not None:
+            self.session_recorder.start_game(seed)
+        self.game_prepared = True
+
+    def simulate(self, dt):
+        """Run one simulation tick of the main screen with the game engine, and handle its events
+
+        Parameters:
+            dt (float): Time step (in seconds)
+        Returns:
+            None
+        """
+        input_bits = self.player.keyboard_input() # Read player input once per tick
+        if self.engine.frame_timer is not None:
+            self.engine.frame_timer.mark(FrameTimer.PHASE_LOGIC) # Time since last mark is game logic (Engine marks its own phases)
+        events = self.engine.step(dt, input_bits)
+        if self.session_recorder is not None:
+            self.session_recorder.record_tick(input_bits, self.engine) # Record input and state hash of tick
+
+        # Send updated text values to game screen
+        self.game_screen.update_text(text_to_update="highscore", new_text_value=self.engine.highscore_num) # Highscore
+        self.game_screen.update_text(text_to_update="countdown_timer", new_text_value=self.engine.countdown_timer_value) # Countdown timer
+
         # Handle events
-        for event in pygame.event.get():
-            # If the user clicks the 'X' button, exit the game
-            if event.type == pygame.QUIT:
-                pygame.quit() # Quit pygame
-                sys.exit() # Exit script
+        for event in events:
+            if event == GameEngine.EVENT_APPLE_COLLECTED:
+                self.apple.collision_sound.play() # Play collision sound
+            elif event == GameEngine.EVENT_GOLD_APPLE_COLLECTED:
+                self.gold_apple.collision_sound.play() # Play collision sound
+            elif event == GameEngine.EVENT_GOLD_APPLE_SPAWNED:
+                self.gold_apple.spawn_sound.play() # Play spawn sound
+            elif event == GameEngine.EVENT_GAME_OVER:
+                self.game_screen.screen_manager("end_screen") # Change to end screen (Shows final highscore)
+                if self.session_recorder is not None:
+                    self.session_recorder.end_game(self.engine.highscore_num) # Save recorded game
+                self.game_prepared = False # Reset game state for next game (See 'update')
+
+    def get_snapshot_size(self):
+        """Get size of game snapshots
+
+        Returns:
+            Snapshot size (in bytes) (int)
+        """
+        return self.SNAPSHOT_STRUCT.size + GameScreen.SNAPSHOT_STRUCT.size + self.engine.get_snapshot_size() + self.session_rng.get_snapshot_size()
+
+    def write_snapshot(self, buffer, offset=0):
+        """Write game state into a byte buffer: Game loop values, game screen, engine and session random number streams
+
+        Parameters:
+            buffer (bytearray): Buffer to write into
+            offset (int):       Position in buffer (in bytes)
+        Returns:
+            Position after game state (int)
+        """
+        self.SNAPSHOT_STRUCT.pack_into(buffer, offset, self.accumulator, self.game_prepared)
+        offset += self.SNAPSHOT_STRUCT.size
+        offset = self.game_screen.write_snapshot(buffer, offset)
+        offset = self.engine.write_snapshot(buffer, offset)
+        return self.session_rng.write_snapshot(buffer, offset)
+
+    def read_snapshot(self, buffer, offset=0):
+        """Read game state from a byte buffer written by 'write_snapshot'
+
+        Parameters:
+            buffer (bytes):     Buffer to read from
+            offset (int):       Position in buffer (in bytes)
+        Returns:
+            Position after game state (int)
+        """
+        self.accumulator, self.game_prepared = self.SNAPSHOT_STRUCT.unpack_from(buffer, offset)
+        offset += self.SNAPSHOT_STRUCT.size
+        offset = self.game_screen.read_snapshot(buffer, offset)
+        offset = self.engine.read_snapshot(buffer, offset)
+        return self.session_rng.read_snapshot(buffer, offset)
+
+    def snapshot(self, buffer=None):
+        """Save game state (See 'write_snapshot')
 
+        Parameters:
+            buffer (bytearray): Buffer to reuse (Default: None = Create new buffer) [Must have snapshot size]
+        Returns:
+            Snapshot (bytearray)
+        """
+        if buffer is None:
+            buffer = bytearray(self.get_snapshot_size())
+        self.write_snapshot(buffer)
+        return buffer
 
-        # Update the display to show the new frame
-        pygame.display.flip()
+    def restore(self, snapshot):
+        """Restore game state saved with 'snapshot'
 
-        # Control the frame rate
-        self.clock.tick(FRAME_RATE)
\ No newline at end of file
+        Parameters:
+            snapshot (bytes): Snapshot
+        Returns:
+            None
+        Raises:
+            ValueError: If the snapshot size does not match
+        """
+        if len(snapshot) != self.get_snapshot_size():
+            raise ValueError(f"Snapshot has {len(snapshot)} bytes, but game state has {self.get_snapshot_size()} bytes")
+        self.read_snapshot(snapshot)
@@ -0,0 +1,270 @@
+# game_components/core/session_rng.py
+
+"""
+Session RNG Class
+
+This class provides seeded random number streams for a play session: One independent stream per purpose
+(e.g. apple spawn locations, gold apple spawn rolls, backgrounds), all derived from one seed (See 'get_stream').
+Streams are independent, so drawing more numbers for one purpose (e.g. more apples) does not change the numbers
+of another. The same seed gives the same numbers in every process, so runs can be reproduced (See '--seed' in main.py).
+
+Each stream pre-generates random numbers in blocks of RNG_BLOCK_SIZE with NumPy, and hands them out one at a time
+from a buffer (See 'RNGStream.random'). Without NumPy, streams fall back to Python's random module (Same interface,
+different numbers: See 'BACKEND').
+
+Note: Streams make runs reproducible, they do not make random numbers cheaper. A draw is a Python method call, so
+      'random' is slower than Python's 'random.random' (A C call), and only 'randrange' (Pure Python in the random
+      module) is a little faster. Apple respawn cost is dominated by the free spawn area (See 'SpawnSampler').
+
+Stream states can be written to and read from a byte buffer with a fixed layout of 8 bytes (See 'RNGStream.write_snapshot'):
+The number of blocks generated since seeding and the buffer position. The buffered block is generated again on read,
+unless it is already buffered: NumPy streams move their generator to the start of the block (Every float uses one
+64-bit draw, so the generator can skip ahead), and Python streams seed every block separately (Python's generator
+cannot skip ahead).
+"""
+
+import random
+import struct
+import zlib
+from config import RNG_BLOCK_SIZE
+
+try:
+    import numpy as np
+except ImportError: # NumPy is optional: Streams fall back to Python's random module
+    np = None
+
+
+class RNGStream():
+
+    STATE_STRUCT = struct.Struct("<II") # Blocks generated since seeding, position in buffered block
+    SNAPSHOT_SIZE = STATE_STRUCT.size
+
+    def __init__(self, seed, name, block_size=RNG_BLOCK_SIZE):
+        """Initialize RNG Stream
+
+        Parameters:
+            seed (int):         Session seed
+            name (str):         Stream name (Streams with different names give independent numbers)
+            block_size (int):   Number of random numbers pre-generated at once
+        """
+        self.name = name
+        self.block_size = block_size
+        self.seed_value = seed # Session seed (Python streams seed every block with it)
+        self.generator = None # NumPy generator (None without NumPy)
+        self.start_state = None # NumPy generator state after seeding (Used to move the generator to a block on restore)
+        self.buffer = [] # Pre-generated random floats in [0, 1)
+        self.index = block_size # Index of next random float in buffer (Block size = Buffer used up)
+        self.block_count = 0 # Blocks generated since seeding (Buffered block is number 'block_count - 1')
+        self.seed(seed)
+
+    def seed(self, seed):
+        """Reseed stream (Pre-generated numbers are dropped)
+
+        Parameters:
+            seed (int): Session seed
+        Returns:
+            None
+        """
+        self.seed_value = seed
+        if np is not None:
+            # Stream name is mixed into the seed sequence (Independent streams from one seed)
+            self.generator = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(zlib.crc32(self.name.encode()),)))
+            self.start_state = self.generator.bit_generator.state
+        self.buffer = []
+        self.index = self.block_size
+        self.block_count = 0
+
+    def refill(self, block_num=None):
+        """Pre-generate a block of random floats
+
+        Parameters:
+            block_num (int): Number of block to generate (Default: None = Next block)
+        Returns:
+            None
+        """
+        if block_num is None:
+            block_num = self.block_count
+        if np is not None:
+            # Move generator to start of block, unless it is already there (Every float uses one 64-bit draw)
+            if block_num != self.block_count:
+                self.generator.bit_generator.state = self.start_state
+                self.generator.bit_generator.advance(block_num * self.block_size)
+            self.buffer = self.generator.random(self.block_size).tolist() # One NumPy call per block
+        else:
+            generator_random = random.Random(f"{self.seed_value}/{self.name}/{block_num}").random # String seeds are hashed the same way in every process
+            self.buffer = [generator_random() for value_num in range(self.block_size)]
+        self.block_count = block_num + 1
+        self.index = 0
+
+    def random(self):
+        """Get next random float
+
+        Returns:
+            Random float in [0, 1) (float)
+        """
+        index = self.index
+        if index >= self.block_size:
+            self.refill()
+            index = 0
+        self.index = index + 1
+        return self.buffer[index]
+
+    def randrange(self, stop):
+        """Get random integer (Used by 'SpawnSampler.sample')
+
+        Parameters:
+            stop (int): Number of possible values
+        Returns:
+            Random integer in [0, stop) (int)
+        """
+        index = self.index
+        if index >= self.block_size:
+            self.refill()
+            index = 0
+        self.index = index + 1
+        return int(self.buffer[index] * stop) # Same as 'int(self.random() * stop)' without a second call
+
+    def choice(self, sequence):
+        """Get random element of a sequence
+
+        Parameters:
+            sequence (list): Non-empty sequence
+        Returns:
+            Random element
+        """
+        return sequence[self.randrange(len(sequence))]
+
+    def getrandbits(self, bits):
+        """Get random integer with the given number of bits (32 bits per buffered float)
+
+        Parameters:
+            bits (int): Number of bits
+        Returns:
+            Random integer in [0, 2 ** bits) (int)
+        """
+        value = 0
+        while bits > 0:
+            chunk_bits = min(bits, 32)
+            value = (value << chunk_bits) | self.randrange(1 << chunk_bits)
+            bits -= chunk_bits
+        return value
+
+    def write_snapshot(self, buffer, offset=0):
+        """Write stream state into a byte buffer (SNAPSHOT_SIZE bytes)
+
+        Parameters:
+            buffer (bytearray): Buffer to write into
+            offset (int):       Position in buffer (in bytes)
+        Returns:
+            Position after stream state (int)
+        """
+        self.STATE_STRUCT.pack_into(buffer, offset, self.block_count, self.index)
+        return offset + self.STATE_STRUCT.size
+
+    def read_snapshot(self, buffer, offset=0):
+        """Read stream state from a byte buffer written by 'write_snapshot' (Stream must have the same seed)
+
+        Parameters:
+            buffer (bytes):     Buffer to read from
+            offset (int):       Position in buffer (in bytes)
+        Returns:
+            Position after stream state (int)
+        """
+        block_count, index = self.STATE_STRUCT.unpack_from(buffer, offset)
+
+        # Generate buffered block again (Skipped if the same block is still buffered)
+        if block_count != self.block_count:
+            if block_count > 0:
+                self.refill(block_count - 1)
+            else:
+                self.seed(self.seed_value) # No block generated yet
+        self.index = index
+        return offset + self.STATE_STRUCT.size
+
+
+class SessionRNG():
+
+    BACKEND = "numpy" if np is not None else "python" # Streams only give the same numbers with the same backend
+    SEED_STRUCT = struct.Struct("<Q") # Session seed layout in snapshots
+    MAX_SEED = 2 ** 64 - 1 # Largest session seed (Seeds are unsigned 64-bit integers)
+
+    def __init__(self, seed=None, block_size=RNG_BLOCK_SIZE):
+        """Initialize Session RNG
+
+        Parameters:
+            seed (int):         Session seed (Default: None = Random seed)
+            block_size (int):   Number of random numbers pre-generated at once per stream
+        Raises:
+            ValueError: If the seed is not between 0 and MAX_SEED
+        """
+        if seed is not None and not 0 <= seed <= self.MAX_SEED:
+            raise ValueError(f"Session seed must be between 0 and {self.MAX_SEED} (Seed: {seed})")
+        self.seed_value = seed if seed is not None else random.SystemRandom().getrandbits(64) # Session seed (Used to reproduce runs)
+        self.block_size = block_size
+        self.streams = {} # Created streams: name -> RNGStream
+
+    def get_stream(self, name):
+        """Get random number stream for a purpose (Created on first request)
+
+        Parameters:
+            name (str): Stream name (e.g. "spawn")
+        Returns:
+            Random number stream (RNGStream)
+        """
+        stream = self.streams.get(name)
+        if stream is None:
+            stream = RNGStream(self.seed_value, name, self.block_size)
+            self.streams[name] = stream
+        return stream
+
+    def seed(self, seed):
+        """Reseed session: All streams are reseeded in place (Streams handed out keep working)
+
+        Parameters:
+            seed (int): Session seed
+        Returns:
+            None
+        """
+        self.seed_value = seed
+        for stream in self.streams.values():
+            stream.seed(seed)
+
+    def get_snapshot_size(self):
+        """Get size of state written by 'write_snapshot' (Fixed once all streams are created)
+
+        Returns:
+            Snapshot size (in bytes) (int)
+        """
+        return self.SEED_STRUCT.size + len(self.streams) * RNGStream.SNAPSHOT_SIZE
+
+    def write_snapshot(self, buffer, offset=0):
+        """Write session seed and state of every stream into a byte buffer (Streams in creation order)
+
+        Parameters:
+            buffer (bytearray): Buffer to write into
+            offset (int):       Position in buffer (in bytes)
+        Returns:
+            Position after session state (int)
+        """
+        self.SEED_STRUCT.pack_into(buffer, offset, self.seed_value)
+        offset += self.SEED_STRUCT.size
+        for stream in self.streams.values():
+            offset = stream.write_snapshot(buffer, offset)
+        return offset
+
+    def read_snapshot(self, buffer, offset=0):
+        """Read session seed and stream states from a byte buffer written by 'write_snapshot' (Same streams required)
+
+        Parameters:
+            buffer (bytes):     Buffer to read from
+            offset (int):       Position in buffer (in bytes)
+        Returns:
+            Position after session state (int)
+        """
+        seed = self.SEED_STRUCT.unpack_from(buffer, offset)[0]
+        if seed != self.seed_value:
+            self.seed(seed) # Streams generate blocks of the snapshot seed
+        offset += self.SEED_STRUCT.size
+        for stream in self.streams.values():
+            offset = stream.read_snapshot(buffer, offset)
+        return offset
@@ -0,0 +1,246 @@
+# game_components/core/spatial_grid.py
+
+"""
+Spatial Grid Class
+
+This class is a spatial index (uniform grid) for collectibles, used to find collisions without checking
+every collectible. The screen (or arena) is split into square cells, and every item is stored in each cell its
+rectangle covers. A collision query only checks the items stored in the cells the query rectangle covers,
+so the query time depends on how crowded the area is, not on the total number of items.
+
+The grid is updated incrementally: Items are added with 'insert', moved with 'move' (e.g. after a respawn)
+and removed with 'remove'. Moving an item within the same cells only updates its stored rectangle.
+
+Items can be any hashable object, e.g. sprites. The item rectangle is copied when stored, so the grid
+must be told when an item moves (See 'move').
+
+Moving rectangles can be checked over their whole movement of a tick (Swept AABB, see 'query_sweep'), so a fast
+rectangle does not jump over items between two positions.
+"""
+
+import pygame
+from config import COLLISION_GRID_CELL_SIZE
+
+
+class SpatialGrid():
+
+    def __init__(self, cell_size=COLLISION_GRID_CELL_SIZE):
+        """Initialize Spatial Grid
+
+        Parameters:
+            cell_size (int):    Width and height of a grid cell (in pixels) [Best around the size of the largest item]
+        """
+        self.cell_size = cell_size # Size of grid cells (in pixels)
+        self.cells = {} # Items in each cell: (cell_x, cell_y) -> set of items
+        self.items = {} # Stored items: item -> (rect, cell bounds)
+        self.sweep_rect = pygame.Rect(0, 0, 0, 0) # Area covered by a moving rectangle (Reused by 'query_sweep')
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item):
+        return item in self.items
+
+    def get_cell_bounds(self, rect):
+        """Get the range of cells covered by a rectangle
+
+        Parameters:
+            rect (pygame.Rect): Rectangle
+        Returns:
+            Tuple with first and last cell x- & y-index (tuple) [Inclusive]
+        """
+        cell_size = self.cell_size
+        return (rect.left // cell_size, rect.top // cell_size,
+                max(rect.right - 1, rect.left) // cell_size, max(rect.bottom - 1, rect.top) // cell_size)
+
+    def add_to_cells(self, item, cell_bounds):
+        """Add item to every cell within cell bounds"""
+        first_x, first_y, last_x, last_y = cell_bounds
+        for cell_x in range(first_x, last_x + 1):
+            for cell_y in range(first_y, last_y + 1):
+                cell = self.cells.get((cell_x, cell_y))
+                if cell is None:
+                    cell = self.cells[(cell_x, cell_y)] = set()
+                cell.add(item)
+
+    def remove_from_cells(self, item, cell_bounds):
+        """Remove item from every cell within cell bounds (Empty cells are deleted)"""
+        first_x, first_y, last_x, last_y = cell_bounds
+        for cell_x in range(first_x, last_x + 1):
+            for cell_y in range(first_y, last_y + 1):
+                cell = self.cells[(cell_x, cell_y)]
+                cell.discard(item)
+                if not cell:
+                    del self.cells[(cell_x, cell_y)]
+
+    def insert(self, item, rect=None):
+        """Add item to grid (Moves item if it is already stored)
+
+        Parameters:
+            item (hashable):    Item to add, e.g. a sprite
+            rect (pygame.Rect): Item rectangle (Default: None = Use 'item.rect')
+        Returns:
+            None
+        """
+        if item in self.items:
+            self.move(item, rect)
+            return
+
+        rect = pygame.Rect(item.rect if rect is None else rect) # Copy rectangle (Used to find the cells when item moves)
+        cell_bounds = self.get_cell_bounds(rect)
+        self.items[item] = (rect, cell_bounds)
+        self.add_to_cells(item, cell_bounds)
+
+    def move(self, item, rect=None):
+        """Update position of a stored item (Call after the item has moved or respawned)
+
+        Parameters:
+            item (hashable):    Stored item
+            rect (pygame.Rect): New item rectangle (Default: None = Use 'item.rect')
+        Returns:
+            None
+        """
+        stored_rect, cell_bounds = self.items[item]
+        stored_rect.update(item.rect if rect is None else rect)
+
+        # Only update cells if item has moved into other cells
+        new_cell_bounds = self.get_cell_bounds(stored_rect)
+        if new_cell_bounds != cell_bounds:
+            self.remove_from_cells(item, cell_bounds)
+            self.add_to_cells(item, new_cell_bounds)
+            self.items[item] = (stored_rect, new_cell_bounds)
+
+    def remove(self, item):
+        """Remove item from grid (Nothing happens if item is not stored)
+
+        Parameters:
+            item (hashable):    Item to remove
+        Returns:
+            None
+        """
+        stored_item = self.items.pop(item, None)
+        if stored_item is not None:
+            self.remove_from_cells(item, stored_item[1])
+
+    def clear(self):
+        """Remove all items from grid"""
+        self.cells.clear()
+        self.items.clear()
+
+    def query(self, rect, exclude=None):
+        """Find all stored items colliding with a rectangle (e.g. player vs. collectibles)
+
+        Parameters:
+            rect (pygame.Rect):     Rectangle to check
+            exclude (hashable):     Item to leave out of the result (Default: None) [Used for collectible vs. collectibles]
+        Returns:
+            List of colliding items (list)
+        """
+        items = self.items
+        first_x, first_y, last_x, last_y = self.get_cell_bounds(rect)
+
+        # Rectangle within a single cell: No duplicates possible
+        if first_x == last_x and first_y == last_y:
+            cell = self.cells.get((first_x, first_y), ())
+            return [item for item in cell if item is not exclude and rect.colliderect(items[item][0])]
+
+        # Rectangle covers multiple cells: Items can be stored in more than one of them
+        colliding_items = []
+        checked_items = set()
+        for cell_x in range(first_x, last_x + 1):
+            for cell_y in range(first_y, last_y + 1):
+                for item in self.cells.get((cell_x, cell_y), ()):
+                    if item not in checked_items:
+                        checked_items.add(item)
+                        if item is not exclude and rect.colliderect(items[item][0]):
+                            colliding_items.append(item)
+        return colliding_items
+
+    @staticmethod
+    def get_sweep_interval(rect, dx, dy, target_rect):
+        """Get the part of a movement during which a moving rectangle overlaps a target rectangle (Swept AABB)
+        Overlap is checked like 'pygame.Rect.colliderect' (Touching edges do not count)
+
+        Parameters:
+            rect (pygame.Rect):         Moving rectangle at start of movement
+            dx (int):                   Movement along x-axis (in pixels)
+            dy (int):                   Movement along y-axis (in pixels)
+            target_rect (pygame.Rect):  Rectangle that does not move
+        Returns:
+            Entry and exit time (tuple) [0 = Start, 1 = End of movement] or None if they do not overlap during the movement
+        """
+        # Times the rectangles overlap on the x-axis
+        if dx == 0:
+            if not (rect.left < target_rect.right and target_rect.left < rect.right):
+                return None
+            x_entry, x_exit = float("-inf"), float("inf")
+        else:
+            x_entry = (target_rect.left - rect.right) / dx
+            x_exit = (target_rect.right - rect.left) / dx
+            if x_entry > x_exit: # Moving left
+                x_entry, x_exit = x_exit, x_entry
+
+        # Times the rectangles overlap on the y-axis
+        if dy == 0:
+            if not (rect.top < target_rect.bottom and target_rect.top < rect.bottom):
+                return None
+            y_entry, y_exit = float("-inf"), float("inf")
+        else:
+            y_entry = (target_rect.top - rect.bottom) / dy
+            y_exit = (target_rect.bottom - rect.top) / dy
+            if y_entry > y_exit: # Moving up
+                y_entry, y_exit = y_exit, y_entry
+
+        # Rectangles overlap while they overlap on both axes (Only counts within the movement)
+        entry_time = max(x_entry, y_entry)
+        exit_time = min(x_exit, y_exit)
+        if entry_time >= exit_time or entry_time >= 1 or exit_time <= 0:
+            return None
+        return entry_time, exit_time
+
+    def query_sweep(self, rect, dx, dy, exclude=None):
+        """Find all stored items a rectangle collides with while it moves (Swept AABB)
+        Items are found with the area covered by the whole movement, and then checked along the movement,
+        so items between start and end position are found too (See 'get_sweep_interval')
+
+        Parameters:
+            rect (pygame.Rect):     Moving rectangle at start of movement
+            dx (int):               Movement along x-axis (in pixels)
+            dy (int):               Movement along y-axis (in pixels)
+            exclude (hashable):     Item to leave out of the result (Default: None)
+        Returns:
+            List of colliding items (list)
+        """
+        if dx == 0 and dy == 0:
+            return self.query(rect, exclude) # Not moving
+
+        sweep_rect = self.sweep_rect
+        sweep_rect.update(rect.left + min(dx, 0), rect.top + min(dy, 0), rect.width + abs(dx), rect.height + abs(dy))
+        items = self.items
+        return [item for item in self.query(sweep_rect, exclude) if self.get_sweep_interval(rect, dx, dy, items[item][0]) is not None]
+
+    def query_pairs(self):
+        """Find all pairs of stored items colliding with each other (e.g. apples spawned inside each other)
+        Pairs are only checked within shared cells. A pair sharing several cells is reported once: In the cell
+        containing the top-left corner of the overlap
+
+        Returns:
+            List of colliding item pairs (list)
+        """
+        cell_size = self.cell_size
+        items = self.items
+        colliding_pairs = []
+        for (cell_x, cell_y), cell in self.cells.items():
+            if len(cell) < 2:
+                continue
+            cell_items = list(cell)
+            for index, item in enumerate(cell_items):
+                rect = items[item][0]
+                for other_item in cell_items[index + 1:]:
+                    other_rect = items[other_item][0]
+                    if rect.colliderect(other_rect):
+                        # Only report pair in the cell containing the top-left corner of the overlap
+                        if (max(rect.left, other_rect.left) // cell_size == cell_x
+                                and max(rect.top, other_rect.top) // cell_size == cell_y):
+                            colliding_pairs.append((item, other_item))
+        return colliding_pairs
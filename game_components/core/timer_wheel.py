@@ -0,0 +1,146 @@
+# game_components/core/timer_wheel.py
+
+"""
+Timer Wheel Class
+
+This class schedules game-time callbacks at exact simulation ticks (e.g. gold apple spawn/despawn checks,
+power-up expiry), instead of adding up float seconds every frame and comparing them with an interval.
+
+Timers are stored in a ring of TIMER_WHEEL_SLOTS slots: A timer due at tick n is stored in slot n modulo the slot count.
+Advancing the wheel by one tick only visits the slot of that tick, so scheduling, cancelling and firing cost O(1)
+amortized, no matter how many timers are pending. Timers more than one turn of the wheel away stay in their slot,
+and are skipped until their tick comes.
+
+Each slot is a dictionary (Insertion ordered, O(1) removal), so timers due at the same tick fire in the order they
+were scheduled (Same order in every process). Callbacks may schedule and cancel timers.
+
+Timer callbacks cannot be written to snapshots: Owners of timers store due ticks and schedule them again
+on restore (See 'GameEngine.read_snapshot').
+"""
+
+from config import TIMER_WHEEL_SLOTS
+
+
+class Timer():
+
+    __slots__ = ("due_tick", "callback", "slot")
+
+    def __init__(self, due_tick, callback):
+        """Initialize Timer (Created by 'TimerWheel.schedule')
+
+        Parameters:
+            due_tick (int):         Tick the timer fires at
+            callback (function):    Function called without arguments when the timer fires
+        """
+        self.due_tick = due_tick
+        self.callback = callback
+        self.slot = None # Slot the timer is stored in (None = Fired or cancelled)
+
+    def is_pending(self):
+        """Check if timer has neither fired nor been cancelled
+
+        Returns:
+            True if timer is pending (bool)
+        """
+        return self.slot is not None
+
+
+class TimerWheel():
+
+    def __init__(self, slot_count=TIMER_WHEEL_SLOTS):
+        """Initialize Timer Wheel
+
+        Parameters:
+            slot_count (int): Number of slots (Timers within this many ticks are never visited before they are due)
+        """
+        self.slot_count = slot_count
+        self.slots = [{} for slot_num in range(slot_count)] # Slot -> Pending timers (Dictionary used as ordered set)
+        self.tick = 0 # Current tick (Number of times the wheel was advanced since last reset)
+        self.pending_count = 0 # Number of pending timers
+        self.pending_timers = {} # All pending timers (Used to cancel them without visiting every slot)
+
+    def schedule(self, delay, callback):
+        """Schedule a callback a number of ticks from now
+
+        Parameters:
+            delay (int):            Ticks until timer fires (Minimum: 1 = Next tick)
+            callback (function):    Function called without arguments when the timer fires
+        Returns:
+            Timer (Timer) [Used to cancel it]
+        Raises:
+            ValueError: If delay is less than 1 tick
+        """
+        return self.schedule_at(self.tick + delay, callback)
+
+    def schedule_at(self, due_tick, callback):
+        """Schedule a callback at a tick
+
+        Parameters:
+            due_tick (int):         Tick the timer fires at (Must be after current tick)
+            callback (function):    Function called without arguments when the timer fires
+        Returns:
+            Timer (Timer) [Used to cancel it]
+        Raises:
+            ValueError: If due tick is not after current tick
+        """
+        if due_tick <= self.tick:
+            raise ValueError(f"Timer must be due after current tick {self.tick} (Due tick: {due_tick})")
+
+        timer = Timer(due_tick, callback)
+        timer.slot = self.slots[due_tick % self.slot_count]
+        timer.slot[timer] = None
+        self.pending_timers[timer] = None
+        self.pending_count += 1
+        return timer
+
+    def cancel(self, timer):
+        """Cancel a pending timer (Fired, cancelled or missing timers are ignored)
+
+        Parameters:
+            timer (Timer): Timer to cancel (None is ignored)
+        Returns:
+            None
+        """
+        if timer is not None and timer.slot is not None:
+            del timer.slot[timer]
+            del self.pending_timers[timer]
+            timer.slot = None
+            self.pending_count -= 1
+
+    def cancel_all(self):
+        """Cancel all pending timers (Current tick is kept) [Only visits pending timers]"""
+        for timer in self.pending_timers:
+            del timer.slot[timer]
+            timer.slot = None
+        self.pending_timers.clear()
+        self.pending_count = 0
+
+    def reset(self, tick=0):
+        """Cancel all pending timers and set current tick
+
+        Parameters:
+            tick (int): New current tick (Default: 0 = Start of game)
+        Returns:
+            None
+        """
+        self.cancel_all()
+        self.tick = tick
+
+    def advance(self):
+        """Advance by one tick, and fire timers due at the new tick (In the order they were scheduled)"""
+        self.tick += 1
+        slot = self.slots[self.tick % self.slot_count]
+        if not slot:
+            return
+
+        # Collect due timers first (Callbacks may schedule new timers into this slot)
+        tick = self.tick
+        due_timers = [timer for timer in slot if timer.due_tick == tick]
+        for timer in due_timers:
+            if timer.slot is None: # Cancelled by callback of an earlier timer
+                continue
+            del slot[timer]
+            del self.pending_timers[timer]
+            timer.slot = None
+            self.pending_count -= 1
+            timer.callback()
@@ -0,0 +1,5 @@
+# game_components/diagnostics/__init__.py
+
+from .tracer import Tracer, tracer
+from .sampling_profiler import SamplingProfiler
+from .hitch_watchdog import HitchWatchdog
@@ -0,0 +1,191 @@
+# game_components/diagnostics/hitch_watchdog.py
+
+"""
+Hitch Watchdog Class
+
+This class catches frame hitches while the game runs: After every frame, the frame time is compared with the
+frame time budget (HITCH_BUDGET_FACTOR times 1 / FRAME_RATE). Hitches are grouped into incidents: An incident starts
+with a frame over budget, and ends when no frame has gone over budget for HITCH_INCIDENT_GAP seconds (See 'check_frame').
+The first hitch of an incident is written to the hitch log as a full diagnostic record:
+- Frame time, and the slowest phase of the frame (See 'FrameTimer')
+- Garbage collections that ran during the frame (Generation, duration and collected objects) [See 'gc.callbacks']
+- Game context from the driver (e.g. active screen and entity counts) [Only requested when a frame hitched]
+- Frame and phase times of the last PERF_HUD_HISTORY frames (Frame timer ring buffer)
+Later hitches of the incident are only counted. When the incident ends, a short summary record (Hitch count, duration
+and longest frame) is written and printed (See 'end_incident'). A machine that cannot keep up with the frame rate
+therefore writes one record, instead of a record every frame.
+
+The hitch log has one JSON record per line. When it grows over HITCH_LOG_MAX_BYTES, it is rotated like a log file
+(hitches.jsonl -> hitches.jsonl.1 -> ... -> hitches.jsonl.<HITCH_LOG_BACKUP_COUNT>, oldest is deleted), so it
+can stay on for long sessions.
+
+Nothing is written or allocated for frames within budget (Except the summary of an incident that ends).
+"""
+
+import atexit
+import gc
+import json
+import os
+import time
+from config import FRAME_RATE, HITCH_BUDGET_FACTOR, HITCH_INCIDENT_GAP, HITCH_LOG_PATH, HITCH_LOG_MAX_BYTES, HITCH_LOG_BACKUP_COUNT
+
+
+class HitchWatchdog():
+
+    def __init__(self, path=HITCH_LOG_PATH, budget=HITCH_BUDGET_FACTOR / FRAME_RATE, incident_gap=HITCH_INCIDENT_GAP, max_bytes=HITCH_LOG_MAX_BYTES, backup_count=HITCH_LOG_BACKUP_COUNT):
+        """Initialize Hitch Watchdog (Starts watching garbage collections)
+
+        Parameters:
+            path (str):             Hitch log path (Folder is created when the first hitch is written)
+            budget (float):         Frame time budget (in seconds) [Longer frames are hitches]
+            incident_gap (float):   Time without hitches that ends an incident (in seconds)
+            max_bytes (int):        Hitch log size that causes a rotation (in bytes)
+            backup_count (int):     Number of rotated hitch logs kept
+        """
+        self.path = path
+        self.budget = budget
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.incident_gap = incident_gap
+        self.hitch_count = 0 # Hitches since start
+        self.incident_count = 0 # Incidents since start (One full record each)
+
+        # Current incident (No incident while 'incident_hitches' is 0)
+        self.incident_hitches = 0 # Hitches in current incident
+        self.incident_start_time = 0.0 # Time of first hitch [time.perf_counter]
+        self.incident_last_time = 0.0 # Time of last hitch [time.perf_counter]
+        self.incident_max_frame_time = 0.0 # Longest frame of current incident (in seconds)
+
+        # Garbage collections of current frame: [Generation, duration (in seconds), collected objects]
+        self.gc_collections = []
+        self.gc_start_time = None # Start time of running collection [time.perf_counter]
+        gc.callbacks.append(self.on_gc)
+        atexit.register(self.close) # Write summary of an unfinished incident however the game is closed
+
+    def on_gc(self, phase, info):
+        """Garbage collector callback: Record collections of the current frame
+
+        Parameters:
+            phase (str):    "start" or "stop"
+            info (dict):    Collection info ("generation", "collected", "uncollectable")
+        Returns:
+            None
+        """
+        if phase == "start":
+            self.gc_start_time = time.perf_counter()
+        elif self.gc_start_time is not None:
+            self.gc_collections.append([info["generation"], time.perf_counter() - self.gc_start_time, info["collected"]])
+            self.gc_start_time = None
+
+    def start_frame(self):
+        """Forget garbage collections of the previous frame (Call when a frame starts)"""
+        if self.gc_collections:
+            self.gc_collections.clear()
+
+    def check_frame(self, frame_timer, get_context=None):
+        """Check frame stored last by the frame timer: Write a diagnostic record if it starts an incident,
+        count it if it continues one, and end the incident once frames have stayed within budget for 'incident_gap'
+
+        Parameters:
+            frame_timer (FrameTimer):   Frame timer that just ended a frame
+            get_context (function):     Function returning game context of the hitch (dict) (Default: None = No context)
+        Returns:
+            Diagnostic record (dict) or None if the frame was within budget or continued an incident
+        """
+        frame_time, phase_times = frame_timer.get_last_frame()
+        if frame_time <= self.budget:
+            if self.incident_hitches > 0 and time.perf_counter() - self.incident_last_time >= self.incident_gap:
+                self.end_incident()
+            return None
+
+        self.hitch_count += 1
+        self.incident_last_time = time.perf_counter()
+        self.incident_max_frame_time = max(self.incident_max_frame_time, frame_time)
+
+        # Incident continues: Only counted
+        if self.incident_hitches > 0:
+            self.incident_hitches += 1
+            return None
+
+        # Incident starts: Full record
+        self.incident_hitches = 1
+        self.incident_start_time = self.incident_last_time
+        self.incident_count += 1
+        slowest_phase = max(range(len(phase_times)), key=phase_times.__getitem__)
+        record = {
+            "type": "hitch",
+            "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "frame_time_ms": round(frame_time * 1000, 3),
+            "budget_ms": round(self.budget * 1000, 3),
+            "slowest_phase": frame_timer.PHASE_NAMES[slowest_phase],
+            "slowest_phase_ms": round(phase_times[slowest_phase] * 1000, 3),
+            "phases_ms": {name: round(phase_time * 1000, 3) for name, phase_time in zip(frame_timer.PHASE_NAMES, phase_times)},
+            "gc": [{"generation": generation, "duration_ms": round(duration * 1000, 3), "collected": collected}
+                   for generation, duration, collected in self.gc_collections],
+            "context": get_context() if get_context is not None else {},
+            "history": {
+                "columns": ["Frame"] + list(frame_timer.PHASE_NAMES),
+                "frames_ms": [[round(history_frame_time * 1000, 3)] + [round(phase_time * 1000, 3) for phase_time in history_phase_times]
+                              for history_frame_time, history_phase_times in frame_timer.get_history()],
+            },
+        }
+        self.write_record(record)
+        return record
+
+    def end_incident(self):
+        """End current incident: Write and print a summary of its hitches
+
+        Returns:
+            Summary record (dict) or None if no incident was running
+        """
+        if self.incident_hitches == 0:
+            return None
+
+        record = {
+            "type": "incident_end",
+            "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "hitches": self.incident_hitches,
+            "duration_s": round(self.incident_last_time - self.incident_start_time, 3), # First to last hitch
+            "max_frame_time_ms": round(self.incident_max_frame_time * 1000, 3),
+        }
+        self.write_record(record)
+        print(f"Frame hitches: {record['hitches']} frame(s) over budget in {record['duration_s']:.1f} s (Longest: {record['max_frame_time_ms']:.1f} ms) [See {self.path}]")
+
+        self.incident_hitches = 0
+        self.incident_max_frame_time = 0.0
+        return record
+
+    def write_record(self, record):
+        """Append a diagnostic record to the hitch log (Rotates the hitch log first if it is full)
+
+        Parameters:
+            record (dict): Diagnostic record
+        Returns:
+            None
+        """
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        line = json.dumps(record) + "\n"
+        if os.path.exists(self.path) and os.path.getsize(self.path) + len(line) > self.max_bytes:
+            self.rotate()
+        with open(self.path, "a") as file:
+            file.write(line)
+
+    def rotate(self):
+        """Rotate hitch logs: hitches.jsonl -> hitches.jsonl.1 -> ... (Oldest is deleted)"""
+        if self.backup_count <= 0:
+            os.remove(self.path)
+            return
+        for backup_num in range(self.backup_count - 1, 0, -1):
+            backup_path = f"{self.path}.{backup_num}"
+            if os.path.exists(backup_path):
+                os.replace(backup_path, f"{self.path}.{backup_num + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+    def close(self):
+        """End current incident and stop watching garbage collections"""
+        self.end_incident()
+        if self.on_gc in gc.callbacks:
+            gc.callbacks.remove(self.on_gc)
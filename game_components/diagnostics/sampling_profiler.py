@@ -0,0 +1,165 @@
+# game_components/diagnostics/sampling_profiler.py
+
+"""
+Sampling Profiler Class
+
+This class finds where the game spends its time, with little enough overhead to run on machines where stutter is
+seen: A background thread wakes up PROFILE_SAMPLE_RATE times per second, and reads the stack of the main thread
+(See 'sys._current_frames'). Unlike cProfile, the profiled code is not slowed down by every function call:
+Only the sampler thread does work, for a few microseconds per sample.
+
+Samples are counted per stack and per label (The active screen, e.g. "start_screen" or "main_screen"). Every frame
+of a stack is the function and the line it was running (So calls into C code, e.g. 'clock.tick', can be told apart).
+Stacks are kept as tuples of code objects and line numbers while sampling, and only turned into text when the
+profile is written.
+
+The profile is written as folded stacks (One line per stack: "label;outer function;...;inner function count"),
+which flamegraph tools read directly (e.g. flamegraph.pl, inferno, https://www.speedscope.app). The label is the
+root frame, so every screen gets its own part of the flamegraph.
+
+Note: Time the main thread spends waiting (e.g. in 'clock.tick' or 'pygame.event.wait') is sampled too, so the
+      flamegraph shows wall time, not only CPU time
+"""
+
+import atexit
+import os
+import sys
+import threading
+import time
+from config import PROFILE_SAMPLE_RATE
+
+
+class SamplingProfiler():
+
+    def __init__(self, sample_rate=PROFILE_SAMPLE_RATE, get_label=None):
+        """Initialize Sampling Profiler (Sampling starts with 'start')
+
+        Parameters:
+            sample_rate (int):      Samples per second
+            get_label (function):   Function returning the label of a sample (e.g. active screen) (Default: None = "all")
+        """
+        self.sample_interval = 1 / sample_rate # Time between samples (in seconds)
+        self.get_label = get_label
+        self.path = None # Profile file path
+        self.samples = {} # (Label, stack) -> Number of samples [Stack: (Code object, line number) per frame, outermost first]
+        self.sample_count = 0 # Number of samples taken
+        self.sample_time = 0.0 # Time spent taking samples (in seconds) [Sampler thread]
+        self.target_thread_id = None # Thread that is sampled (Thread that called 'start')
+        self.thread = None # Sampler thread
+        self.stop_event = threading.Event()
+        self.exit_handler_registered = False
+
+    def start(self, path):
+        """Start sampling the calling thread (Profile is written by 'stop', at the latest when the program exits)
+
+        Parameters:
+            path (str): Profile file path (Folder is created when the file is written)
+        Returns:
+            None
+        """
+        self.path = path
+        self.samples.clear()
+        self.sample_count = 0
+        self.sample_time = 0.0
+        self.target_thread_id = threading.get_ident()
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, name="SamplingProfiler", daemon=True)
+        self.thread.start()
+        if self.exit_handler_registered == False:
+            atexit.register(self.stop) # Write profile however the game is closed
+            self.exit_handler_registered = True
+
+    def stop(self):
+        """Stop sampling and write the profile (Does nothing if the profiler is not running)
+
+        Returns:
+            Profile file path (str) or None if the profiler was not running
+        """
+        if self.thread is None:
+            return None
+        self.stop_event.set()
+        self.thread.join()
+        self.thread = None
+        self.write(self.path)
+        return self.path
+
+    def run(self):
+        """Sampler thread: Take a sample every sample interval until stopped"""
+        next_sample_time = time.perf_counter()
+        while True:
+            # Wait until next sample (Interval is kept, even if a sample was late)
+            next_sample_time += self.sample_interval
+            if self.stop_event.wait(max(next_sample_time - time.perf_counter(), 0)) == True:
+                return
+            start_time = time.perf_counter()
+            self.take_sample()
+            self.sample_time += time.perf_counter() - start_time
+
+    def take_sample(self):
+        """Read the stack of the sampled thread, and count it"""
+        frame = sys._current_frames().get(self.target_thread_id)
+        if frame is None:
+            return # Thread has ended
+
+        # Stack from innermost to outermost frame
+        stack = []
+        while frame is not None:
+            stack.append((frame.f_code, frame.f_lineno))
+            frame = frame.f_back
+        stack.reverse()
+
+        label = self.get_label() if self.get_label is not None else "all"
+        key = (label, tuple(stack))
+        self.samples[key] = self.samples.get(key, 0) + 1
+        self.sample_count += 1
+
+    def get_label_totals(self):
+        """Get number of samples per label
+
+        Returns:
+            Label -> Number of samples (dict)
+        """
+        totals = {}
+        for (label, stack), count in self.samples.items():
+            totals[label] = totals.get(label, 0) + count
+        return totals
+
+    def format_folded_stacks(self):
+        """Format samples as folded stacks (Most samples first)
+
+        Returns:
+            One line per stack: "label;outer function;...;inner function count" (list)
+        """
+        names = {} # (Code object, line number) -> Frame name (Formatted once per line)
+        lines = []
+        for (label, stack), count in sorted(self.samples.items(), key=lambda item: item[1], reverse=True):
+            frame_names = [str(label)]
+            for code_line in stack:
+                name = names.get(code_line)
+                if name is None:
+                    code, line_number = code_line
+                    name = names[code_line] = f"{code.co_name} ({os.path.basename(code.co_filename)}:{line_number})"
+                frame_names.append(name)
+            lines.append(f"{';'.join(frame_names)} {count}")
+        return lines
+
+    def write(self, path):
+        """Write samples as folded stacks, and print samples per label and sampling overhead
+
+        Parameters:
+            path (str): Profile file path
+        Returns:
+            None
+        """
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(path, "w") as file:
+            for line in self.format_folded_stacks():
+                file.write(line + "\n")
+
+        print(f"Profile: {self.sample_count} samples written to {path}")
+        for label, count in sorted(self.get_label_totals().items(), key=lambda item: item[1], reverse=True):
+            print(f"  {label}: {count} samples ({count / self.sample_count:.1%})")
+        if self.sample_count > 0:
+            print(f"  Sampling time: {self.sample_time / self.sample_count * 1e6:.1f} us per sample")
@@ -0,0 +1,241 @@
+# game_components/diagnostics/tracer.py
+
+"""
+Tracer Class
+
+This class records what the game does over time as spans (Named time ranges, which can be nested) and counters
+(Named values over time), and writes them as a Chrome Trace Event JSON file, which can be opened in a trace viewer
+(e.g. https://ui.perfetto.dev or chrome://tracing) to see which frames hitched and why.
+
+Usage:
+    with tracer.span("Apple.respawn"):          # Span around a block
+        ...
+    tracer.begin("Game.update") ... tracer.end() # Span around code with early returns or long bodies
+    tracer.counter("Simulation ticks", ticks)   # Counter value
+
+Tracing is started with 'start' (See '--trace' in main.py). Events are buffered in memory (Up to TRACE_MAX_EVENTS,
+later events are dropped and counted), and written to the trace file by 'stop', which is called at exit.
+End events of spans begun before the buffer was full are always buffered (At most one per open span), so every
+buffered span is closed and trace viewers do not stretch it to the end of the trace (See 'end').
+
+While tracing is off, 'span' returns a shared span that does nothing, and all other methods return right away,
+so instrumented code costs well under a microsecond per call.
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from config import TRACE_MAX_EVENTS
+
+
+class NullSpan():
+    """Span used while tracing is off (Shared: Does nothing)"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+class Span():
+    """Span recorded while tracing is on: Adds a complete event when the block is left"""
+
+    __slots__ = ("tracer", "name", "args", "start_time")
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args # Values shown with the span in the trace viewer (dict or None)
+        self.start_time = 0 # [time.perf_counter_ns]
+
+    def __enter__(self):
+        self.start_time = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.tracer.add_event("X", self.name, self.start_time, time.perf_counter_ns() - self.start_time, self.args)
+        return False
+
+
+class Tracer():
+
+    NULL_SPAN = NullSpan() # Returned by 'span' while tracing is off
+
+    def __init__(self, max_events=TRACE_MAX_EVENTS):
+        """Initialize Tracer (Tracing is off until 'start' is called)
+
+        Parameters:
+            max_events (int): Maximum number of buffered events (Later events are dropped, except end events of buffered spans)
+        """
+        self.max_events = max_events
+        self.enabled = False # Tracing is on
+        self.path = None # Trace file path
+        self.events = [] # Buffered events: (phase, name, timestamp, duration, args) [Timestamps in nanoseconds]
+        self.dropped_events = 0 # Events not buffered because the buffer was full
+        self.open_spans = 0 # Buffered begin events not ended yet
+        self.dropped_open_spans = 0 # Dropped begin events not ended yet (Their end events are dropped too)
+        self.start_time = 0 # Time tracing was started [time.perf_counter_ns]
+        self.thread_id = None # Thread the trace is recorded on (Main thread)
+        self.exit_handler_registered = False
+
+    def start(self, path):
+        """Start tracing (Trace file is written by 'stop', at the latest when the program exits)
+
+        Parameters:
+            path (str): Trace file path (Folder is created when the file is written)
+        Returns:
+            None
+        """
+        self.path = path
+        self.events.clear()
+        self.dropped_events = 0
+        self.open_spans = 0
+        self.dropped_open_spans = 0
+        self.start_time = time.perf_counter_ns()
+        self.thread_id = threading.get_ident()
+        self.enabled = True
+        if self.exit_handler_registered == False:
+            atexit.register(self.stop) # Write trace file however the game is closed
+            self.exit_handler_registered = True
+
+    def stop(self):
+        """Stop tracing and write the trace file (Does nothing if tracing is off)
+
+        Returns:
+            Trace file path (str) or None if tracing was off
+        """
+        if self.enabled == False:
+            return None
+        self.enabled = False
+        self.write(self.path)
+        self.events.clear()
+        return self.path
+
+    def span(self, name, args=None):
+        """Get a span for a 'with' block
+
+        Parameters:
+            name (str):     Span name (e.g. "Apple.respawn")
+            args (dict):    Values shown with the span (Default: None)
+        Returns:
+            Span (Span) or shared span that does nothing while tracing is off (NullSpan)
+        """
+        if self.enabled == False:
+            return self.NULL_SPAN
+        return Span(self, name, args)
+
+    def begin(self, name, args=None):
+        """Begin a span (Ended by the next 'end' call: Spans begun this way must be ended in reverse order)
+
+        Parameters:
+            name (str):     Span name
+            args (dict):    Values shown with the span (Default: None)
+        Returns:
+            None
+        """
+        if self.enabled == True:
+            if len(self.events) < self.max_events:
+                self.events.append(("B", name, time.perf_counter_ns(), 0, args))
+                self.open_spans += 1
+            else:
+                self.dropped_events += 1
+                self.dropped_open_spans += 1
+
+    def end(self):
+        """End the span begun last (Buffered even if the buffer is full, unless the begin event was dropped)"""
+        if self.enabled == True:
+            # Spans end in reverse order: Spans begun after the buffer was full end first
+            if self.dropped_open_spans > 0:
+                self.dropped_open_spans -= 1
+                self.dropped_events += 1
+            elif self.open_spans > 0:
+                self.open_spans -= 1
+                self.events.append(("E", None, time.perf_counter_ns(), 0, None))
+            else:
+                self.add_event("E", None, time.perf_counter_ns(), 0, None) # End without begin (e.g. tracing started inside a span)
+
+    def counter(self, name, value):
+        """Record counter value (Shown as a graph in the trace viewer)
+
+        Parameters:
+            name (str):             Counter name
+            value (int or float):   Counter value
+        Returns:
+            None
+        """
+        if self.enabled == True:
+            self.add_event("C", name, time.perf_counter_ns(), 0, value)
+
+    def instant(self, name, args=None):
+        """Record an event without duration (e.g. a screen change)
+
+        Parameters:
+            name (str):     Event name
+            args (dict):    Values shown with the event (Default: None)
+        Returns:
+            None
+        """
+        if self.enabled == True:
+            self.add_event("i", name, time.perf_counter_ns(), 0, args)
+
+    def add_event(self, phase, name, timestamp, duration, args):
+        """Buffer an event (Dropped if the buffer is full)
+
+        Parameters:
+            phase (str):        Trace event phase ("X" = Complete, "B" = Begin, "E" = End, "C" = Counter, "i" = Instant)
+            name (str):         Event name
+            timestamp (int):    Event time [time.perf_counter_ns]
+            duration (int):     Duration of complete events (in nanoseconds)
+            args:               Event values (dict), or counter value
+        Returns:
+            None
+        """
+        if len(self.events) < self.max_events:
+            self.events.append((phase, name, timestamp, duration, args))
+        else:
+            self.dropped_events += 1
+
+    def write(self, path):
+        """Write buffered events as a Chrome Trace Event JSON file (One event per line)
+
+        Parameters:
+            path (str): Trace file path
+        Returns:
+            None
+        """
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        pid = os.getpid()
+        tid = self.thread_id
+        with open(path, "w") as file:
+            file.write('{"displayTimeUnit": "ms", "traceEvents": [\n')
+            file.write(json.dumps({"ph": "M", "name": "thread_name", "pid": pid, "tid": tid, "args": {"name": "Main thread"}}))
+            for phase, name, timestamp, duration, args in self.events:
+                event = {"ph": phase, "pid": pid, "tid": tid, "ts": (timestamp - self.start_time) / 1000} # Microseconds since start
+                if name is not None:
+                    event["name"] = name
+                if phase == "X":
+                    event["dur"] = duration / 1000
+                if phase == "C":
+                    event["args"] = {"value": args}
+                elif args is not None:
+                    event["args"] = args
+                if phase == "i":
+                    event["s"] = "t" # Instant event scope: Thread
+                file.write(",\n")
+                file.write(json.dumps(event))
+            if self.dropped_events > 0:
+                file.write(",\n")
+                file.write(json.dumps({"ph": "M", "name": "dropped_events", "pid": pid, "tid": tid, "args": {"count": self.dropped_events}}))
+            file.write("\n]}\n")
+
+
+# Shared tracer (Used by game loop, screens, collectibles and asset manager)
+tracer = Tracer()
@@ -0,0 +1,7 @@
+# game_components/replay/__init__.py
+
+from .session_file import SessionFile, GameRecord, SessionFileError
+from .session_recorder import SessionRecorder
+from .session_replayer import ReplayMismatchError, replay_game, replay_session
+from .session_scrubber import SessionScrubber
+from .scrubber_view import ScrubberView
@@ -0,0 +1,134 @@
+# game_components/replay/scrubber_view.py
+
+"""
+Scrubber View Class
+
+This class is a debug window that opens one game of a recorded session and lets you move back and forth through it
+(See 'SessionScrubber'). Frames are drawn with the main screen of the game (See 'GameScreen.main_screen'),
+with the current tick, recorded input and replay status drawn on top.
+
+Controls:
+- Left / Right:             One tick back / forward (Hold to repeat)
+- Down / Up:                One second back / forward
+- Page down / Page up:      One minute back / forward
+- Home / End:               Start / end of game
+- Space:                    Play / pause (Real time)
+- Escape:                   Quit
+
+Usage: python main.py --scrub <session file> [--game <game index>]
+"""
+
+import pygame
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, GAME_TITLE
+from game_components.character import Player
+from game_components.core.session_rng import SessionRNG
+from game_components.ui import GameScreen, TextInfo
+from game_components.replay.session_file import SessionFile
+from game_components.replay.session_replayer import ReplayMismatchError
+from game_components.replay.session_scrubber import SessionScrubber
+
+
+class ScrubberView():
+
+    # Input bits shown as letters (Up, down, left, right)
+    INPUT_LETTERS = ((Player.INPUT_UP, "U"), (Player.INPUT_DOWN, "D"), (Player.INPUT_LEFT, "L"), (Player.INPUT_RIGHT, "R"))
+
+    def __init__(self, session_path, game_index=0):
+        """Initialize Scrubber View: Opens window and loads one game of a session file
+
+        Parameters:
+            session_path (str): Session file path
+            game_index (int):   Index of game in session (Default: 0 = First game)
+        Raises:
+            ReplayMismatchError: If the session was recorded with another random number backend
+        """
+        session, game_record, self.game_count = SessionFile.load_game(session_path, game_index)
+        if session.rng_backend != SessionRNG.BACKEND:
+            raise ReplayMismatchError(f"Session was recorded with {session.rng_backend} random numbers, but {SessionRNG.BACKEND} random numbers are used")
+        self.game_index = game_index
+
+        pygame.init()
+        pygame.display.set_caption(f"{GAME_TITLE} - Session Scrubber")
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.key.set_repeat(250, 25) # Hold keys to scrub
+        self.clock = pygame.time.Clock()
+
+        self.scrubber = SessionScrubber(game_record, session.tick_rate, session.checkpoint_interval)
+        self.tick_rate = session.tick_rate
+        self.playing = False # Play in real time
+
+        # Seek steps (in ticks)
+        self.seek_steps = {
+            pygame.K_LEFT: -1, pygame.K_RIGHT: 1,
+            pygame.K_DOWN: -self.tick_rate, pygame.K_UP: self.tick_rate,
+            pygame.K_PAGEDOWN: -60 * self.tick_rate, pygame.K_PAGEUP: 60 * self.tick_rate,
+        }
+
+        # Draw with main screen of the game (Whole window is drawn every frame: Status texts are drawn on top)
+        self.game_screen = GameScreen(screen)
+        self.game_screen.dirty_renderer = None
+        self.game_screen.retrieve_sprites(player_group=self.scrubber.engine.player_group, sprite_group=self.scrubber.engine.apple_group)
+        self.game_screen.active_game_screen = "main_screen"
+        self.status_text = TextInfo() # Tick, input and replay status
+        self.controls_text = TextInfo() # Controls
+
+    def handle_events(self):
+        """Handle window and key events
+
+        Returns:
+            False if the window should close (bool)
+        """
+        scrubber = self.scrubber
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return False
+            if event.type != pygame.KEYDOWN:
+                continue
+
+            if event.key == pygame.K_ESCAPE:
+                return False
+            elif event.key == pygame.K_SPACE:
+                self.playing = not self.playing
+            elif event.key == pygame.K_HOME:
+                scrubber.seek(0)
+            elif event.key == pygame.K_END:
+                scrubber.seek(scrubber.tick_count)
+            elif event.key in self.seek_steps:
+                self.playing = False
+                scrubber.seek(scrubber.tick + self.seek_steps[event.key])
+        return True
+
+    def draw(self):
+        """Draw game state of current tick with status texts"""
+        scrubber = self.scrubber
+        engine = scrubber.engine
+
+        # Main screen of the game
+        self.game_screen.update_text(text_to_update="highscore", new_text_value=engine.highscore_num)
+        self.game_screen.update_text(text_to_update="countdown_timer", new_text_value=engine.countdown_timer_value)
+        self.game_screen.main_screen()
+
+        # Status texts
+        input_bits = scrubber.get_input(scrubber.tick) if scrubber.tick < scrubber.tick_count else 0
+        input_letters = "".join(letter for input_bit, letter in self.INPUT_LETTERS if input_bits & input_bit) or "-"
+        if scrubber.first_mismatch_tick is not None:
+            replay_status = f"Differs from recording at tick {scrubber.first_mismatch_tick}"
+        else:
+            replay_status = "Matches recording"
+        status = (f"Game {self.game_index + 1}/{self.game_count} | Tick {scrubber.tick}/{scrubber.tick_count} ({scrubber.tick / self.tick_rate:.2f} s)"
+                  f" | Input {input_letters} | Keyframes {scrubber.keyframe_count} | {replay_status}")
+        self.game_screen.draw_text(text=status, font_size=16, x_pos=50, y_pos=93, text_info=self.status_text)
+        self.game_screen.draw_text(text="Left/Right: Tick | Down/Up: Second | Page Down/Up: Minute | Home/End | Space: Play | Esc: Quit",
+                                   font_size=14, x_pos=50, y_pos=97, text_info=self.controls_text)
+
+        pygame.display.flip()
+
+    def run(self):
+        """Run scrubber window until it is closed"""
+        while self.handle_events() == True:
+            if self.playing == True:
+                self.scrubber.seek(self.scrubber.tick + 1)
+                if self.scrubber.tick >= self.scrubber.tick_count:
+                    self.playing = False # Stop at end of game
+            self.draw()
+            self.clock.tick(self.tick_rate) # One tick per frame when playing (Real time)
@@ -0,0 +1,246 @@
+# game_components/replay/session_file.py
+
+"""
+Session File Class
+
+This class stores the recorded games of a play session: For every game the seed of the random number generator,
+the player input of every tick and state hashes to check replays against (See 'GameRecord').
+
+Player input is a 4-bit bitmask per tick (See 'Player.INPUT_UP' etc.), which rarely changes between ticks.
+It is run-length encoded: Each run of equal input is stored as one variable-length integer ((length << 4) | input bits),
+7 bits per byte. A run of up to 7 ticks takes one byte, a run of up to 1023 ticks two bytes.
+
+Game state is hashed every tick, and the hashes are chained (See 'GameEngine.get_state_hash'). The chained hash is
+stored every 'checkpoint_interval' ticks and at the end of the game, so a replay that differs in any tick is detected
+at the next checkpoint.
+
+Games only replay with the random number backend they were recorded with (See 'SessionRNG.BACKEND'), so it is stored too.
+
+File layout (Little-endian):
+- Header: Magic "ADRS", format version, random number backend, tick rate, checkpoint interval, number of games
+- Per game: Seed, ticks, final score, final state hash, completed flag, input runs size (in bytes), number of checkpoints,
+  followed by the encoded input runs and the checkpoint hashes (4 bytes each)
+"""
+
+import struct
+
+
+class SessionFileError(Exception):
+    """Raised when a session file is not valid"""
+
+
+class GameRecord():
+
+    def __init__(self, seed):
+        """Initialize Game Record
+
+        Parameters:
+            seed (int): Seed of random number generator at game start
+        """
+        self.seed = seed # Seed of random number generator at game start
+        self.input_runs = [] # Player input runs: List of [input bits, number of ticks]
+        self.tick_count = 0 # Number of recorded ticks
+        self.checkpoints = [] # Chained state hash every checkpoint interval
+        self.final_score = 0 # Highscore at game end
+        self.final_hash = 0 # Chained state hash of last tick
+        self.completed = False # Game ended by countdown timer (False = Game was quit)
+
+    def add_input(self, input_bits):
+        """Add player input of one tick (Extends last run if input did not change)
+
+        Parameters:
+            input_bits (int): Input bitmask
+        Returns:
+            None
+        """
+        if self.input_runs and self.input_runs[-1][0] == input_bits:
+            self.input_runs[-1][1] += 1
+        else:
+            self.input_runs.append([input_bits, 1])
+        self.tick_count += 1
+
+
+class SessionFile():
+
+    MAGIC = b"ADRS" # File signature
+    VERSION = 4 # File format version (Changed whenever the game rules or state hashes change: Older recordings would not replay)
+    HEADER_STRUCT = struct.Struct("<4sBBHHI") # Magic, version, random number backend, tick rate, checkpoint interval, number of games
+    RNG_BACKENDS = ("python", "numpy") # Random number backends (Stored as index)
+    GAME_STRUCT = struct.Struct("<QIIIBII") # Seed, ticks, final score, final hash, completed, input runs size, number of checkpoints
+
+    INPUT_BITS = 4 # Bits per input bitmask
+    INPUT_MASK = (1 << INPUT_BITS) - 1
+
+    def __init__(self, rng_backend, tick_rate, checkpoint_interval):
+        """Initialize Session File
+
+        Parameters:
+            rng_backend (str):          Random number backend of recorded games (See 'RNG_BACKENDS')
+            tick_rate (int):            Simulation ticks per second of recorded games
+            checkpoint_interval (int):  Ticks between stored state hashes
+        """
+        self.rng_backend = rng_backend
+        self.tick_rate = tick_rate
+        self.checkpoint_interval = checkpoint_interval
+        self.games = [] # Recorded games (GameRecord)
+
+    @classmethod
+    def encode_runs(cls, input_runs):
+        """Encode input runs as variable-length integers
+
+        Parameters:
+            input_runs (list): List of [input bits, number of ticks]
+        Returns:
+            Encoded input runs (bytes)
+        """
+        data = bytearray()
+        for input_bits, length in input_runs:
+            value = (length << cls.INPUT_BITS) | input_bits
+            while value >= 0x80:
+                data.append((value & 0x7F) | 0x80) # Lower 7 bits, more bytes follow
+                value >>= 7
+            data.append(value)
+        return bytes(data)
+
+    @classmethod
+    def decode_runs(cls, data):
+        """Decode input runs encoded with 'encode_runs'
+
+        Parameters:
+            data (bytes): Encoded input runs
+        Returns:
+            List of [input bits, number of ticks] (list)
+        Raises:
+            SessionFileError: If the last value is incomplete
+        """
+        input_runs = []
+        value = 0
+        shift = 0
+        for byte in data:
+            value |= (byte & 0x7F) << shift
+            if byte & 0x80:
+                shift += 7
+                continue
+            input_runs.append([value & cls.INPUT_MASK, value >> cls.INPUT_BITS])
+            value = 0
+            shift = 0
+        if shift != 0:
+            raise SessionFileError("Input runs end with an incomplete value")
+        return input_runs
+
+    def save(self, path):
+        """Save session to file (Overwrites existing file)
+
+        Parameters:
+            path (str): File path
+        Returns:
+            None
+        """
+        with open(path, "wb") as file:
+            file.write(self.HEADER_STRUCT.pack(self.MAGIC, self.VERSION, self.RNG_BACKENDS.index(self.rng_backend),
+                                               self.tick_rate, self.checkpoint_interval, len(self.games)))
+            for game in self.games:
+                runs_data = self.encode_runs(game.input_runs)
+                file.write(self.GAME_STRUCT.pack(game.seed, game.tick_count, game.final_score, game.final_hash,
+                                                 game.completed, len(runs_data), len(game.checkpoints)))
+                file.write(runs_data)
+                file.write(struct.pack(f"<{len(game.checkpoints)}I", *game.checkpoints))
+
+    @classmethod
+    def read_exactly(cls, file, size, path):
+        """Read a number of bytes from a session file
+
+        Returns:
+            Read bytes (bytes)
+        Raises:
+            SessionFileError: If the file ends before
+        """
+        data = file.read(size)
+        if len(data) != size:
+            raise SessionFileError(f"Session file is truncated: {path}")
+        return data
+
+    @classmethod
+    def read_header(cls, file, path):
+        """Read session file header
+
+        Parameters:
+            file (file):    Session file opened in binary mode (At start of file)
+            path (str):     File path (Used in error messages)
+        Returns:
+            Session without games (SessionFile) and number of stored games (int) (tuple)
+        Raises:
+            SessionFileError: If the file is not a valid session file
+        """
+        magic, version, rng_backend, tick_rate, checkpoint_interval, game_count = cls.HEADER_STRUCT.unpack(cls.read_exactly(file, cls.HEADER_STRUCT.size, path))
+        if magic != cls.MAGIC or version != cls.VERSION or rng_backend >= len(cls.RNG_BACKENDS):
+            raise SessionFileError(f"Not a session file (Version {cls.VERSION}): {path}")
+        return cls(cls.RNG_BACKENDS[rng_backend], tick_rate, checkpoint_interval), game_count
+
+    @classmethod
+    def read_game(cls, file, path, skip=False):
+        """Read next game of a session file
+
+        Parameters:
+            file (file):    Session file opened in binary mode (At start of a game)
+            path (str):     File path (Used in error messages)
+            skip (bool):    Only move to the next game (Input runs and checkpoints are not read)
+        Returns:
+            Recorded game (GameRecord) [None if skipped]
+        Raises:
+            SessionFileError: If the game is truncated or its input runs do not match its number of ticks
+        """
+        seed, tick_count, final_score, final_hash, completed, runs_size, checkpoint_count = cls.GAME_STRUCT.unpack(cls.read_exactly(file, cls.GAME_STRUCT.size, path))
+        if skip == True:
+            file.seek(runs_size + 4 * checkpoint_count, 1) # Seek relative to current position
+            return None
+
+        game = GameRecord(seed)
+        game.input_runs = cls.decode_runs(cls.read_exactly(file, runs_size, path))
+        game.checkpoints = list(struct.unpack(f"<{checkpoint_count}I", cls.read_exactly(file, 4 * checkpoint_count, path)))
+        game.tick_count = tick_count
+        game.final_score = final_score
+        game.final_hash = final_hash
+        game.completed = bool(completed)
+
+        if sum(length for input_bits, length in game.input_runs) != tick_count:
+            raise SessionFileError(f"Game (Seed {seed}): Input runs do not match number of ticks")
+        return game
+
+    @classmethod
+    def load(cls, path):
+        """Load session from file
+
+        Parameters:
+            path (str): File path
+        Returns:
+            Loaded session (SessionFile)
+        Raises:
+            SessionFileError: If the file is not a valid session file
+        """
+        with open(path, "rb") as file:
+            session, game_count = cls.read_header(file, path)
+            for game_num in range(game_count):
+                session.games.append(cls.read_game(file, path))
+        return session
+
+    @classmethod
+    def load_game(cls, path, game_index):
+        """Load a single game from file (Other games are skipped without reading them)
+
+        Parameters:
+            path (str):         File path
+            game_index (int):   Index of game in session
+        Returns:
+            Session without games (SessionFile), recorded game (GameRecord) and number of stored games (int) (tuple)
+        Raises:
+            SessionFileError: If the file is not a valid session file
+            IndexError: If the session has no game with this index
+        """
+        with open(path, "rb") as file:
+            session, game_count = cls.read_header(file, path)
+            if not 0 <= game_index < game_count:
+                raise IndexError(f"Session has {game_count} games: No game {game_index}")
+            for game_num in range(game_index):
+                cls.read_game(file, path, skip=True)
+            return session, cls.read_game(file, path), game_count
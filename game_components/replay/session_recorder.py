@@ -0,0 +1,86 @@
+# game_components/replay/session_recorder.py
+
+"""
+Session Recorder Class
+
+This class records the games of a play session into a session file (See 'SessionFile'): The seed of every game,
+the player input of every simulation tick and chained state hashes of the game engine.
+
+The driver starts a game with the seed it reset the engine with (See 'start_game'), records every tick after
+stepping the engine (See 'record_tick'), and ends the game with the final score (See 'end_game').
+The session file is saved after every game, so games are kept even if the window is closed.
+"""
+
+import os
+from config import SIMULATION_TICK_RATE, REPLAY_CHECKPOINT_INTERVAL
+from game_components.replay.session_file import SessionFile, GameRecord
+
+
+class SessionRecorder():
+
+    def __init__(self, path, rng_backend, tick_rate=SIMULATION_TICK_RATE, checkpoint_interval=REPLAY_CHECKPOINT_INTERVAL):
+        """Initialize Session Recorder
+
+        Parameters:
+            path (str):                 Session file path (Folder is created when the first game is saved)
+            rng_backend (str):          Random number backend of the engine (See 'SessionRNG.BACKEND')
+            tick_rate (int):            Simulation ticks per second
+            checkpoint_interval (int):  Ticks between stored state hashes (1 = Every tick)
+        """
+        self.path = path
+        self.session = SessionFile(rng_backend, tick_rate, checkpoint_interval)
+        self.game_record = None # Game being recorded (None = No game started)
+        self.state_hash = 0 # Chained state hash of last recorded tick
+
+    def start_game(self, seed):
+        """Start recording a new game (A game that was not ended is dropped)
+
+        Parameters:
+            seed (int): Seed the engine was reset with
+        Returns:
+            None
+        """
+        self.game_record = GameRecord(seed)
+        self.state_hash = 0
+
+    def record_tick(self, input_bits, engine):
+        """Record one simulation tick (Call after stepping the engine with the input bits)
+
+        Parameters:
+            input_bits (int):       Player input bitmask of tick
+            engine (GameEngine):    Game engine (Used to hash game state)
+        Returns:
+            None
+        """
+        game_record = self.game_record
+        game_record.add_input(input_bits)
+        self.state_hash = engine.get_state_hash(self.state_hash)
+        if game_record.tick_count % self.session.checkpoint_interval == 0:
+            game_record.checkpoints.append(self.state_hash)
+
+    def end_game(self, final_score, completed=True):
+        """End recorded game and save session file
+
+        Parameters:
+            final_score (int):  Highscore at game end
+            completed (bool):   Game ended by countdown timer (False = Game was quit)
+        Returns:
+            None
+        """
+        if self.game_record is None or self.game_record.tick_count == 0:
+            self.game_record = None
+            return
+
+        self.game_record.final_score = final_score
+        self.game_record.final_hash = self.state_hash
+        self.game_record.completed = completed
+        self.session.games.append(self.game_record)
+        self.game_record = None
+        self.save()
+
+    def save(self):
+        """Save recorded games to session file"""
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.session.save(self.path)
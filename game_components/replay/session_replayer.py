@@ -0,0 +1,98 @@
+# game_components/replay/session_replayer.py
+
+"""
+Session Replayer
+
+Replays recorded games (See 'SessionFile') through a headless game engine as fast as the CPU allows:
+No window, no audio, no sleeping. Every game is reset with its recorded seed and stepped with its recorded
+player input, tick by tick.
+
+The game state is hashed every tick and the hashes are chained, exactly as while recording. The chained hash is
+compared with every stored checkpoint and with the final hash, so a replay that differs from the recorded game
+in any tick raises 'ReplayMismatchError' (e.g. after a change to the game rules).
+"""
+
+import time
+from game_components.core.game_engine import GameEngine
+from game_components.core.session_rng import SessionRNG
+
+
+class ReplayMismatchError(Exception):
+    """Raised when a replayed game differs from the recorded game"""
+
+
+def replay_game(game_record, tick_rate, checkpoint_interval, engine=None):
+    """Replay one recorded game and check it against its state hashes
+
+    Parameters:
+        game_record (GameRecord):   Recorded game
+        tick_rate (int):            Simulation ticks per second of recorded game
+        checkpoint_interval (int):  Ticks between stored state hashes
+        engine (GameEngine):        Engine to step (Default: None = Create new engine)
+    Returns:
+        Final score (int)
+    Raises:
+        ReplayMismatchError: If game state differs from recorded state hashes
+    """
+    if engine is None:
+        engine = GameEngine(tick_rate=tick_rate)
+    engine.set_tick_rate(tick_rate) # Timed game events in ticks of the recorded rate
+    engine.reset(game_record.seed)
+    dt = 1 / tick_rate
+    checkpoints = game_record.checkpoints
+    game_over_event = GameEngine.EVENT_GAME_OVER
+
+    state_hash = 0
+    tick = 0
+    game_over = False
+    for input_bits, length in game_record.input_runs:
+        for run_tick in range(length):
+            if game_over == True:
+                raise ReplayMismatchError(f"Game (Seed {game_record.seed}) ended at tick {tick}, but {game_record.tick_count} ticks were recorded")
+
+            game_over = game_over_event in engine.step(dt, input_bits)
+            state_hash = engine.get_state_hash(state_hash)
+            tick += 1
+
+            if tick % checkpoint_interval == 0 and checkpoints[tick // checkpoint_interval - 1] != state_hash:
+                raise ReplayMismatchError(f"Game (Seed {game_record.seed}) differs from recording at checkpoint of tick {tick}")
+
+    if state_hash != game_record.final_hash:
+        raise ReplayMismatchError(f"Game (Seed {game_record.seed}) differs from recording at last tick {tick}")
+    if game_over != game_record.completed:
+        raise ReplayMismatchError(f"Game (Seed {game_record.seed}) did not end at tick {tick} like the recording")
+    return engine.highscore_num
+
+
+def replay_session(session, engine=None):
+    """Replay all games of a session and check them against their state hashes
+
+    Parameters:
+        session (SessionFile):  Recorded session
+        engine (GameEngine):    Engine to step (Default: None = Create new engine)
+    Returns:
+        A dictionary with games replayed, scores, ticks run and ticks per second (dict)
+    Raises:
+        ReplayMismatchError: If a game differs from its recording, or was recorded with another random number backend
+    """
+    if session.rng_backend != SessionRNG.BACKEND:
+        raise ReplayMismatchError(f"Session was recorded with {session.rng_backend} random numbers, but {SessionRNG.BACKEND} random numbers are used")
+    if engine is None:
+        engine = GameEngine()
+
+    scores = [] # Final score of each replayed game
+    ticks = 0
+    start_time = time.perf_counter()
+
+    for game_record in session.games:
+        scores.append(replay_game(game_record, session.tick_rate, session.checkpoint_interval, engine))
+        ticks += game_record.tick_count
+
+    run_time = time.perf_counter() - start_time
+    return {
+        "games": len(scores),
+        "scores": scores,
+        "ticks": ticks,
+        "run_time": run_time,
+        "ticks_per_second": ticks / run_time if run_time > 0 else 0,
+    }
@@ -0,0 +1,144 @@
+# game_components/replay/session_scrubber.py
+
+"""
+Session Scrubber Class
+
+This class moves back and forth through a recorded game (See 'GameRecord'), e.g. to look into odd player reports
+(See 'ScrubberView' for the window). The game is simulated with a headless game engine and the recorded input.
+
+A full game state keyframe (Engine snapshot and chained state hash) is stored every 'keyframe_interval' ticks,
+when the simulation first passes that tick. Seeking to any tick restores the nearest keyframe before it and
+simulates the remaining ticks (At most 'keyframe_interval'), instead of replaying the game from tick 0.
+Stepping forward just simulates the next tick.
+
+Memory stays small for long games: Input is kept as run-length encoded runs (Start tick and input bits per run),
+and keyframes are stored back to back in a single byte buffer (About 140 bytes each with and without NumPy, so an hour
+at 300-tick keyframes is about 100 KB).
+
+State hashes are checked against the recorded checkpoints while simulating: The first tick that differs from the
+recording is stored in 'first_mismatch_tick'.
+"""
+
+from array import array
+from bisect import bisect_right
+from config import REPLAY_KEYFRAME_INTERVAL
+from game_components.core.game_engine import GameEngine
+
+
+class SessionScrubber():
+
+    def __init__(self, game_record, tick_rate, checkpoint_interval, engine=None, keyframe_interval=REPLAY_KEYFRAME_INTERVAL):
+        """Initialize Session Scrubber: Resets engine to the start of the recorded game (Tick 0)
+
+        Parameters:
+            game_record (GameRecord):   Recorded game
+            tick_rate (int):            Simulation ticks per second of recorded game
+            checkpoint_interval (int):  Ticks between stored state hashes
+            engine (GameEngine):        Engine to simulate with (Default: None = Create new engine)
+            keyframe_interval (int):    Ticks between keyframes
+        """
+        self.engine = engine if engine is not None else GameEngine(tick_rate=tick_rate)
+        self.engine.set_tick_rate(tick_rate) # Timed game events in ticks of the recorded rate
+        self.dt = 1 / tick_rate
+        self.tick_rate = tick_rate
+        self.checkpoint_interval = checkpoint_interval
+        self.keyframe_interval = keyframe_interval
+
+        # Recorded game
+        self.seed = game_record.seed
+        self.tick_count = game_record.tick_count # Last tick (State after all recorded input)
+        self.checkpoints = game_record.checkpoints
+        self.final_hash = game_record.final_hash
+        self.run_starts = array("I") # First tick of each input run
+        self.run_bits = bytearray() # Input bits of each input run
+        run_start = 0
+        for input_bits, length in game_record.input_runs:
+            self.run_starts.append(run_start)
+            self.run_bits.append(input_bits)
+            run_start += length
+
+        # Simulation state
+        self.tick = 0 # Current tick (Number of ticks simulated since game start)
+        self.state_hash = 0 # Chained state hash of current tick
+        self.first_mismatch_tick = None # First tick that differs from recorded checkpoints (None = No difference found)
+
+        # Keyframes (Keyframe n is the state at tick n * keyframe_interval)
+        self.engine.reset(self.seed)
+        self.snapshot_buffer = bytearray(self.engine.get_snapshot_size())
+        self.keyframe_size = len(self.snapshot_buffer) + 4 # Snapshot and chained state hash
+        self.keyframes = bytearray() # Stored keyframes (Back to back)
+        self.keyframe_count = 0
+        self.store_keyframe()
+
+    def get_input(self, tick):
+        """Get recorded input used to simulate from a tick to the next
+
+        Parameters:
+            tick (int): Tick (0 to tick_count - 1)
+        Returns:
+            Input bitmask (int)
+        """
+        return self.run_bits[bisect_right(self.run_starts, tick) - 1]
+
+    def store_keyframe(self):
+        """Store game state of current tick as next keyframe"""
+        self.engine.write_snapshot(self.snapshot_buffer)
+        self.keyframes += self.snapshot_buffer
+        self.keyframes += self.state_hash.to_bytes(4, "little")
+        self.keyframe_count += 1
+
+    def restore_keyframe(self, keyframe_index):
+        """Restore game state of a stored keyframe
+
+        Parameters:
+            keyframe_index (int): Keyframe index
+        Returns:
+            None
+        """
+        offset = keyframe_index * self.keyframe_size
+        snapshot_end = offset + self.keyframe_size - 4
+        self.engine.read_snapshot(self.keyframes, offset)
+        self.state_hash = int.from_bytes(self.keyframes[snapshot_end:snapshot_end + 4], "little")
+        self.tick = keyframe_index * self.keyframe_interval
+
+    def step_forward(self):
+        """Simulate next tick with recorded input (Stores a keyframe and checks state hashes on the way)
+
+        Returns:
+            Events of the simulated tick (list) [Empty at last tick]
+        """
+        if self.tick >= self.tick_count:
+            return []
+
+        events = self.engine.step(self.dt, self.get_input(self.tick))
+        self.tick += 1
+        self.state_hash = self.engine.get_state_hash(self.state_hash)
+
+        # Check state hash against recording
+        if self.first_mismatch_tick is None:
+            if (self.tick % self.checkpoint_interval == 0 and self.checkpoints[self.tick // self.checkpoint_interval - 1] != self.state_hash) or \
+               (self.tick == self.tick_count and self.final_hash != self.state_hash):
+                self.first_mismatch_tick = self.tick
+
+        # Store keyframe when passing its tick for the first time
+        if self.tick % self.keyframe_interval == 0 and self.tick // self.keyframe_interval == self.keyframe_count:
+            self.store_keyframe()
+        return events
+
+    def seek(self, target_tick):
+        """Move to a tick: Simulates forward from the current tick, or from the nearest keyframe before the target tick
+
+        Parameters:
+            target_tick (int): Tick to move to (Clamped to 0 - tick_count)
+        Returns:
+            None
+        """
+        target_tick = max(0, min(target_tick, self.tick_count))
+
+        # Restore nearest keyframe (Unless target is a short step ahead of the current tick)
+        keyframe_index = min(target_tick // self.keyframe_interval, self.keyframe_count - 1)
+        if target_tick < self.tick or keyframe_index * self.keyframe_interval > self.tick:
+            self.restore_keyframe(keyframe_index)
+
+        while self.tick < target_tick:
+            self.step_forward()
@@ -1,3 +1,8 @@
 # game_components/ui/__init__.py
 
-from .game_screen import GameScreen
\ No newline at end of file
+from .game_screen import GameScreen
+from .text_cache import TextCache, text_cache
+from .dirty_renderer import DirtyRectRenderer
+from .text_info import TextInfo
+from .input_handler import InputHandler, InputEvent
+from .perf_hud import PerfHUD
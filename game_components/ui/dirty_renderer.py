@@ -0,0 +1,230 @@
+# game_components/ui/dirty_renderer.py
+
+"""
+Dirty Rect Renderer Class
+
+This class is an optional renderer for the main screen, which only redraws and pushes the parts of the
+screen that changed since the last frame (dirty rectangles), instead of redrawing and flipping the whole window.
+
+Every element drawn through the renderer has a key (e.g. "highscore" or a sprite). The renderer remembers
+which surface was drawn where. When an element moves or changes surface, the area it left and the area
+it now covers are marked dirty (As one area when they overlap). Overlapping dirty areas are merged, so no pixel
+is restored, redrawn or pushed twice. Dirty areas get the background restored, and every element that overlaps
+a dirty area is redrawn (clipped to that area). Only dirty areas are pushed with 'pygame.display.update'.
+
+Usage (once per frame):
+1) 'begin_frame' with the background surface
+2) 'draw' / 'draw_group' for every element, from back to front
+3) 'end_frame' returns the dirty rectangles to push to the display
+
+Counters for pixels pushed are kept, so dirty rendering can be compared against full flips (See 'get_stats')
+
+Element state and dirty rectangles are stored in objects that are reused every frame (See 'DirtyElement'),
+so a frame does not create any dictionaries, lists or tuples once every element has been drawn once.
+"""
+
+import pygame
+
+
+class DirtyElement():
+    """Element drawn through the renderer: Surface and position this frame and last frame (Updated in place)"""
+
+    __slots__ = ("surface", "rect", "drawn", "previous_surface", "previous_rect", "previously_drawn")
+
+    def __init__(self):
+        self.surface = None # Surface drawn this frame
+        self.rect = pygame.Rect(0, 0, 0, 0) # Position this frame
+        self.drawn = False # Flag to check if element was drawn this frame
+        self.previous_surface = None # Surface drawn last frame
+        self.previous_rect = pygame.Rect(0, 0, 0, 0) # Position last frame
+        self.previously_drawn = False # Flag to check if element was drawn last frame
+
+
+class DirtyRectRenderer():
+
+    def __init__(self, screen):
+        """Initialize Dirty Rect Renderer
+
+        Parameters:
+            screen (pygame.Surface):    Display surface to draw on
+        """
+        self.screen = screen # Store display surface
+        self.screen_rect = screen.get_rect() # Used to clip dirty rectangles to the screen
+        self.background = None # Background surface of the current frame
+        self.full_redraw = True # Flag to redraw the whole screen on next frame (e.g. after screen change)
+        self.frame_started = False # Flag to check if 'begin_frame' was called this frame
+
+        self.elements = {} # Elements drawn through the renderer: key -> DirtyElement
+        self.draw_order = [] # Elements drawn this frame (Back to front)
+
+        self.dirty_rects = [] # Dirty rectangles of last frame (Reused every frame)
+        self.dirty_rect_pool = [] # Rectangles used for dirty rectangles (Reused every frame)
+
+        # Pixel counters (Used to compare against full flips)
+        self.frames = 0
+        self.pixels_pushed = 0
+        self.full_frame_pixels = self.screen_rect.width * self.screen_rect.height
+
+    def invalidate(self):
+        """Force a full redraw on next frame (Used when something else has drawn on the screen)"""
+        self.full_redraw = True
+        self.elements.clear()
+
+    def begin_frame(self, background):
+        """Start a new frame
+
+        Parameters:
+            background (pygame.Surface):    Background surface (Screen sized)
+        Returns:
+            None
+        """
+        # New background: Everything needs to be redrawn
+        if background is not self.background:
+            self.background = background
+            self.full_redraw = True
+
+        # Forget elements drawn since last frame ended (e.g. a frame that was started twice)
+        for element in self.draw_order:
+            element.drawn = False
+        self.draw_order.clear()
+        self.frame_started = True
+
+    def draw(self, key, surface, rect):
+        """Add element to the frame
+
+        Parameters:
+            key (hashable):             Key identifying the element between frames
+            surface (pygame.Surface):   Surface to draw
+            rect (pygame.Rect):         Position of surface
+        Returns:
+            None
+        """
+        element = self.elements.get(key)
+        if element is None:
+            element = self.elements[key] = DirtyElement() # First time element is drawn
+
+        element.surface = surface
+        element.rect.update(rect)
+        if element.drawn == False:
+            element.drawn = True
+            self.draw_order.append(element)
+
+    def draw_group(self, group):
+        """Add all sprites in a sprite group to the frame (Sprites are keyed by themselves)
+
+        Parameters:
+            group (pygame.sprite.Group):    Sprite group to draw
+        Returns:
+            None
+        """
+        if isinstance(group, pygame.sprite.GroupSingle): # Single sprite is not stored in 'spritedict'
+            if group.sprite is not None:
+                self.draw(group.sprite, group.sprite.image, group.sprite.rect)
+            return
+        for sprite in group.spritedict: # Sprites in the order they were added (Without copying them to a list)
+            self.draw(sprite, sprite.image, sprite.rect)
+
+    def add_dirty_rect(self, rect):
+        """Add dirty rectangle to this frame (Copied into a reused rectangle)"""
+        dirty_rect_num = len(self.dirty_rects)
+        if dirty_rect_num < len(self.dirty_rect_pool):
+            dirty_rect = self.dirty_rect_pool[dirty_rect_num]
+            dirty_rect.update(rect)
+        else:
+            dirty_rect = pygame.Rect(rect)
+            self.dirty_rect_pool.append(dirty_rect)
+        self.dirty_rects.append(dirty_rect)
+
+    def merge_dirty_rects(self):
+        """Merge overlapping dirty rectangles of this frame into their union (In place, until no dirty rectangles overlap)"""
+        dirty_rect_num = 0
+        while dirty_rect_num < len(self.dirty_rects):
+            dirty_rect = self.dirty_rects[dirty_rect_num]
+            merged = False
+            other_num = dirty_rect_num + 1
+            while other_num < len(self.dirty_rects):
+                if dirty_rect.colliderect(self.dirty_rects[other_num]):
+                    dirty_rect.union_ip(self.dirty_rects.pop(other_num)) # Popped rectangle stays in pool
+                    merged = True
+                else:
+                    other_num += 1
+            # Grown rectangle can overlap rectangles checked before: Check all rectangles again
+            dirty_rect_num = 0 if merged == True else dirty_rect_num + 1
+
+    def end_frame(self):
+        """Draw changed areas of the frame
+
+        Returns:
+            A list of dirty rectangles that needs to be pushed to the display (list) [Reused: Changed on next frame]
+        """
+        self.frame_started = False
+        self.dirty_rects.clear()
+
+        # Full redraw: Draw background and all elements
+        if self.full_redraw == True:
+            self.full_redraw = False
+            self.screen.blit(self.background, (0, 0))
+            for element in self.draw_order:
+                self.screen.blit(element.surface, element.rect)
+            self.add_dirty_rect(self.screen_rect)
+
+        else:
+            for element in self.elements.values():
+                if element.previously_drawn == True:
+                    # Area left and area covered by element that moved, changed or was removed
+                    if element.drawn == False or element.surface is not element.previous_surface or element.rect != element.previous_rect:
+                        self.add_dirty_rect(element.previous_rect)
+                        if element.drawn == True:
+                            if element.rect.colliderect(element.previous_rect):
+                                self.dirty_rects[-1].union_ip(element.rect) # Small move: One area
+                            else:
+                                self.add_dirty_rect(element.rect)
+
+                # Area covered by element that was added
+                elif element.drawn == True:
+                    self.add_dirty_rect(element.rect)
+
+            self.merge_dirty_rects()
+
+            # Restore background and redraw overlapping elements, clipped to each dirty area
+            for dirty_rect in self.dirty_rects:
+                self.screen.set_clip(dirty_rect)
+                self.screen.blit(self.background, dirty_rect, dirty_rect)
+                for element in self.draw_order:
+                    if element.rect.colliderect(dirty_rect):
+                        self.screen.blit(element.surface, element.rect)
+            self.screen.set_clip(None)
+
+        # Current frame becomes previous frame
+        for element in self.elements.values():
+            element.previous_surface = element.surface
+            element.previous_rect.update(element.rect)
+            element.previously_drawn = element.drawn
+            element.drawn = False
+
+        # Update pixel counters
+        self.frames += 1
+        for dirty_rect in self.dirty_rects:
+            visible_rect = dirty_rect.clip(self.screen_rect)
+            self.pixels_pushed += visible_rect.width * visible_rect.height
+
+        return self.dirty_rects
+
+    def get_stats(self):
+        """Return pixel counters and compare them against full flips
+
+        Returns:
+            A dictionary with frames drawn, pixels pushed, pixels a full flip would push, and the ratio between them (dict)
+        """
+        full_flip_pixels = self.frames * self.full_frame_pixels
+        return {
+            "frames": self.frames,
+            "pixels_pushed": self.pixels_pushed,
+            "full_flip_pixels": full_flip_pixels,
+            "ratio": self.pixels_pushed / full_flip_pixels if full_flip_pixels > 0 else 0,
+        }
+
+    def reset_stats(self):
+        """Reset pixel counters"""
+        self.frames = 0
+        self.pixels_pushed = 0
@@ -11,69 +11,114 @@ When you create a new screen, you create a function that draws the elements onto
 1) Create function for drawing screen & handle key input
 2) Add screen to 'screen_manager' function
 3) Add screen to 'update_frame' function (Screen must be drawn constantly)
+
+Static menu screens draw their static elements once in a 'bake_' function. The result is cached as a menu layer
+(See 'get_menu'), so each frame only draws the menu layer and the highlighted button
+
+Menu key presses are read from the event queue by the input handler (See 'InputHandler'), and used one per frame
+(See 'keyboard_input')
+
+Menus only change on input or screen changes: Both set 'redraw_needed', so the game loop can skip drawing idle menus
+(See IDLE_RENDERING)
+
+An overlay (e.g. the performance HUD, see 'PerfHUD') can be drawn on top of every screen (See 'set_overlay')
+
+Screen changes, drawing of every screen and presenting frames are traced as spans (See 'tracer')
+
+HUD values, active screen, selected button and background can be written to and read from a byte buffer with a fixed
+layout (See 'write_snapshot')
 """
 
 
 import pygame
 import sys
 import random
+import struct
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, GAME_TITLE, FONT_PATH, PLAYER_IMAGE_PATH, MENU_SELECTION_SOUND_PATH
 from config import BG_IMAGE_FOLDER_PATH, ARROW_KEYS_IMAGE_PATH, ENTER_KEY_IMAGE_PATH, SPACE_KEY_IMAGE_PATH
+from config import DIRTY_RECT_RENDERING, RENDER_STATS
+from game_components.ui.text_cache import text_cache
+from game_components.ui.dirty_renderer import DirtyRectRenderer
+from game_components.ui.text_info import TextInfo
+from game_components.core.frame_timer import FrameTimer
+from game_components.diagnostics.tracer import tracer
+from game_components.assets import assets
 
 
 class GameScreen():
 
-    def __init__(self, screen):
+    # Text color of highlighted (selected) buttons
+    BTN_HIGHLIGHT_COLOR = "purple3"
+
+    # Screen names (See 'screen_manager') [Stored as index in snapshots]
+    SCREEN_NAMES = ("start_screen", "controls_screen", "about_screen", "main_screen", "end_screen")
+
+    # Snapshot layout: Highscore, countdown timer, active screen, selected button, background (See 'write_snapshot')
+    SNAPSHOT_STRUCT = struct.Struct("<IdBbB")
+
+    def __init__(self, screen, rng=random, input_handler=None):
         """Initialize Game Screen
         
         Parameters:
-            screen (pygame.Surface):    Game screen
+            screen (pygame.Surface):        Game screen
+            rng (RNGStream):                Random number generator used to pick backgrounds (Default: random module)
+            input_handler (InputHandler):   Input handler used for menu key presses (Default: None = Menus get no input)
         """
 
         self.screen = screen # Store game screen
+        self.rng = rng # Random number generator (Seeded stream = Reproducible backgrounds)
+        self.input_handler = input_handler # Menu key presses
         self.selected_btn = 0 # Store selected button (Default: 0)
-        self.key_input_update_delay = 0.1  # Set update delay for key input (in seconds) 
-        self.menu_selection_sound = pygame.mixer.Sound(MENU_SELECTION_SOUND_PATH) # Create menu selection sound
+        self.menu_selection_sound = assets.get_sound(MENU_SELECTION_SOUND_PATH) # Get menu selection sound
+        self.active_game_screen = None # Active screen (Set by 'screen_manager')
+        self.on_screen_change = None # Function called with previous and new screen name on every screen change (None = Not used)
+        self.redraw_needed = True # Screen changed since last frame (Cleared by the game loop before drawing)
+        self.overlay = None # Drawn on top of every frame (None = No overlay) (See 'set_overlay')
+        self.frame_timer = None # Frame timer marking draw and overlay time in 'present' (None = Not timed)
 
         # Placeholder to store variables values from Main Screen
         self.highscore = 0 # Highscore
         self.countdown_timer = 0 # Countdown timer
 
-        self.clock = pygame.time.Clock()  # Initialize a Clock object
-        self.game_start_time = pygame.time.get_ticks()  # Get current time since game / screen start
+        # HUD texts on main screen (Rendered again only when their value changes)
+        self.highscore_text = TextInfo() # Highscore text info (Updated in place)
+        self.countdown_timer_text = TextInfo() # Countdown timer text info (Updated in place)
+        self.drawn_highscore = None # Highscore value of rendered text (None = Not rendered yet)
+        self.drawn_countdown_timer = None # Countdown timer value of rendered text (None = Not rendered yet)
 
-        # Load default background and transform to fit screen size 
-        self.bg_default = pygame.image.load(f"{BG_IMAGE_FOLDER_PATH}/bg_default.png").convert_alpha()
-        self.bg_default = pygame.transform.scale(self.bg_default, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Cached menu layers (Used to draw static menus with a single blit)
+        self.menu_cache = {}
+
+        # Create dirty rect renderer (Used to only redraw changed areas on main screen)
+        self.dirty_renderer = DirtyRectRenderer(screen) if DIRTY_RECT_RENDERING == True else None
+        self.render_stats_text = TextInfo() # Render stats text (Rendered every second when RENDER_STATS is enabled)
+
+        # Get default background transformed to fit screen size 
+        self.bg_default = assets.get_image(f"{BG_IMAGE_FOLDER_PATH}/bg_default.png", size=(SCREEN_WIDTH, SCREEN_HEIGHT))
 
         # Store random backgrounds in a list
         self.bg_images = [] # Used to display random backgrounds on main screen
         
         # Loop through all random backgground and add them to list
         for img in range(0, 6): # 6 total random backgrounds
-            bg_img = pygame.image.load(f"{BG_IMAGE_FOLDER_PATH}/bg_{img}.png").convert_alpha()
-            bg_img = pygame.transform.scale(bg_img, (SCREEN_WIDTH, SCREEN_HEIGHT)) # Transform image to screen size
+            bg_img = assets.get_image(f"{BG_IMAGE_FOLDER_PATH}/bg_{img}.png", size=(SCREEN_WIDTH, SCREEN_HEIGHT)) # Image transformed to screen size
             self.bg_images.append(bg_img)
 
         self.random_bg_img = self.set_new_background() # Store random background image
+
+        # Get keyboard keys images (Controls screen) and transparent player image (End screen)
+        self.arrow_keys_surf = assets.get_image(ARROW_KEYS_IMAGE_PATH)
+        self.enter_key_surf = assets.get_image(ENTER_KEY_IMAGE_PATH)
+        self.space_key_surf = assets.get_image(SPACE_KEY_IMAGE_PATH)
+        self.end_screen_player_surf = assets.get_image(PLAYER_IMAGE_PATH, alpha=140)
         
     #----------------| SCREENS |----------------#
     def start_screen(self):
-        """Create and draw start screen"""
+        """Draw start screen from cached menu layer and handle key input"""
 
-        # Draw default background
-        self.draw_default_background()
-
-        # Draw texts
-        game_title = self.draw_text(text=GAME_TITLE[:10], font_size=94, x_pos=50, y_pos=14) # Game title
-        game_creator = self.draw_text(text="Created by Victor", font_size=25, x_pos=50, y_pos=25) # Game creator
-        game_version = self.draw_text(text=GAME_TITLE[-4:], font_size=20, x_pos=96, y_pos=97) # Game version
-        
-        # Draw buttons (Just text functioning as buttons)
-        btn_play = self.draw_text(text="Play", font_size=40, x_pos=50, y_pos=43.5) # Play
-        btn_controls = self.draw_text(text="Controls", font_size=40, x_pos=50, y_pos=54.5) # Controls
-        btn_about = self.draw_text(text="About", font_size=40, x_pos=50, y_pos=65.5) # About
-        btn_quit = self.draw_text(text="Quit", font_size=40, x_pos=50, y_pos=76.5) # Quit
+        # Draw cached menu layer (Background, texts and buttons)
+        menu = self.get_menu(menu_name="start_screen", bake_menu=self.bake_start_screen)
+        self.screen.blit(menu["layer"], (0, 0))
 
         # Update selected button and check if enter/space key is pressed (Returns True if enter/space key is pressed)
         key_input = self.update_selected_btn(active_screen="start_screen", total_btns=3) # Total buttons: 0, 1, 2, 3...
@@ -81,31 +126,75 @@ class GameScreen():
         # Highlight selected button and manage key input
         # Play
         if self.selected_btn == 0:
-            self.draw_text_highlight(text_info=btn_play)
+            self.draw_menu_highlight(menu=menu, btn_index=0)
             if key_input == True:
                 self.screen_manager("main_screen")
 
         # Controls
         if self.selected_btn == 1:
-            self.draw_text_highlight(text_info=btn_controls)
+            self.draw_menu_highlight(menu=menu, btn_index=1)
             if key_input == True:
                 self.screen_manager("controls_screen")
         
         # About
         if self.selected_btn == 2:
-            self.draw_text_highlight(text_info=btn_about)
+            self.draw_menu_highlight(menu=menu, btn_index=2)
             if key_input == True:
                 self.screen_manager("about_screen")
         
         # Quit
         if self.selected_btn == 3:
-            self.draw_text_highlight(text_info=btn_quit)
+            self.draw_menu_highlight(menu=menu, btn_index=3)
             if key_input == True:
                 pygame.quit()
                 sys.exit()
+
+    def bake_start_screen(self):
+        """Draw static elements of start screen (Used to create cached menu layer)
+
+        Returns:
+            A list with text information of buttons (list)
+        """
+
+        # Draw default background
+        self.draw_default_background()
+
+        # Draw texts
+        game_title = self.draw_text(text=GAME_TITLE[:10], font_size=94, x_pos=50, y_pos=14) # Game title
+        game_creator = self.draw_text(text="Created by Victor", font_size=25, x_pos=50, y_pos=25) # Game creator
+        game_version = self.draw_text(text=GAME_TITLE[-4:], font_size=20, x_pos=96, y_pos=97) # Game version
+        
+        # Draw buttons (Just text functioning as buttons)
+        btn_play = self.draw_text(text="Play", font_size=40, x_pos=50, y_pos=43.5) # Play
+        btn_controls = self.draw_text(text="Controls", font_size=40, x_pos=50, y_pos=54.5) # Controls
+        btn_about = self.draw_text(text="About", font_size=40, x_pos=50, y_pos=65.5) # About
+        btn_quit = self.draw_text(text="Quit", font_size=40, x_pos=50, y_pos=76.5) # Quit
+
+        return [btn_play, btn_controls, btn_about, btn_quit]
     
     def controls_screen(self):
-        """Create and draw controls screen"""
+        """Draw controls screen from cached menu layer and handle key input"""
+
+        # Draw cached menu layer (Background, texts, images and button)
+        menu = self.get_menu(menu_name="controls_screen", bake_menu=self.bake_controls_screen)
+        self.screen.blit(menu["layer"], (0, 0))
+        
+        # Check if enter/space key is pressed (bool)
+        key_input = self.update_selected_btn() # Returns True if enter/space key is pressed
+        
+        # Reset selected button to 0 (We only have 1 button) & manage key input
+        self.selected_btn = 0 
+        if self.selected_btn == 0:
+            self.draw_menu_highlight(menu=menu, btn_index=0)
+            if key_input == True:
+                self.screen_manager("start_screen")
+
+    def bake_controls_screen(self):
+        """Draw static elements of controls screen (Used to create cached menu layer)
+
+        Returns:
+            A list with text information of buttons (list)
+        """
 
         # Draw default background
         self.draw_default_background()
@@ -115,35 +204,45 @@ class GameScreen():
         movement = self.draw_text(text="Movement:", font_size=50, x_pos=24, y_pos=40) # Movement
         confirm = self.draw_text(text="Confirm:", font_size=50, x_pos=78, y_pos=40) # Confirm
         
-        # Load and draw keyboard keys images
+        # Draw keyboard keys images
         # Arrow keys
-        arrow_keys_surf = pygame.image.load(ARROW_KEYS_IMAGE_PATH).convert_alpha()
-        arrow_keys_rect = arrow_keys_surf.get_rect(center=((SCREEN_WIDTH * (24 / 100), SCREEN_HEIGHT * (59 / 100))))
-        self.screen.blit(arrow_keys_surf, arrow_keys_rect)
+        arrow_keys_rect = self.arrow_keys_surf.get_rect(center=((SCREEN_WIDTH * (24 / 100), SCREEN_HEIGHT * (59 / 100))))
+        self.screen.blit(self.arrow_keys_surf, arrow_keys_rect)
         # Enter key
-        enter_key_surf = pygame.image.load(ENTER_KEY_IMAGE_PATH).convert_alpha()
-        enter_key_rect = enter_key_surf.get_rect(center=((SCREEN_WIDTH * (65 / 100), SCREEN_HEIGHT * (59 / 100))))
-        self.screen.blit(enter_key_surf, enter_key_rect)
+        enter_key_rect = self.enter_key_surf.get_rect(center=((SCREEN_WIDTH * (65 / 100), SCREEN_HEIGHT * (59 / 100))))
+        self.screen.blit(self.enter_key_surf, enter_key_rect)
         # Space key
-        space_key_surf = pygame.image.load(SPACE_KEY_IMAGE_PATH).convert_alpha()
-        space_key_rect = space_key_surf.get_rect(center=((SCREEN_WIDTH * (84.5 / 100), SCREEN_HEIGHT * (59 / 100))))
-        self.screen.blit(space_key_surf, space_key_rect)
+        space_key_rect = self.space_key_surf.get_rect(center=((SCREEN_WIDTH * (84.5 / 100), SCREEN_HEIGHT * (59 / 100))))
+        self.screen.blit(self.space_key_surf, space_key_rect)
 
         # Draw back button (Just text functioning as button)
         btn_back = self.draw_text(text="Back", font_size=40, x_pos=50, y_pos=92) # Back
+
+        return [btn_back]
+    
+    def about_screen(self):
+        """Draw about screen from cached menu layer and handle key input"""
+
+        # Draw cached menu layer (Background, overlay, texts and button)
+        menu = self.get_menu(menu_name="about_screen", bake_menu=self.bake_about_screen)
+        self.screen.blit(menu["layer"], (0, 0))
         
         # Check if enter/space key is pressed (bool)
-        key_input = self.update_selected_btn() # Returns True if enter/space key is pressed
+        key_input = self.update_selected_btn()
         
         # Reset selected button to 0 (We only have 1 button) & manage key input
-        self.selected_btn = 0 
+        self.selected_btn = 0
         if self.selected_btn == 0:
-            self.draw_text_highlight(text_info=btn_back)
+            self.draw_menu_highlight(menu=menu, btn_index=0)
             if key_input == True:
                 self.screen_manager("start_screen")
-    
-    def about_screen(self):
-        """Create and draw about screen"""
+
+    def bake_about_screen(self):
+        """Draw static elements of about screen (Used to create cached menu layer)
+
+        Returns:
+            A list with text information of buttons (list)
+        """
             
         # Draw default background
         self.draw_default_background()
@@ -190,53 +289,46 @@ class GameScreen():
 
         # Draw back button (Just text functioning as button)
         btn_back = self.draw_text(text="Back", font_size=40, x_pos=50, y_pos=92)
-        
-        # Check if enter/space key is pressed (bool)
-        key_input = self.update_selected_btn()
-        
-        # Reset selected button to 0 (We only have 1 button) & manage key input
-        self.selected_btn = 0
-        if self.selected_btn == 0:
-            self.draw_text_highlight(text_info=btn_back)
-            if key_input == True:
-                self.screen_manager("start_screen")
+
+        return [btn_back]
 
     def main_screen(self):
         """Create and draw main screen"""
 
         # Draw random background from stored value in set_bg_img
-        self.screen.blit(self.random_bg_img, (0, 0))
-
-        # Draw highscore text and cache text size & position
-        self.highscore_text = self.draw_text(text=f"Score: {self.highscore}", font_size=40, x_pos=50, y_pos=6, return_text_info=True) # Draw highscore text
-        self.cache_text_info(get_text_info=self.highscore_text) # Cache highscore text position and size (Used for spawn restrictions)
-        # Draw countdown timer text and cache text size & position
-        self.countdown_timer_text = self.draw_text(text=f"Timer: {self.countdown_timer}", font_size=25, x_pos=50, y_pos=11.5, return_text_info=True) # Draw countdown timer text
-        self.cache_text_info(get_text_info=self.countdown_timer_text) # Cache countdown timer text position and size
-        
-        # Draw player & apple(s)
-        self.player_group.draw(self.screen)
-        self.sprite_group.draw(self.screen) 
-    
-    def end_screen(self):
-        """Create and draw end screen"""
+        if self.dirty_renderer is not None:
+            self.dirty_renderer.begin_frame(self.random_bg_img) # Background is only redrawn behind changed areas
+        else:
+            self.screen.blit(self.random_bg_img, (0, 0))
 
-        # Draw default background
-        self.draw_default_background()
+        # Render highscore & countdown timer texts (Only when their value changed: Text infos are updated in place)
+        # Note: Game engine measures the same texts for apple-spawn restrictions (See 'GameEngine.HUD_TEXT_LAYOUT')
+        if self.highscore != self.drawn_highscore:
+            self.drawn_highscore = self.highscore
+            self.render_text(text=f"Score: {self.highscore}", font_size=40, x_pos=50, y_pos=6, text_info=self.highscore_text) # Render highscore text
+        if self.countdown_timer != self.drawn_countdown_timer:
+            self.drawn_countdown_timer = self.countdown_timer
+            self.render_text(text=f"Timer: {self.countdown_timer}", font_size=25, x_pos=50, y_pos=11.5, text_info=self.countdown_timer_text) # Render countdown timer text
 
-        # Draw highscore
-        highscore = self.draw_text(text=f"Score: {self.highscore}", font_size=70, x_pos=50, y_pos=8)
+        # Draw highscore & countdown timer texts
+        self.blit_text(self.highscore_text, dirty_key="highscore")
+        self.blit_text(self.countdown_timer_text, dirty_key="countdown_timer")
 
-        # Load and draw player image (Image used for display)
-        end_screen_player_surf = pygame.image.load(PLAYER_IMAGE_PATH).convert_alpha()
-        end_screen_player_surf.set_alpha(140)
-        end_screen_player_rect = end_screen_player_surf.get_rect(center=((SCREEN_WIDTH * (50 / 100), SCREEN_HEIGHT * (50 / 100))))
-        self.screen.blit(end_screen_player_surf, end_screen_player_rect)
+        # Draw player & apple(s)
+        self.draw_sprites(self.player_group)
+        self.draw_sprites(self.sprite_group)
 
-        # Draw buttons (Just text functioning as buttons)
-        btn_restart = self.draw_text(text="Restart", font_size=40, x_pos=50, y_pos=39) # Restart
-        btn_main_menu = self.draw_text(text="Main Menu", font_size=40, x_pos=50, y_pos=50) # Main menu
-        btn_quit = self.draw_text(text="Quit", font_size=40, x_pos=50, y_pos=61) # Quit
+        # Draw render stats (Pixels pushed compared to full flips)
+        if self.dirty_renderer is not None and RENDER_STATS == True:
+            self.draw_render_stats()
+    
+    def end_screen(self):
+        """Draw end screen from cached menu layer and handle key input"""
+
+        # Draw cached menu layer (Background, highscore, player image and buttons)
+        # Highscore is part of the layer, so the layer is recreated when the highscore changes
+        menu = self.get_menu(menu_name="end_screen", bake_menu=self.bake_end_screen, menu_key=self.highscore)
+        self.screen.blit(menu["layer"], (0, 0))
 
         # Update selected button and check if space key is pressed
         key_input = self.update_selected_btn(active_screen="end_screen", total_btns=2)
@@ -244,35 +336,64 @@ class GameScreen():
         # Highlight selected button and manage key input
         # Restart
         if self.selected_btn == 0:
-            self.draw_text_highlight(text_info=btn_restart)
+            self.draw_menu_highlight(menu=menu, btn_index=0)
             if key_input == True:
                 self.screen_manager("main_screen")
 
         # Main Menu / Start screen
         if self.selected_btn == 1:
-            self.draw_text_highlight(text_info=btn_main_menu)
+            self.draw_menu_highlight(menu=menu, btn_index=1)
             if key_input == True:
                 self.screen_manager("start_screen")
         
         # Quit
         if self.selected_btn == 2:
-            self.draw_text_highlight(text_info=btn_quit)
+            self.draw_menu_highlight(menu=menu, btn_index=2)
             if key_input == True:
                 pygame.quit()
                 sys.exit()
 
+    def bake_end_screen(self):
+        """Draw static elements of end screen (Used to create cached menu layer)
+
+        Returns:
+            A list with text information of buttons (list)
+        """
+
+        # Draw default background
+        self.draw_default_background()
+
+        # Draw highscore
+        highscore = self.draw_text(text=f"Score: {self.highscore}", font_size=70, x_pos=50, y_pos=8)
+
+        # Draw transparent player image (Image used for display)
+        end_screen_player_rect = self.end_screen_player_surf.get_rect(center=((SCREEN_WIDTH * (50 / 100), SCREEN_HEIGHT * (50 / 100))))
+        self.screen.blit(self.end_screen_player_surf, end_screen_player_rect)
+
+        # Draw buttons (Just text functioning as buttons)
+        btn_restart = self.draw_text(text="Restart", font_size=40, x_pos=50, y_pos=39) # Restart
+        btn_main_menu = self.draw_text(text="Main Menu", font_size=40, x_pos=50, y_pos=50) # Main menu
+        btn_quit = self.draw_text(text="Quit", font_size=40, x_pos=50, y_pos=61) # Quit
+
+        return [btn_restart, btn_main_menu, btn_quit]
+
 
     #----------------| HELPER FUNCTIONS |----------------#
     def screen_manager(self, active_screen="start_screen"):
         """Manages the game screens by switching between them
-        Also resets selected button to 0 when switching screens
+        Also resets selected button to 0 when switching screens, and reports the change to 'on_screen_change'
 
         Parameters:
             active_screen (str): Screen to switch to (Default: Start screen)
         Returns:
             None
         """
+        tracer.begin("GameScreen.screen_manager", {"screen": active_screen})
+        previous_screen = self.active_game_screen
         self.active_game_screen = active_screen # Get active screen
+        self.redraw_needed = True # Draw new screen
+        if self.on_screen_change is not None:
+            self.on_screen_change(previous_screen, active_screen) # e.g. Cancel timed game events when main screen is left
 
         # Change to start screen
         if self.active_game_screen == "start_screen":
@@ -294,29 +415,76 @@ class GameScreen():
         elif self.active_game_screen == "end_screen":
             self.selected_btn = 0
             self.end_screen()
+        tracer.end()
+
+    def present(self):
+        """Push the drawn frame to the display
+        With dirty rect rendering on main screen, only changed areas are pushed. Otherwise the whole window is flipped
+        """
+        # Push dirty areas (Main screen was drawn through dirty rect renderer)
+        if self.dirty_renderer is not None and self.dirty_renderer.frame_started == True:
+            dirty_rects = self.dirty_renderer.end_frame() # Draws changed areas
+            if self.frame_timer is not None:
+                self.frame_timer.mark(FrameTimer.PHASE_DRAW)
+            if self.overlay is not None:
+                dirty_rects.append(self.draw_overlay()) # Overlay area is pushed every frame
+            pygame.display.update(dirty_rects)
+
+        # Flip whole window
+        else:
+            if self.dirty_renderer is not None:
+                self.dirty_renderer.invalidate() # Another screen was drawn: Redraw everything next time main screen is drawn
+            if self.overlay is not None:
+                self.draw_overlay()
+            pygame.display.flip()
+
+    def draw_overlay(self):
+        """Draw overlay on top of the frame (Marks overlay time if a frame timer is set)
+
+        Returns:
+            Area drawn on (pygame.Rect)
+        """
+        overlay_rect = self.overlay.draw(self.screen)
+        if self.frame_timer is not None:
+            self.frame_timer.mark(FrameTimer.PHASE_OVERLAY)
+        return overlay_rect
+
+    def set_overlay(self, overlay):
+        """Set overlay drawn on top of every frame (Whole screen is drawn again)
+
+        Parameters:
+            overlay (PerfHUD): Overlay with a 'draw(screen)' method returning the area drawn on (None = Remove overlay)
+        Returns:
+            None
+        """
+        self.overlay = overlay
+        self.redraw_needed = True
+        if self.dirty_renderer is not None:
+            self.dirty_renderer.invalidate() # Area under removed overlay is drawn again
 
     def update_frame(self):
         """Update frames on active screen
         Used to constantly update graphics on active screen
         Note: This function needs to be updated constantly
         """
-        # Update frame of active screen
-        if self.active_game_screen == "start_screen": # Start screen
-            self.start_screen()
-        elif self.active_game_screen == "controls_screen": # Controls screen
-            self.controls_screen()
-        elif self.active_game_screen == "about_screen": # About screen
-            self.about_screen()
-        elif self.active_game_screen == "main_screen": # Main screen
-            self.main_screen()
-        elif self.active_game_screen == "end_screen": # End screen
-            self.end_screen()
+        # Update frame of active screen (Traced with screen name)
+        with tracer.span(self.active_game_screen):
+            if self.active_game_screen == "start_screen": # Start screen
+                self.start_screen()
+            elif self.active_game_screen == "controls_screen": # Controls screen
+                self.controls_screen()
+            elif self.active_game_screen == "about_screen": # About screen
+                self.about_screen()
+            elif self.active_game_screen == "main_screen": # Main screen
+                self.main_screen()
+            elif self.active_game_screen == "end_screen": # End screen
+                self.end_screen()
     
     def draw_default_background(self):
         """Draw default background on screen"""
         self.screen.blit(self.bg_default, (0, 0))
 
-    def draw_text(self, text="", font_size=10, color="White", x_pos=0, y_pos=0, return_text_info=False):
+    def draw_text(self, text="", font_size=10, color="White", x_pos=0, y_pos=0, dirty_key=None, text_info=None):
         """Create and draw text on screen
 
         Parameters:
@@ -325,41 +493,130 @@ class GameScreen():
             color (str):                Text color (Default: White) (See: https://www.pygame.org/docs/ref/color_list.html)
             x_pos (float):              X-coordinate for the text position (percentage of screen width) (default is 0)
             y_pos (float):              Y-coordinate for the text position (percentage of screen height) (default is 0)
-            return_text_info (bool):    Flag to determine if text information should be returned (default is False)
+            dirty_key (str):            Key used to draw text through dirty rect renderer, if enabled (default is None = Draw directly)
+            text_info (TextInfo):       Text info to update in place (default is None = Create new text info)
         Returns:
-            If return_text_info is True, a dictionary with text position and size
-                Otherwise, a dictionary with text font, text string, and text rectangle object
+            Text info with text string, font size, text font, rendered surface and text rectangle (TextInfo)
         """
+        text_info = self.render_text(text=text, font_size=font_size, color=color, x_pos=x_pos, y_pos=y_pos, text_info=text_info)
+        self.blit_text(text_info, dirty_key=dirty_key)
+        return text_info
 
-        text_font = pygame.font.Font(FONT_PATH, font_size)
-        text_surface = text_font.render(str(text), True, pygame.color.Color(color)).convert_alpha()
+    def render_text(self, text="", font_size=10, color="White", x_pos=0, y_pos=0, text_info=None):
+        """Render and position text without drawing it (Same parameters as 'draw_text')
+
+        Returns:
+            Text info with text string, font size, text font, rendered surface and text rectangle (TextInfo)
+        """
+        text = str(text)
+        text_font = text_cache.get_font(FONT_PATH, font_size) # Get font from text cache
+        text_surface = text_cache.render(text, font_size, color, FONT_PATH) # Get rendered text from text cache
         text_rect = text_surface.get_rect(center=((SCREEN_WIDTH * (x_pos / 100), SCREEN_HEIGHT * (y_pos / 100))))
-        self.screen.blit(text_surface, text_rect)
 
-        # If return_text_info is True, return text position and size
-        if return_text_info == True:
-            # Create dictionary with text position and size, and return it
-            values_dict = {"x_pos": text_rect.centerx, "y_pos": text_rect.centery, "width": text_rect.width, "height": text_rect.height}
-            return values_dict
+        # Create new text info, or update given text info in place
+        if text_info is None:
+            return TextInfo(text, font_size, text_font, text_surface, text_rect)
+        text_info.text = text
+        text_info.font_size = font_size
+        text_info.text_font = text_font
+        text_info.text_surface = text_surface
+        text_info.text_rect = text_rect
+        return text_info
+
+    def blit_text(self, text_info, dirty_key=None):
+        """Draw rendered text on screen
+
+        Parameters:
+            text_info (TextInfo):   Rendered text (See 'render_text')
+            dirty_key (str):        Key used to draw text through dirty rect renderer, if enabled (default is None = Draw directly)
+        Returns:
+            None
+        """
+        if dirty_key is not None and self.dirty_renderer is not None:
+            self.dirty_renderer.draw(dirty_key, text_info.text_surface, text_info.text_rect) # Only redrawn if text or position changed
         else:
-            # Create dictionary with text surface and rect, and return it
-            values_dict = {"text_font": text_font, "text": str(text), "text_rect": text_rect}
-            return values_dict
+            self.screen.blit(text_info.text_surface, text_info.text_rect)
 
-    def draw_text_highlight(self, text_info=None, highlight_color="purple3"):
-        """Highlight selected text
-        Takes a given text and changes its color to create a highlight effect, and draws it to screen
+    def draw_sprites(self, group):
+        """Draw all sprites of a sprite group on screen
+        Same as 'group.draw', but without creating lists and tuples every frame
 
         Parameters:
-            text_info (dict):           Dictionary with text font, text string, and text rectangle object of text to highlight)
-            highlight_color (str):      Text highlight color (Default: purple3) (See: https://www.pygame.org/docs/ref/color_list.html)
+            group (pygame.sprite.Group):    Sprite group to draw
         Returns:
             None
         """
-        text_font = text_info["text_font"] # Get text font
-        text_surface = text_font.render(text_info["text"], True, pygame.color.Color(highlight_color)).convert_alpha() # Highlight text (Changes text color)
-        
-        self.screen.blit(text_surface, text_info["text_rect"]) # Draw highlighted text on screen
+        if self.dirty_renderer is not None:
+            self.dirty_renderer.draw_group(group) # Only redrawn if sprite moved or changed
+        elif isinstance(group, pygame.sprite.GroupSingle): # Single sprite is not stored in 'spritedict'
+            if group.sprite is not None:
+                self.screen.blit(group.sprite.image, group.sprite.rect)
+        else:
+            for sprite in group.spritedict: # Sprites in the order they were added
+                self.screen.blit(sprite.image, sprite.rect)
+
+    def get_menu(self, menu_name="", bake_menu=None, menu_key=None):
+        """Get cached menu layer
+        Static menu elements (background, texts, images and buttons) are drawn once into a menu layer,
+        so each frame only needs to draw the layer and the highlighted button.
+        The menu layer is recreated when the screen resolution or the menu key (e.g. highscore) changes
+
+        Parameters:
+            menu_name (str):        Name of menu (Used as cache key)
+            bake_menu (function):   Function that draws the static menu elements and returns the buttons text information
+            menu_key (any):         Value the menu layer depends on (Default: None)
+        Returns:
+            A dictionary with menu layer, buttons text information and prerendered highlighted buttons (dict)
+        """
+        screen_size = self.screen.get_size()
+        menu = self.menu_cache.get(menu_name)
+
+        # Return cached menu if still valid
+        if menu is not None and menu["screen_size"] == screen_size and menu["menu_key"] == menu_key:
+            return menu
+
+        # Draw static menu elements onto menu layer (Temporarily replaces screen surface)
+        menu_layer = pygame.Surface(screen_size).convert()
+        screen = self.screen
+        self.screen = menu_layer
+        buttons = bake_menu()
+        self.screen = screen
+
+        # Prerender highlighted buttons
+        highlighted_buttons = []
+        for btn in buttons:
+            highlighted_buttons.append(text_cache.render(btn.text, btn.font_size, self.BTN_HIGHLIGHT_COLOR, FONT_PATH))
+
+        # Store menu in cache
+        menu = {"layer": menu_layer, "buttons": buttons, "highlighted_buttons": highlighted_buttons, "screen_size": screen_size, "menu_key": menu_key}
+        self.menu_cache[menu_name] = menu
+        return menu
+
+    def draw_menu_highlight(self, menu=None, btn_index=0):
+        """Draw prerendered highlighted button on top of menu layer
+
+        Parameters:
+            menu (dict):        Menu from 'get_menu'
+            btn_index (int):    Index of button to highlight
+        Returns:
+            None
+        """
+        self.screen.blit(menu["highlighted_buttons"][btn_index], menu["buttons"][btn_index].text_rect)
+
+    def draw_render_stats(self):
+        """Draw pixels pushed per frame compared to full flips (Dirty rect rendering)
+        Stats are averaged and updated once per second, so the stats text itself rarely becomes dirty
+        """
+        if self.dirty_renderer.frames >= 60: # Counters are read directly (No stats dictionary every frame)
+            stats = self.dirty_renderer.get_stats()
+            pixels_per_frame = stats["pixels_pushed"] // stats["frames"]
+            self.render_stats_text.text = f"Pixels/frame: {pixels_per_frame} | Full flip: {self.dirty_renderer.full_frame_pixels} | {stats['ratio'] * 100:.1f}%"
+            self.render_stats_text.text_surface = text_cache.render(self.render_stats_text.text, 16, "White", "Arial", system_font=True)
+            self.render_stats_text.text_rect = self.render_stats_text.text_surface.get_rect(bottomleft=(6, SCREEN_HEIGHT - 4))
+            self.dirty_renderer.reset_stats()
+
+        if self.render_stats_text.text is not None:
+            self.blit_text(self.render_stats_text, dirty_key="render_stats")
 
     def update_text(self, text_to_update=None, new_text_value=None):
         """Update dynamic texts on screen
@@ -377,52 +634,20 @@ class GameScreen():
         elif text_to_update == "countdown_timer": # Update countdown timer text
             self.countdown_timer = new_text_value
 
-    def cache_text_info(self, get_text_info=None, return_text_info=""):
-        """Cache position and size of text 
-        Gets text position and size in dictionary (Size is not constant as text changes). 
-        Returns dictionary with cached information to main screen
-        The cached information is used to create boudariens around text, which is used for spawn restrictions 
-        
-        Needed for highscore and countdown timer
-        
-        Parameters:
-            get_text_info (dict):      Dictionary with text position and size to cache
-            return_text_info (str):    Which dictionary with cached information to return
-        Returns:
-            A dictionary with the cached information (dict)
-        """
-        # Cache text position and size
-        if get_text_info == self.highscore_text: # Highscore text
-            self.highscore_text_info = get_text_info
-        elif get_text_info == self.countdown_timer_text: # Countdown timer text
-            self.countdown_timer_text_info = get_text_info
-            
-        # Return cached text position and size
-        if return_text_info == "highscore": # Highscore text
-            return self.highscore_text_info
-        elif return_text_info == "countdown_timer": # Countdown timer text
-            return self.countdown_timer_text_info
-
     def keyboard_input(self):
-        """Get keyboard input
+        """Get keyboard input: Oldest menu key press from the input handler (One per frame)
 
         Returns:
             If arrow keys or enter/space key is pressed, return key input (str)
 
         """
-        current_time = pygame.time.get_ticks()  # Get the current time
+        if self.input_handler is None:
+            return None
 
-        # Check for key input after a delay
-        if current_time - self.game_start_time > self.key_input_update_delay*1000:
-            self.game_start_time = current_time  # Update game start time
-            keys = pygame.key.get_pressed()  # Get key input
-
-            if keys[pygame.K_UP]: # Up arrow
-                return "up_arrow"
-            elif keys[pygame.K_DOWN]: # Down arrow
-                return "down_arrow"
-            elif keys[pygame.K_RETURN] or keys[pygame.K_SPACE]: # Enter & Space key
-                return "enter"
+        input_event = self.input_handler.get_menu_input(self.active_game_screen) # Latency is measured for active screen
+        if input_event is not None:
+            self.redraw_needed = True # Draw next frame too (Selected button wraps around at the start of the next frame)
+            return input_event.action # "up_arrow", "down_arrow" or "enter"
 
     def update_selected_btn(self, active_screen="", total_btns=0):
         """Updates value of selected button based on key input & plays menu selection sound
@@ -464,7 +689,7 @@ class GameScreen():
         Returns:
             A random background image (pygame.image)
         """
-        return random.choice(self.bg_images)
+        return self.rng.choice(self.bg_images)
         
     def retrieve_sprites(self, player_group="", sprite_group=""):
         """Retrieve sprite groups for drawing
@@ -478,3 +703,35 @@ class GameScreen():
         """
         self.player_group = player_group
         self.sprite_group = sprite_group
+
+    def write_snapshot(self, buffer, offset=0):
+        """Write HUD values, active screen, selected button and background into a byte buffer (See 'SNAPSHOT_STRUCT')
+
+        Parameters:
+            buffer (bytearray): Buffer to write into
+            offset (int):       Position in buffer (in bytes)
+        Returns:
+            Position after screen state (int)
+        """
+        self.SNAPSHOT_STRUCT.pack_into(buffer, offset, self.highscore, self.countdown_timer, self.SCREEN_NAMES.index(self.active_game_screen),
+                                       self.selected_btn, self.bg_images.index(self.random_bg_img))
+        return offset + self.SNAPSHOT_STRUCT.size
+
+    def read_snapshot(self, buffer, offset=0):
+        """Read screen state from a byte buffer written by 'write_snapshot'
+        The active screen is set without switching screens (No sounds, no new background)
+
+        Parameters:
+            buffer (bytes):     Buffer to read from
+            offset (int):       Position in buffer (in bytes)
+        Returns:
+            Position after screen state (int)
+        """
+        self.highscore, self.countdown_timer, screen_index, self.selected_btn, bg_index = self.SNAPSHOT_STRUCT.unpack_from(buffer, offset)
+        self.active_game_screen = self.SCREEN_NAMES[screen_index]
+        self.redraw_needed = True # Draw restored screen
+        if self.bg_images[bg_index] is not self.random_bg_img:
+            self.random_bg_img = self.bg_images[bg_index]
+            if self.dirty_renderer is not None:
+                self.dirty_renderer.invalidate() # Background changed: Redraw everything
+        return offset + self.SNAPSHOT_STRUCT.size
@@ -0,0 +1,210 @@
+# game_components/ui/input_handler.py
+
+"""
+Input Handler Class
+
+This class reads input from the pygame event queue once per frame (See 'pump'), instead of polling the keyboard
+state with a fixed delay. Every key press is kept in a queue until a menu uses it (See 'get_menu_input'), so fast
+presses are neither dropped nor delayed. Held keys repeat with KEY_REPEAT_DELAY and KEY_REPEAT_INTERVAL in menus,
+but repeated presses are not counted as new presses (See 'pressed_keys': e.g. holding F3 toggles the HUD once).
+
+Only the event types the game uses are let into the event queue (See 'ALLOWED_EVENT_TYPES'), so SDL does not queue
+mouse motion and other events nobody reads. Window events are used to track whether the window is focused and not
+minimized (See 'window_active'), and whether it has to be drawn again (See 'redraw_requested').
+
+Instead of reading the queue, idle screens can block until an event arrives (See 'wait'), so they use no CPU time
+while nothing happens.
+
+Every input is stamped with the time it was read from the event queue. When a menu uses an input, the time until the
+frame showing its result is presented is measured per screen (Input-to-photon latency, see 'frame_presented').
+Measured up to the display update: Time spent by the compositor and the monitor is not included.
+
+Player movement on the main screen is not read here: It uses the keyboard state once per simulation tick
+(See 'Player.keyboard_input').
+"""
+
+import time
+from collections import deque
+import pygame
+from config import KEY_REPEAT_DELAY, KEY_REPEAT_INTERVAL
+
+
+class InputEvent():
+
+    __slots__ = ("action", "key", "timestamp")
+
+    def __init__(self, action, key, timestamp):
+        """Initialize Input Event
+
+        Parameters:
+            action (str):       Menu action (e.g. "up_arrow", "down_arrow", "enter")
+            key (int):          Pressed key (e.g. pygame.K_UP)
+            timestamp (float):  Time the input was read from the event queue (in seconds) [time.perf_counter]
+        """
+        self.action = action
+        self.key = key
+        self.timestamp = timestamp
+
+
+class InputHandler():
+
+    # Event types let into the event queue (All others are blocked)
+    ALLOWED_EVENT_TYPES = [pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP,
+                           pygame.WINDOWFOCUSGAINED, pygame.WINDOWFOCUSLOST, pygame.WINDOWMINIMIZED, pygame.WINDOWRESTORED,
+                           pygame.WINDOWMAXIMIZED, pygame.WINDOWSHOWN, pygame.WINDOWHIDDEN, pygame.WINDOWEXPOSED]
+
+    # Keys used in menus: key -> menu action
+    MENU_ACTIONS = {
+        pygame.K_UP: "up_arrow",
+        pygame.K_DOWN: "down_arrow",
+        pygame.K_RETURN: "enter",
+        pygame.K_KP_ENTER: "enter",
+        pygame.K_SPACE: "enter",
+    }
+
+    def __init__(self, key_repeat_delay=KEY_REPEAT_DELAY, key_repeat_interval=KEY_REPEAT_INTERVAL):
+        """Initialize Input Handler: Sets allowed event types and key repeat (Requires initialized pygame)
+
+        Parameters:
+            key_repeat_delay (int):     Time a key is held before it repeats (in milliseconds) [0 = No key repeat]
+            key_repeat_interval (int):  Time between repeated key presses (in milliseconds)
+        """
+        pygame.event.set_blocked(None) # Block all event types...
+        pygame.event.set_allowed(self.ALLOWED_EVENT_TYPES) # ...except the ones used by the game
+        pygame.key.set_repeat(key_repeat_delay, key_repeat_interval)
+
+        self.menu_inputs = deque() # Key presses not yet used by a menu (Oldest first)
+        self.held_keys = set() # Keys currently held down
+        self.pressed_keys = [] # Keys pressed since events were last read, without key repeats (e.g. F3 toggles performance HUD)
+        self.quit_requested = False # Window close button was clicked
+
+        # Window state (Window is assumed focused and visible until told otherwise)
+        self.window_focused = True
+        self.window_minimized = False
+        self.window_active = True # Focused and not minimized
+        self.redraw_requested = False # Window content was lost or window became active again (Cleared by the game after drawing)
+
+        # Input-to-photon latency
+        self.handled_inputs = [] # Inputs used by a menu this frame: (timestamp, screen name)
+        self.latency_stats = {} # Screen name -> [Number of inputs, total latency, maximum latency] (in seconds)
+
+    def pump(self, collect_menu_inputs=True):
+        """Read all events from the event queue (Call once per frame)
+
+        Parameters:
+            collect_menu_inputs (bool): Queue key presses for menus (Default: True) [False on main screen: Presses are not used]
+        Returns:
+            None
+        """
+        self.pressed_keys.clear()
+        self.read_events(collect_menu_inputs)
+
+    def wait(self, timeout, collect_menu_inputs=True):
+        """Block until an event arrives or timeout has passed, then read all events (Used by idle screens: No CPU time while waiting)
+
+        Parameters:
+            timeout (int):              Maximum time to wait (in milliseconds)
+            collect_menu_inputs (bool): Queue key presses for menus (Default: True)
+        Returns:
+            None
+        """
+        self.pressed_keys.clear()
+        event = pygame.event.wait(timeout)
+        if event.type != pygame.NOEVENT:
+            self.handle_event(event, time.perf_counter(), collect_menu_inputs)
+        self.read_events(collect_menu_inputs) # Events that arrived together with the first one
+
+    def read_events(self, collect_menu_inputs=True):
+        """Handle all events in the event queue
+
+        Parameters:
+            collect_menu_inputs (bool): Queue key presses for menus
+        Returns:
+            None
+        """
+        timestamp = time.perf_counter() # Events of one frame are read at the same time
+        for event in pygame.event.get():
+            self.handle_event(event, timestamp, collect_menu_inputs)
+
+    def handle_event(self, event, timestamp, collect_menu_inputs=True):
+        """Handle one event from the event queue
+
+        Parameters:
+            event (pygame.event.Event): Event
+            timestamp (float):          Time the event was read (in seconds) [time.perf_counter]
+            collect_menu_inputs (bool): Queue key presses for menus
+        Returns:
+            None
+        """
+        if event.type == pygame.KEYDOWN:
+            if event.key not in self.held_keys: # Key repeats of held keys are only used by menus
+                self.held_keys.add(event.key)
+                self.pressed_keys.append(event.key)
+            action = self.MENU_ACTIONS.get(event.key)
+            if action is not None and collect_menu_inputs == True:
+                self.menu_inputs.append(InputEvent(action, event.key, timestamp))
+        elif event.type == pygame.KEYUP:
+            self.held_keys.discard(event.key)
+        elif event.type == pygame.QUIT:
+            self.quit_requested = True
+
+        # Window state
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            self.window_focused = False
+            self.held_keys.clear() # Keys released while unfocused send no KEYUP
+        elif event.type == pygame.WINDOWFOCUSGAINED:
+            self.window_focused = True
+        elif event.type in (pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN):
+            self.window_minimized = True
+        elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWMAXIMIZED, pygame.WINDOWSHOWN):
+            self.window_minimized = False
+        elif event.type == pygame.WINDOWEXPOSED:
+            self.redraw_requested = True
+
+        window_active = self.window_focused == True and self.window_minimized == False
+        if window_active == True and self.window_active == False:
+            self.redraw_requested = True # Show current frame again when window becomes active
+        self.window_active = window_active
+
+    def get_menu_input(self, screen_name=None):
+        """Get oldest key press not yet used by a menu (One per call: Remaining presses are used in the next frames)
+
+        Parameters:
+            screen_name (str): Screen using the input (Used for latency stats) (Default: None = Not measured)
+        Returns:
+            Input event (InputEvent) or None if no key was pressed
+        """
+        if not self.menu_inputs:
+            return None
+        input_event = self.menu_inputs.popleft()
+        if screen_name is not None:
+            self.handled_inputs.append((input_event.timestamp, screen_name))
+        return input_event
+
+    def clear_menu_inputs(self):
+        """Drop key presses not yet used (Used on screen changes: Presses meant for one screen are not used by the next)"""
+        self.menu_inputs.clear()
+
+    def frame_presented(self):
+        """Measure latency of inputs used this frame (Call right after the frame was pushed to the display)"""
+        if not self.handled_inputs:
+            return
+        present_time = time.perf_counter()
+        for timestamp, screen_name in self.handled_inputs:
+            latency = present_time - timestamp
+            stats = self.latency_stats.get(screen_name)
+            if stats is None:
+                stats = self.latency_stats[screen_name] = [0, 0.0, 0.0]
+            stats[0] += 1
+            stats[1] += latency
+            stats[2] = max(stats[2], latency)
+        self.handled_inputs.clear()
+
+    def format_latency_stats(self):
+        """Format input-to-photon latency per screen
+
+        Returns:
+            One line per screen (list)
+        """
+        return [f"Input latency ({screen_name}): {count} inputs | Average: {total / count * 1000:.1f} ms | Maximum: {maximum * 1000:.1f} ms"
+                for screen_name, (count, total, maximum) in self.latency_stats.items()]
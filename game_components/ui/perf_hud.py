@@ -0,0 +1,123 @@
+# game_components/ui/perf_hud.py
+
+"""
+Performance HUD Class
+
+This class draws an overlay with FPS, frame time, a rolling frame time graph and the average time of every frame
+phase (See 'FrameTimer'). It is toggled in game with F3 (See 'Game.update'), and is cheap enough to keep on
+during playtests:
+- The overlay is drawn on its own opaque panel surface, which is blitted with a single blit
+- Texts are rendered every PERF_HUD_TEXT_INTERVAL frames only, with a font from the text cache (Changing numbers
+  are rendered directly, so they do not push menu texts out of the text cache)
+- Only the graph is redrawn every frame
+
+Its own drawing time is shown as the "Overlay" phase.
+"""
+
+import pygame
+from config import FRAME_RATE, PERF_HUD_TEXT_INTERVAL
+from game_components.ui.text_cache import text_cache
+
+
+class PerfHUD():
+
+    # Layout (in pixels)
+    PANEL_WIDTH = 250
+    LINE_HEIGHT = 16
+    GRAPH_HEIGHT = 60
+    PADDING = 6
+    MARGIN = 6 # Distance to top right corner of screen
+
+    # Colors
+    BG_COLOR = (20, 20, 28)
+    TEXT_COLOR = (235, 235, 235)
+    GRAPH_COLOR = (120, 220, 120)
+    BUDGET_COLOR = (220, 90, 90) # Frame time budget line (1 / FRAME_RATE)
+
+    FONT_NAME = "Arial"
+    FONT_SIZE = 14
+
+    def __init__(self, frame_timer, screen_width):
+        """Initialize Performance HUD
+
+        Parameters:
+            frame_timer (FrameTimer):   Frame timer with timings to show
+            screen_width (int):         Screen width (HUD is placed in the top right corner)
+        """
+        self.frame_timer = frame_timer
+        self.font = text_cache.get_font(self.FONT_NAME, self.FONT_SIZE, system_font=True)
+        self.frames_until_text_update = 0 # Frames left until texts are rendered again
+
+        # Panel: Header line, graph, one line per phase and one for time outside of phases
+        text_line_count = 1 + len(frame_timer.PHASE_NAMES) + 1
+        panel_height = self.PADDING * 3 + self.GRAPH_HEIGHT + text_line_count * self.LINE_HEIGHT
+        self.panel = pygame.Surface((self.PANEL_WIDTH, panel_height)).convert()
+        self.panel_rect = self.panel.get_rect(topright=(screen_width - self.MARGIN, self.MARGIN))
+        self.graph_rect = pygame.Rect(self.PADDING, self.PADDING * 2 + self.LINE_HEIGHT, self.PANEL_WIDTH - self.PADDING * 2, self.GRAPH_HEIGHT)
+
+        # Graph scale: Twice the frame time budget fills the graph height
+        self.frame_budget = 1 / FRAME_RATE # Frame time budget (in seconds)
+        self.graph_scale = self.GRAPH_HEIGHT / (self.frame_budget * 2) # Pixels per second of frame time
+        self.graph_points = [] # Graph line points (Reused every frame)
+
+    def draw(self, screen):
+        """Draw HUD on screen (Texts are rendered every PERF_HUD_TEXT_INTERVAL frames)
+
+        Parameters:
+            screen (pygame.Surface): Surface to draw on
+        Returns:
+            Area drawn on (pygame.Rect)
+        """
+        if self.frames_until_text_update <= 0:
+            self.frames_until_text_update = PERF_HUD_TEXT_INTERVAL
+            self.render_texts()
+        self.frames_until_text_update -= 1
+
+        self.draw_graph()
+        screen.blit(self.panel, self.panel_rect)
+        return self.panel_rect
+
+    def render_texts(self):
+        """Clear panel and render header and phase texts (Averages over frames in the ring buffer)"""
+        self.panel.fill(self.BG_COLOR)
+
+        # Header: FPS and frame time
+        average_frame_time = self.frame_timer.get_average_frame_time()
+        fps = 1 / average_frame_time if average_frame_time > 0 else 0
+        header = f"FPS: {fps:.1f} | Frame: {average_frame_time * 1000:.2f} ms (Max: {self.frame_timer.get_max_frame_time() * 1000:.1f})"
+        self.panel.blit(self.font.render(header, True, self.TEXT_COLOR), (self.PADDING, self.PADDING))
+
+        # Phases (Average per frame)
+        y_pos = self.graph_rect.bottom + self.PADDING
+        phase_times = self.frame_timer.get_average_phase_times()
+        for phase_name, phase_time in zip(self.frame_timer.PHASE_NAMES, phase_times):
+            self.draw_phase_line(phase_name, phase_time, average_frame_time, y_pos)
+            y_pos += self.LINE_HEIGHT
+        self.draw_phase_line("Other", max(average_frame_time - sum(phase_times), 0.0), average_frame_time, y_pos) # Time outside of phases
+
+    def draw_phase_line(self, phase_name, phase_time, frame_time, y_pos):
+        """Render one phase line on the panel: Name, average time and share of frame time"""
+        share = phase_time / frame_time if frame_time > 0 else 0
+        self.panel.blit(self.font.render(phase_name, True, self.TEXT_COLOR), (self.PADDING, y_pos))
+        self.panel.blit(self.font.render(f"{phase_time * 1000:6.2f} ms {share:6.1%}", True, self.TEXT_COLOR), (self.PADDING + 90, y_pos))
+
+    def draw_graph(self):
+        """Draw frame time graph on the panel (Newest frame on the right, frames above twice the budget are clipped)"""
+        graph_rect = self.graph_rect
+        self.panel.fill(self.BG_COLOR, graph_rect)
+
+        # Frame time budget line
+        budget_y = graph_rect.bottom - round(self.frame_budget * self.graph_scale)
+        pygame.draw.line(self.panel, self.BUDGET_COLOR, (graph_rect.left, budget_y), (graph_rect.right - 1, budget_y))
+
+        # Frame times (One pixel per frame, right-aligned)
+        frame_times = self.frame_timer.get_frame_time_history()[-graph_rect.width:]
+        if len(frame_times) < 2:
+            return
+        points = self.graph_points
+        points.clear()
+        x_pos = graph_rect.right - len(frame_times)
+        for frame_time in frame_times:
+            points.append((x_pos, graph_rect.bottom - 1 - min(round(frame_time * self.graph_scale), self.GRAPH_HEIGHT - 1)))
+            x_pos += 1
+        pygame.draw.lines(self.panel, self.GRAPH_COLOR, False, points)
@@ -0,0 +1,131 @@
+# game_components/ui/text_cache.py
+
+"""
+Text Cache Class
+
+This class caches everything needed to draw text, so static texts are not rebuilt every frame.
+It consists of two parts:
+1) A font cache: Stores pygame Font objects keyed by (font path, font size, system font flag). Fonts are opened once
+2) A surface cache: A bounded LRU (Least Recently Used) cache of rendered text surfaces keyed by
+   (text, font size, color, font path, system font flag). When the cache is full, the least recently used surface is removed
+
+Hit, miss and eviction counters are kept for both caches (See 'get_stats').
+
+Note: Cached surfaces are shared between callers, so they must never be drawn on or modified
+"""
+
+import pygame
+from collections import OrderedDict
+from config import TEXT_CACHE_MAX_SURFACES
+
+
+class TextCache():
+
+    def __init__(self, max_surfaces=TEXT_CACHE_MAX_SURFACES):
+        """Initialize Text Cache
+
+        Parameters:
+            max_surfaces (int): Maximum number of rendered text surfaces to keep in cache
+        """
+        self.max_surfaces = max_surfaces # Store surface cache size limit
+
+        self.fonts = {} # Font cache: (font path, font size, system font flag) -> pygame.font.Font
+        self.surfaces = OrderedDict() # Surface cache: (text, font size, color, font path, system font flag) -> pygame.Surface
+
+        # Cache counters
+        self.font_hits = 0
+        self.font_misses = 0
+        self.surface_hits = 0
+        self.surface_misses = 0
+        self.surface_evictions = 0
+
+    def get_font(self, font_path, font_size, system_font=False):
+        """Get font from cache: Font is only created the first time it is requested
+
+        Parameters:
+            font_path (str):        Font file path, or font name if system_font is True
+            font_size (int):        Font size
+            system_font (bool):     Flag to determine if font is a system font (Created with SysFont)
+        Returns:
+            Font object (pygame.font.Font)
+        """
+        key = (font_path, font_size, system_font)
+        font = self.fonts.get(key)
+
+        # Font is cached
+        if font is not None:
+            self.font_hits += 1
+            return font
+
+        # Font is not cached: Create font and store it
+        self.font_misses += 1
+        if system_font == True:
+            font = pygame.font.SysFont(font_path, font_size)
+        else:
+            font = pygame.font.Font(font_path, font_size)
+        self.fonts[key] = font
+        return font
+
+    def render(self, text, font_size, color, font_path, system_font=False):
+        """Get rendered text surface from cache: Text is only rendered the first time it is requested
+
+        Parameters:
+            text (str):             Text to render
+            font_size (int):        Font size
+            color (str):            Text color (See: https://www.pygame.org/docs/ref/color_list.html)
+            font_path (str):        Font file path, or font name if system_font is True
+            system_font (bool):     Flag to determine if font is a system font (Created with SysFont)
+        Returns:
+            Rendered text surface (pygame.Surface) [Shared: Do not modify]
+        """
+        key = (text, font_size, color, font_path, system_font)
+        surface = self.surfaces.get(key)
+
+        # Surface is cached: Mark as most recently used
+        if surface is not None:
+            self.surface_hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        # Surface is not cached: Render text and store it
+        self.surface_misses += 1
+        font = self.get_font(font_path, font_size, system_font)
+        surface = font.render(text, True, pygame.color.Color(color))
+
+        # Convert surface for faster blitting (Only possible when a display surface exists)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+
+        self.surfaces[key] = surface
+
+        # Remove least recently used surface if cache is full
+        if len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)
+            self.surface_evictions += 1
+
+        return surface
+
+    def clear(self):
+        """Remove all cached fonts and surfaces (Counters are kept)"""
+        self.fonts.clear()
+        self.surfaces.clear()
+
+    def get_stats(self):
+        """Return cache counters
+
+        Returns:
+            A dictionary with cache sizes and hit/miss/eviction counters (dict)
+        """
+        return {
+            "fonts": len(self.fonts),
+            "font_hits": self.font_hits,
+            "font_misses": self.font_misses,
+            "surfaces": len(self.surfaces),
+            "surface_hits": self.surface_hits,
+            "surface_misses": self.surface_misses,
+            "surface_evictions": self.surface_evictions,
+        }
+
+
+# Shared text cache (Used by game screen and debug text)
+text_cache = TextCache()
@@ -0,0 +1,32 @@
+# game_components/ui/text_info.py
+
+"""
+Text Info Class
+
+This class is a small value type with the information of a drawn text: text string, font size, font,
+rendered surface and text rectangle. It is returned by 'GameScreen.draw_text' instead of a dictionary.
+
+It uses '__slots__', so it is small and cheap to create. Texts drawn every frame (e.g. HUD texts) keep one
+text info, which is updated in place when the text changes, so drawing them does not create any objects.
+"""
+
+
+class TextInfo():
+
+    __slots__ = ("text", "font_size", "text_font", "text_surface", "text_rect")
+
+    def __init__(self, text=None, font_size=0, text_font=None, text_surface=None, text_rect=None):
+        """Initialize Text Info
+
+        Parameters:
+            text (str):                     Text string (Default: None = Not rendered yet)
+            font_size (int):                Font size
+            text_font (pygame.font.Font):   Font used to render text
+            text_surface (pygame.Surface):  Rendered text
+            text_rect (pygame.Rect):        Text position and size
+        """
+        self.text = text
+        self.font_size = font_size
+        self.text_font = text_font
+        self.text_surface = text_surface
+        self.text_rect = text_rect
@@ -7,9 +7,6 @@ A small python game where you control an Android with the objective of collectin
 TO-DO:
 - BUG:
     - Fix apple spawn so they do not spawn inside each other
-    - Fix gold apple spawn check: Gold apple keeps spawning after game ends 
-      - Results in gold apple sometimes already being spawned after game restart
-      - Spawn timer aLso needs to reset after player collision
 - Add background music
     - Problems loading music files using 'pygame.mixer.music'... I've tried: .wav, .ogg, .mp3, but none worked
 - Improve readibility of highscore and countdown timer texts
@@ -18,11 +15,63 @@ TO-DO:
 
 
 # Import modules
+import argparse
+import time
+from config import TRACE_FOLDER_PATH, PROFILE_FOLDER_PATH, PROFILE_SAMPLE_RATE
 from game_components.core.game_logic import Game 
+from game_components.core.session_rng import SessionRNG
+from game_components.diagnostics import tracer, SamplingProfiler
+
+# Session seed argument (Unsigned 64-bit integer: Stored in recordings and snapshots)
+def seed_type(value):
+    try:
+        seed = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid seed: '{value}' (Must be an integer)")
+    if not 0 <= seed <= SessionRNG.MAX_SEED:
+        raise argparse.ArgumentTypeError(f"invalid seed: {seed} (Must be between 0 and {SessionRNG.MAX_SEED})")
+    return seed
+
+# Parse command line arguments
+def parse_args():
+    parser = argparse.ArgumentParser(description="AppleDroid: Collect as many apples as possible")
+    parser.add_argument("--seed", type=seed_type, default=None,
+                        help=f"Session seed (0 to {SessionRNG.MAX_SEED}): The same seed gives the same apple spawns and backgrounds (Default: Random)")
+    parser.add_argument("--scrub", metavar="SESSION_FILE", default=None, help="Open a recorded session in the session scrubber (Debug tool) instead of the game")
+    parser.add_argument("--game", type=int, default=0, help="Game of the recorded session to open with '--scrub' (Default: 0 = First game)")
+    parser.add_argument("--trace", metavar="TRACE_FILE", nargs="?", const="", default=None,
+                        help="Write a Chrome trace of the session when the game is closed (Default file: traces/trace_<date>_<time>.json)")
+    parser.add_argument("--profile", metavar="PROFILE_FILE", nargs="?", const="", default=None,
+                        help="Sample where the game spends its time, and write folded stacks per screen for flamegraph tools when the game is closed "
+                             "(Default file: profiles/profile_<date>_<time>.folded)")
+    parser.add_argument("--profile-rate", type=int, default=PROFILE_SAMPLE_RATE, help=f"Samples per second taken with '--profile' (Default: {PROFILE_SAMPLE_RATE})")
+    return parser.parse_args()
 
 # Main function
 def main():
-    game = Game() # Create game
+    args = parse_args()
+
+    # Session scrubber (Debug tool: Move back and forth through a recorded game)
+    if args.scrub is not None:
+        from game_components.replay import ScrubberView
+        ScrubberView(args.scrub, args.game).run()
+        return
+
+    # Trace session (Started before the game is created, so asset loading is traced)
+    if args.trace is not None:
+        trace_path = args.trace or f"{TRACE_FOLDER_PATH}trace_{time.strftime('%Y%m%d_%H%M%S')}.json"
+        tracer.start(trace_path)
+        print(f"Tracing to: {trace_path}")
+
+    game = Game(seed=args.seed) # Create game
+    print(f"Session seed: {game.session_rng.seed_value}") # Run again with '--seed' to reproduce this session
+
+    # Sampling profiler (Samples are labeled with the active screen)
+    if args.profile is not None:
+        profile_path = args.profile or f"{PROFILE_FOLDER_PATH}profile_{time.strftime('%Y%m%d_%H%M%S')}.folded"
+        profiler = SamplingProfiler(args.profile_rate, get_label=lambda: game.game_screen.active_game_screen)
+        profiler.start(profile_path)
+        print(f"Profiling to: {profile_path} ({args.profile_rate} samples per second)")
     
     while True: # Needed in order to run game constantly
         game.update() # Run game loop